@@ -0,0 +1,29 @@
+"""add session pool size columns to mcp_servers
+
+Revision ID: c4e8a1f2d9b7
+Revises: add_process_tracking_fields
+Create Date: 2025-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a1f2d9b7'
+down_revision: Union[str, None] = 'add_process_tracking_fields'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add per-server session pool min/max replica settings."""
+    op.add_column('mcp_servers', sa.Column('pool_min_size', sa.Integer(), nullable=False, server_default='1', comment='Minimum warm session replicas for this server'))
+    op.add_column('mcp_servers', sa.Column('pool_max_size', sa.Integer(), nullable=False, server_default='1', comment='Maximum session replicas for this server'))
+
+
+def downgrade() -> None:
+    """Remove session pool size columns."""
+    op.drop_column('mcp_servers', 'pool_max_size')
+    op.drop_column('mcp_servers', 'pool_min_size')
@@ -0,0 +1,29 @@
+"""add tool content hash columns
+
+Revision ID: d7b3f9e2a615
+Revises: c4e8a1f2d9b7
+Create Date: 2025-10-16 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7b3f9e2a615'
+down_revision: Union[str, None] = 'c4e8a1f2d9b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add per-tool and per-server tool list content hashes."""
+    op.add_column('mcp_servers', sa.Column('tools_hash', sa.String(length=64), nullable=True, comment='Content hash of the last synced tool list'))
+    op.add_column('mcp_tools', sa.Column('content_hash', sa.String(length=64), nullable=True, comment='Content hash of display name, description and input schema'))
+
+
+def downgrade() -> None:
+    """Remove tool content hash columns."""
+    op.drop_column('mcp_tools', 'content_hash')
+    op.drop_column('mcp_servers', 'tools_hash')
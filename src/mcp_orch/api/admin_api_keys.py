@@ -12,6 +12,7 @@ from ..database import get_db
 from ..models.api_key import ApiKey
 from ..models import Project, ProjectMember
 from ..models.user import User
+from ..services.cache_invalidation_service import CacheInvalidationService
 from .users import get_current_admin_user
 
 router = APIRouter(prefix="/api/admin/api-keys", tags=["admin-api-keys"])
@@ -282,6 +283,7 @@ async def update_api_key_admin(
         
         db.commit()
         db.refresh(api_key)
+        CacheInvalidationService.on_api_key_revoked(key_uuid)
         
         # Calculate usage statistics (placeholder for now)
         total_usage_count = 0  # TODO: Implement usage tracking
@@ -349,6 +351,7 @@ async def delete_api_key_admin(
         # Hard delete the API key
         db.delete(api_key)
         db.commit()
+        CacheInvalidationService.on_api_key_revoked(key_uuid)
         
         return {"message": f"API key '{key_name}' deleted successfully"}
         
@@ -14,6 +14,7 @@ from ..models.user import User
 from ..models.api_key import ApiKey
 from ..models.mcp_server import McpServer
 from ..models.team import Team, TeamMember
+from ..services.cache_invalidation_service import CacheInvalidationService
 from .users import get_current_admin_user
 
 router = APIRouter(prefix="/api/admin/projects", tags=["admin-projects"])
@@ -459,6 +460,9 @@ async def delete_project_admin(
         db.delete(project)
         db.commit()
         
+        # 삭제된 프로젝트의 API 키가 캐시로 계속 인증되지 않도록 즉시 제거
+        CacheInvalidationService.on_project_deleted(project_id)
+        
         return {"message": "Project deleted successfully"}
         
     except HTTPException:
@@ -7,7 +7,7 @@ FastAPI 앱 인스턴스를 생성하고 설정합니다.
 import logging
 import os
 from contextlib import asynccontextmanager
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -15,6 +15,7 @@ from fastapi.responses import JSONResponse
 
 from ..config import Settings
 from ..core.controller import DualModeController
+from ..utils.json_codec import FastJSONResponse
 from .jwt_auth import JWTAuthMiddleware
 from .middleware import SuppressNoResponseReturnedMiddleware
 from .users import router as users_router
@@ -124,6 +125,14 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to start MCP Session Manager: {e}")
     
+    # 툴 설정 캐시 예열 (선택적, MCP_TOOL_PREFERENCE_CACHE_WARM=true)
+    if os.getenv("MCP_TOOL_PREFERENCE_CACHE_WARM", "false").lower() == "true":
+        from ..services.tool_filtering_service import ToolFilteringService
+        try:
+            await ToolFilteringService.warm_cache()
+        except Exception as e:
+            logger.error(f"Failed to warm tool preference cache: {e}")
+    
     # 🚀 ProcessManager 초기화 (MCP 프로세스 자동 관리)
     from ..services.process_manager import initialize_process_manager
     try:
@@ -144,6 +153,10 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error stopping scheduler service: {e}")
     
+    # SSE keepalive 스케줄러 정지
+    from ..services.sse_keepalive import sse_keepalive_scheduler
+    await sse_keepalive_scheduler.stop()
+    
     # MCP 세션 매니저 정지
     from ..services.mcp_session_manager import shutdown_session_manager
     try:
@@ -182,6 +195,7 @@ def create_app(settings: Settings = None) -> FastAPI:
         description="하이브리드 MCP 프록시 및 병렬화 오케스트레이션 도구",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
         docs_url="/docs" if settings.server.mode == "proxy" else "/api/docs",
         redoc_url="/redoc" if settings.server.mode == "proxy" else "/api/redoc",
     )
@@ -499,7 +513,9 @@ def create_app(settings: Settings = None) -> FastAPI:
                     'args': db_server.args or [],
                     'env': db_server.env or {},
                     'timeout': 30,
-                    'is_enabled': db_server.is_enabled
+                    'is_enabled': db_server.is_enabled,
+                    'pool_min_size': db_server.pool_min_size,
+                    'pool_max_size': db_server.pool_max_size
                 }
                 
                 if not server_config.get('is_enabled', True):
@@ -521,7 +537,13 @@ def create_app(settings: Settings = None) -> FastAPI:
                     logger.info(f"Received project MCP message: {message} (session: {session_id})")
                     
                     # 실제 MCP 서버로 메시지 전달
-                    response_data = await forward_message_to_mcp_server(server_config, message)
+                    response_data = await forward_message_to_mcp_server(
+                        server_config, message, server_id=str(db_server.id)
+                    )
+                    
+                    # 알림은 응답이 없음
+                    if response_data is None and "id" not in message:
+                        return JSONResponse({"status": "accepted"}, status_code=202)
                     
                     if response_data:
                         logger.info(f"Received response from MCP server: {response_data}")
@@ -729,8 +751,34 @@ def get_settings(request: Request) -> Settings:
     return request.app.state.settings
 
 
-async def forward_message_to_mcp_server(server_config: Dict, message: Dict) -> Dict[str, Any]:
-    """실제 MCP 서버로 메시지 전달 및 응답 수신 (개선된 버전)"""
+async def forward_message_to_mcp_server(
+    server_config: Dict,
+    message: Dict,
+    server_id: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    실제 MCP 서버로 메시지 전달 및 응답 수신
+    
+    기본적으로 지속 MCP 세션(McpSessionManager)을 재사용합니다.
+    MCP_FORWARD_SPAWN_MODE=true이거나 server_id가 없으면 메시지마다
+    새 프로세스를 띄우는 기존 방식으로 동작합니다.
+    """
+    spawn_mode = os.getenv("MCP_FORWARD_SPAWN_MODE", "false").lower() == "true"
+    if server_id is None or spawn_mode:
+        return await _forward_message_via_spawn(server_config, message)
+    
+    try:
+        from ..services.mcp_session_manager import get_session_manager
+        
+        session_manager = await get_session_manager()
+        return await session_manager.forward_message(server_id, server_config, message)
+    except Exception as e:
+        logger.error(f"Error forwarding message to MCP session {server_id}: {e}")
+        return None
+
+
+async def _forward_message_via_spawn(server_config: Dict, message: Dict) -> Optional[Dict[str, Any]]:
+    """메시지마다 MCP 서버 프로세스를 새로 띄워 전달 (MCP_FORWARD_SPAWN_MODE 전용)"""
     try:
         import asyncio
         import json
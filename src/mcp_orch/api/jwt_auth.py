@@ -4,6 +4,7 @@ NextAuth.js에서 발급된 JWT 토큰을 검증하고 사용자 정보를 추
 """
 
 import os
+import re
 import logging
 from typing import Optional, Dict, Any
 from datetime import datetime, timezone, timedelta
@@ -19,6 +20,10 @@ from sqlalchemy.orm import Session
 from ..models.user import User
 from ..database import get_db
 from ..config import settings
+from ..services.api_key_auth_cache import api_key_auth_cache, CachedApiKeyPrincipal
+from ..services.rate_limiter import api_key_rate_limiter
+from ..services.jwt_verification_cache import jwt_verification_cache, VerifiedToken
+from ..utils.json_codec import json_codec
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +31,18 @@ logger = logging.getLogger(__name__)
 AUTH_SECRET = os.getenv("AUTH_SECRET", "your-secret-key-here-change-in-production")
 ALGORITHM = "HS256"
 
+# 구조화된 인증 디버그 로그 (헤더/인증 결과) - 기본 비활성화
+AUTH_DEBUG = os.getenv("MCP_AUTH_DEBUG", "false").lower() == "true"
+_SENSITIVE_HEADERS = {"authorization", "cookie", "x-api-key", "proxy-authorization"}
+_auth_disabled_warned = False
+
+# JSON-RPC 메시지를 받는 MCP POST 경로 (속도 제한 시 JSON-RPC 오류 본문으로 응답)
+_MCP_MESSAGE_PATH = re.compile(
+    r"^(/messages"
+    r"|/projects/[^/]+/servers/[^/]+/(transport/|standard/|bridge/)?(messages|mcp)"
+    r"|/projects/[^/]+/unified/(sse|mcp|messages))/?$"
+)
+
 security = HTTPBearer()
 
 class JWTUser:
@@ -39,6 +56,101 @@ class JWTUser:
         self.team_id = team_id
         self.team_name = team_name
 
+def _auth_debug(event: str, **fields: Any):
+    """MCP_AUTH_DEBUG=true 일 때만 구조화된 인증 디버그 로그 출력"""
+    if not AUTH_DEBUG:
+        return
+    details = " ".join(f"{key}={value}" for key, value in fields.items())
+    logger.info(f"🔍 [AUTH] {event} {details}", extra={"auth_event": event, "auth_fields": fields})
+
+
+def _redact_headers(headers) -> Dict[str, str]:
+    """디버그 로그용 헤더 - 인증 정보는 마스킹"""
+    return {
+        key: (f"{value[:12]}…" if key.lower() in _SENSITIVE_HEADERS else value)
+        for key, value in headers.items()
+    }
+
+
+async def _jsonrpc_request_id(request: Request) -> Any:
+    """요청 본문의 JSON-RPC id (읽을 수 없거나 배치 요청이면 None)"""
+    try:
+        message = json_codec.loads(await request.body())
+    except Exception:
+        return None
+    return message.get("id") if isinstance(message, dict) else None
+
+
+def _warn_auth_disabled():
+    """DISABLE_AUTH 경고는 프로세스당 한 번만 출력"""
+    global _auth_disabled_warned
+    if not _auth_disabled_warned:
+        logger.warning("⚠️  WARNING: Authentication is DISABLED (DISABLE_AUTH=true)")
+        _auth_disabled_warned = True
+
+
+def _decode_jwt_payload(token: str) -> Dict[str, Any]:
+    """
+    JWT 토큰을 디코딩/검증해서 클레임을 반환합니다. (NextAuth.js alg: "none" 지원)
+    
+    Raises:
+        jwt.ExpiredSignatureError, JWTError: 검증 실패 시
+    """
+    import base64
+    import json
+    
+    # 토큰 헤더 확인하여 알고리즘 결정
+    header_b64 = token.split('.')[0]
+    # Base64 패딩 추가
+    header_b64 += '=' * (4 - len(header_b64) % 4)
+    try:
+        header = json.loads(base64.b64decode(header_b64))
+    except (ValueError, TypeError) as e:
+        raise JWTError(f"Invalid header: {e}")
+    
+    algorithm = header.get('alg', 'HS256')
+    
+    if algorithm == 'none':
+        # NextAuth.js alg: "none" 토큰 처리 (개발 환경)
+        return jwt.decode(
+            token,
+            key="",  # 빈 키
+            algorithms=["none"],
+            options={
+                "verify_signature": False,  # 서명 검증 비활성화
+                "verify_exp": True,         # 만료 시간 검증 활성화
+                "verify_aud": False,        # audience 검증 비활성화
+                "verify_iss": False         # issuer 검증 비활성화
+            }
+        )
+    
+    # 일반 JWT 토큰 처리 (프로덕션 환경)
+    return jwt.decode(
+        token,
+        key=AUTH_SECRET,
+        algorithms=[algorithm],
+        options={
+            "verify_signature": True,   # 서명 검증 활성화
+            "verify_exp": True,         # 만료 시간 검증 활성화
+            "verify_aud": False,        # audience 검증 비활성화
+            "verify_iss": False         # issuer 검증 비활성화
+        }
+    )
+
+
+def _get_verified_token(token: str) -> VerifiedToken:
+    """
+    검증된 JWT 캐시 조회 - 미스일 때만 디코딩/서명 검증 후 exp까지 캐시
+    
+    Raises:
+        jwt.ExpiredSignatureError, JWTError: 검증 실패 시 (실패 결과는 캐시하지 않음)
+    """
+    verified = jwt_verification_cache.get(token)
+    if verified is None:
+        verified = jwt_verification_cache.store_claims(token, _decode_jwt_payload(token))
+    return verified
+
+
 def verify_jwt_token(token: str) -> Optional[JWTUser]:
     """
     JWT 토큰을 검증하고 사용자 정보를 반환합니다.
@@ -50,58 +162,15 @@ def verify_jwt_token(token: str) -> Optional[JWTUser]:
         JWTUser 객체 또는 None (검증 실패 시)
     """
     try:
-        logger.info(f"🔍 Verifying JWT token: {token[:50]}...")
-        
         # 토큰이 3개 부분으로 구성되어 있는지 확인
         parts = token.split('.')
         if len(parts) != 3:
             logger.warning(f"❌ Invalid JWT token format: expected 3 parts, got {len(parts)}")
             return None
         
-        # JWT 토큰 검증 (NextAuth.js alg: "none" 지원)
+        # JWT 토큰 검증 (동일 토큰은 exp까지 캐시된 클레임 재사용)
         try:
-            # 토큰 헤더 확인하여 알고리즘 결정
-            import base64
-            import json
-            
-            header_b64 = token.split('.')[0]
-            # Base64 패딩 추가
-            header_b64 += '=' * (4 - len(header_b64) % 4)
-            header = json.loads(base64.b64decode(header_b64))
-            
-            algorithm = header.get('alg', 'HS256')
-            logger.info(f"🔍 JWT algorithm detected: {algorithm}")
-            
-            if algorithm == 'none':
-                # NextAuth.js alg: "none" 토큰 처리 (개발 환경)
-                payload = jwt.decode(
-                    token,
-                    key="",  # 빈 키
-                    algorithms=["none"],
-                    options={
-                        "verify_signature": False,  # 서명 검증 비활성화
-                        "verify_exp": True,         # 만료 시간 검증 활성화
-                        "verify_aud": False,        # audience 검증 비활성화
-                        "verify_iss": False         # issuer 검증 비활성화
-                    }
-                )
-            else:
-                # 일반 JWT 토큰 처리 (프로덕션 환경)
-                jwt_secret = AUTH_SECRET
-                payload = jwt.decode(
-                    token,
-                    key=jwt_secret,
-                    algorithms=[algorithm],
-                    options={
-                        "verify_signature": True,   # 서명 검증 활성화
-                        "verify_exp": True,         # 만료 시간 검증 활성화
-                        "verify_aud": False,        # audience 검증 비활성화
-                        "verify_iss": False         # issuer 검증 비활성화
-                    }
-                )
-            
-            logger.info(f"✅ JWT payload decoded: {payload}")
-            
+            payload = _get_verified_token(token).claims
         except jwt.ExpiredSignatureError:
             logger.warning("❌ JWT token expired")
             return None
@@ -116,17 +185,14 @@ def verify_jwt_token(token: str) -> Optional[JWTUser]:
         name = payload.get("name")
         
         if not user_id or not email:
-            logger.warning(f"❌ JWT token missing required fields. user_id: {user_id}, email: {email}")
-            logger.warning(f"Full payload: {payload}")
+            logger.warning(f"❌ JWT token missing required fields (claims: {sorted(payload.keys())})")
             return None
         
         # 팀 정보 추출 (선택적)
         team_id = payload.get("teamId")
         team_name = payload.get("teamName")
         
-        logger.info(f"✅ JWT token verified for user: {email} (ID: {user_id})")
-        if team_id:
-            logger.info(f"✅ Team info: {team_name} (ID: {team_id})")
+        logger.debug(f"✅ JWT token verified for user ID: {user_id}")
         
         return JWTUser(
             user_id=user_id,
@@ -138,7 +204,6 @@ def verify_jwt_token(token: str) -> Optional[JWTUser]:
         
     except Exception as e:
         logger.error(f"❌ Unexpected error during JWT verification: {e}")
-        logger.error(f"Token: {token[:100]}...")
         return None
 
 def get_current_user(credentials: HTTPAuthorizationCredentials, db: Session = Depends(lambda: None)) -> 'User':
@@ -243,279 +308,112 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
         ]
     
     async def dispatch(self, request: Request, call_next):
-        # 디버깅을 위한 로그 추가
-        print(f"\n🔍 JWT Middleware - Processing request: {request.method} {request.url}")
+        _auth_debug("request", method=request.method, path=request.url.path)
         
         # 인증 비활성화 옵션 확인
         disable_auth = os.getenv("DISABLE_AUTH", "false").lower() == "true"
         if disable_auth:
-            print("⚠️  WARNING: Authentication is DISABLED (DISABLE_AUTH=true)")
+            _warn_auth_disabled()
             # 인증 없이 요청 통과
             request.state.user = None
             response = await call_next(request)
             return response
         
-        # 모든 헤더 출력
-        print(f"🔍 All request headers:")
-        for key, value in request.headers.items():
-            if key.lower() == 'authorization':
-                print(f"  {key}: {value[:50]}..." if len(value) > 50 else f"  {key}: {value}")
-            else:
-                print(f"  {key}: {value}")
+        if AUTH_DEBUG:
+            _auth_debug("headers", **_redact_headers(request.headers))
         
         # Authorization 헤더 확인
         auth_header = request.headers.get("authorization")
-        print(f"🔍 Authorization header present: {bool(auth_header)}")
         
         if auth_header and auth_header.startswith("Bearer "):
             token = auth_header.split(" ")[1]
-            print(f"🔍 Extracted token (first 20 chars): {token[:20]}...")
             
             # API 키 타입 확인 (접두사로 구분)
             if token.startswith("project_"):
-                print("🔑 Detected project API key - processing as project API key")
-                
-                # 데이터베이스에서 프로젝트 API 키 검증
-                db = next(get_db())
+                # 인증 캐시 확인 후 미스일 때만 데이터베이스에서 프로젝트 API 키 검증
+                user = _get_cached_api_key_user(token)
+                db = None if user else next(get_db())
                 try:
-                    user = await self._get_user_from_project_api_key(token, db)
-                    if user:
-                        print(f"✅ Project API key authentication successful: {user.email}")
-                        request.state.user = user
-                    else:
-                        print("❌ Project API key not found or inactive")
-                        request.state.user = None
+                    if db is not None:
+                        user = _load_api_key_user(token, db, "API key")
+                    request.state.user = user
+                    request.state.api_key = _get_api_key_principal(token) if user else None
+                    _auth_debug("project_api_key", authenticated=bool(user), cached=db is None)
                 finally:
-                    db.close()
+                    if db is not None:
+                        db.close()
                     
             elif token.startswith("mch_"):
-                print("🔑 Detected MCP API key - processing as MCP API key")
-                
-                # 데이터베이스에서 MCP API 키 검증
-                db = next(get_db())
+                # 인증 캐시 확인 후 미스일 때만 데이터베이스에서 MCP API 키 검증
+                user = _get_cached_api_key_user(token)
+                db = None if user else next(get_db())
                 try:
-                    user = await self._get_user_from_mcp_api_key(token, db)
-                    if user:
-                        print(f"✅ MCP API key authentication successful: {user.email}")
-                        request.state.user = user
-                    else:
-                        print("❌ MCP API key not found or inactive")
-                        request.state.user = None
+                    if db is not None:
+                        user = _load_api_key_user(token, db, "MCP API key")
+                    request.state.user = user
+                    request.state.api_key = _get_api_key_principal(token) if user else None
+                    _auth_debug("mcp_api_key", authenticated=bool(user), cached=db is None)
                 finally:
-                    db.close()
+                    if db is not None:
+                        db.close()
                     
             else:
-                print("🎫 Processing as JWT token")
-                # JWT 토큰 처리
+                # JWT 토큰 처리 - 검증 결과와 사용자 스냅샷은 캐시에서 재사용
                 try:
-                    # 토큰 헤더 확인하여 알고리즘 결정
-                    import base64
-                    import json
-                    
-                    header_b64 = token.split('.')[0]
-                    # Base64 패딩 추가
-                    header_b64 += '=' * (4 - len(header_b64) % 4)
-                    header = json.loads(base64.b64decode(header_b64))
-                    
-                    algorithm = header.get('alg', 'HS256')
-                    print(f"🔍 JWT algorithm detected: {algorithm}")
-                    
-                    if algorithm == 'none':
-                        # NextAuth.js alg: "none" 토큰 처리 (개발 환경)
-                        payload = jwt.decode(
-                            token,
-                            key="",  # 빈 키
-                            algorithms=["none"],
-                            options={
-                                "verify_signature": False,  # 서명 검증 비활성화
-                                "verify_exp": True,         # 만료 시간 검증 활성화
-                                "verify_aud": False,        # audience 검증 비활성화
-                                "verify_iss": False         # issuer 검증 비활성화
-                            }
-                        )
-                    else:
-                        # 일반 JWT 토큰 처리 (프로덕션 환경)
-                        jwt_secret = AUTH_SECRET
-                        payload = jwt.decode(
-                            token,
-                            key=jwt_secret,
-                            algorithms=[algorithm],
-                            options={
-                                "verify_signature": True,   # 서명 검증 활성화
-                                "verify_exp": True,         # 만료 시간 검증 활성화
-                                "verify_aud": False,        # audience 검증 비활성화
-                                "verify_iss": False         # issuer 검증 비활성화
-                            }
-                        )
-                    
-                    print(f"✅ JWT payload decoded successfully: {payload}")
-                    
-                    user_id = payload.get("sub")
+                    verified = _get_verified_token(token)
+                    user_id = verified.claims.get("sub")
                     if user_id:
-                        print(f"✅ User ID from JWT token: {user_id}")
+                        user = jwt_verification_cache.get_user(verified)
+                        cached = user is not None
+                        if user is None:
+                            # 데이터베이스에서 사용자 조회
+                            db = next(get_db())
+                            try:
+                                user = db.query(User).filter(User.id == user_id).first()
+                                if user:
+                                    jwt_verification_cache.store_user(verified, user)
+                            finally:
+                                db.close()
                         
-                        # 데이터베이스에서 사용자 조회
-                        db = next(get_db())
-                        try:
-                            user = db.query(User).filter(User.id == user_id).first()
-                            
-                            if user:
-                                print(f"✅ User found in database: {user.email}")
-                                request.state.user = user
-                            else:
-                                print(f"❌ User not found in database for ID: {user_id}")
-                                request.state.user = None
-                        finally:
-                            db.close()
+                        request.state.user = user
+                        _auth_debug("jwt", user_id=user_id, authenticated=bool(user), cached=cached)
                     else:
-                        print("❌ No user ID (sub) in JWT payload")
+                        _auth_debug("jwt", error="missing sub claim")
                         request.state.user = None
                         
                 except jwt.ExpiredSignatureError:
-                    print("❌ JWT token expired")
+                    _auth_debug("jwt", error="expired")
                     request.state.user = None
                 except JWTError as e:
-                    print(f"❌ Invalid JWT token: {e}")
+                    _auth_debug("jwt", error=str(e))
                     request.state.user = None
                 except Exception as e:
-                    print(f"❌ Unexpected error processing JWT: {e}")
+                    logger.error(f"❌ Unexpected error processing JWT: {e}")
                     request.state.user = None
         else:
-            print("❌ No valid Authorization header found")
             request.state.user = None
         
-        print(f"🔍 Final request.state.user: {getattr(request.state, 'user', 'Not set')}")
+        # API 키 요청은 키별 분/일 한도 적용 (MCP 메시지 라우트에서 중복 소비하지 않도록 표시)
+        rate_limit = None
+        if getattr(request.state, "api_key", None) is not None:
+            rate_limit = await api_key_rate_limiter.check_request(request)
+            if rate_limit and not rate_limit.allowed:
+                _auth_debug("rate_limited", api_key_id=request.state.api_key.api_key_id, scope=rate_limit.scope)
+                if request.method == "POST" and _MCP_MESSAGE_PATH.match(request.url.path):
+                    return rate_limit.to_response(await _jsonrpc_request_id(request), jsonrpc=True)
+                return rate_limit.to_response()
         
         response = await call_next(request)
-        print(f"🔍 Response status: {response.status_code}")
+        if rate_limit:
+            response.headers.update(rate_limit.headers())
+        _auth_debug(
+            "response",
+            path=request.url.path,
+            status=response.status_code,
+            user_id=getattr(request.state.user, "id", None)
+        )
         return response
 
-    async def _get_user_from_project_api_key(self, api_key: str, db: Session) -> Optional[User]:
-        """
-        프로젝트 API 키를 검증하고 해당 프로젝트의 소유자를 반환합니다.
-        
-        Args:
-            api_key: 프로젝트 API 키
-            db: 데이터베이스 세션
-            
-        Returns:
-            User 객체 또는 None
-        """
-        try:
-            from ..models.api_key import ApiKey
-            from ..models.project import Project
-            import hashlib
-            
-            # API 키 해시 생성
-            key_hash = hashlib.sha256(api_key.encode()).hexdigest()
-            
-            print(f"🔍 Looking for API key with hash: {key_hash[:20]}...")
-            
-            # 데이터베이스에서 API 키 조회 (해시로 먼저 검색)
-            api_key_record = db.query(ApiKey).filter(
-                ApiKey.key_hash == key_hash,
-                ApiKey.is_active == True
-            ).first()
-            
-            # 해시로 찾지 못하면 평문으로 검색 (기존 데이터 호환성)
-            if not api_key_record:
-                print("🔍 Hash search failed, trying plaintext for backward compatibility...")
-                api_key_record = db.query(ApiKey).filter(
-                    ApiKey.key_hash == api_key,
-                    ApiKey.is_active == True
-                ).first()
-            
-            if not api_key_record:
-                print("❌ API key not found or inactive")
-                return None
-            
-            print(f"✅ Found API key: {api_key_record.name}")
-            
-            # API 키 사용 시간 업데이트
-            from datetime import datetime
-            api_key_record.last_used_at = datetime.utcnow()
-            db.commit()
-            
-            # 프로젝트 조회
-            project = db.query(Project).filter(Project.id == api_key_record.project_id).first()
-            if not project:
-                print("❌ Project not found for API key")
-                return None
-            
-            print(f"✅ Found project: {project.name}")
-            
-            # 프로젝트 생성자 조회 (API 키로 인증된 사용자로 간주)
-            user = db.query(User).filter(User.id == api_key_record.created_by_id).first()
-            if not user:
-                print("❌ User not found for API key")
-                return None
-            
-            print(f"✅ Authenticated user via API key: {user.email}")
-            return user
-            
-        except Exception as e:
-            print(f"❌ Error processing project API key: {e}")
-            return None
-
-    async def _get_user_from_mcp_api_key(self, api_key: str, db: Session) -> Optional[User]:
-        """
-        MCP API 키를 검증하고 해당 사용자를 반환합니다.
-        
-        Args:
-            api_key: MCP API 키 (mch_ 접두사로 시작)
-            db: 데이터베이스 세션
-            
-        Returns:
-            User 객체 또는 None
-        """
-        try:
-            from ..models.api_key import ApiKey
-            from ..models.project import Project
-            import hashlib
-            
-            # API 키 해시 생성 (프로젝트 API 키와 동일한 방식)
-            key_hash = hashlib.sha256(api_key.encode()).hexdigest()
-            
-            print(f"🔍 Looking for MCP API key with hash: {key_hash[:20]}...")
-            
-            # 데이터베이스에서 API 키 조회
-            api_key_record = db.query(ApiKey).filter(
-                ApiKey.key_hash == key_hash,
-                ApiKey.is_active == True
-            ).first()
-            
-            if not api_key_record:
-                print("❌ MCP API key not found or inactive")
-                return None
-            
-            print(f"✅ Found MCP API key: {api_key_record.name}")
-            
-            # API 키 사용 시간 업데이트
-            from datetime import datetime
-            api_key_record.last_used_at = datetime.utcnow()
-            db.commit()
-            
-            # 프로젝트 조회 (MCP API 키도 프로젝트에 연결됨)
-            project = db.query(Project).filter(Project.id == api_key_record.project_id).first()
-            if not project:
-                print("❌ Project not found for MCP API key")
-                return None
-            
-            print(f"✅ Found project for MCP key: {project.name}")
-            
-            # 프로젝트 생성자 조회 (API 키로 인증된 사용자로 간주)
-            user = db.query(User).filter(User.id == api_key_record.created_by_id).first()
-            if not user:
-                print("❌ User not found for MCP API key")
-                return None
-            
-            print(f"✅ Authenticated user via MCP API key: {user.email}")
-            return user
-            
-        except Exception as e:
-            print(f"❌ Error processing MCP API key: {e}")
-            return None
-
 def get_current_user_from_request(request: Request) -> Optional[JWTUser]:
     """
     Request 객체에서 현재 사용자 정보를 가져옵니다.
@@ -531,17 +429,8 @@ def get_current_user_from_request(request: Request) -> Optional[JWTUser]:
 
 async def get_current_user(request: Request) -> Optional[User]:
     """Get current user from request state"""
-    print(f"🔍 get_current_user called")
-    print(f"🔍 Request state attributes: {dir(request.state)}")
-    
     user = getattr(request.state, 'user', None)
-    print(f"🔍 User from request.state: {user}")
-    
-    if user:
-        print(f"✅ Returning user: {user.id} ({user.email})")
-    else:
-        print("❌ No user found in request state")
-    
+    _auth_debug("get_current_user", user_id=getattr(user, "id", None))
     return user
 
 async def get_user_from_jwt_token(request: Request, db: Session) -> Optional[User]:
@@ -564,20 +453,20 @@ async def get_user_from_jwt_token(request: Request, db: Session) -> Optional[Use
             return None
         
         token = auth_header.split(" ")[1]
-        logger.info(f"🔍 Processing token: {token[:20]}...")
+        logger.debug("🔍 Processing bearer token")
         
         # 프로젝트 API 키인지 확인 (project_ 접두사로 시작)
         if token.startswith("project_"):
-            logger.info("🔍 Detected project API key")
+            logger.debug("🔍 Detected project API key")
             return await _get_user_from_project_api_key(token, db)
         
         # MCP API 키인지 확인 (mch_ 접두사로 시작)
         if token.startswith("mch_"):
-            logger.info("🔍 Detected MCP API key")
+            logger.debug("🔍 Detected MCP API key")
             return await _get_user_from_mcp_api_key(token, db)
         
         # JWT 토큰 처리
-        logger.info("🔍 Processing as JWT token")
+        logger.debug("🔍 Processing as JWT token")
         jwt_user = verify_jwt_token(token)
         if not jwt_user:
             logger.warning("JWT token verification failed")
@@ -622,61 +511,10 @@ async def _get_user_from_project_api_key(api_key: str, db: Session) -> Optional[
     Returns:
         User 객체 또는 None
     """
-    try:
-        from ..models.api_key import ApiKey
-        from ..models.project import Project
-        import hashlib
-        
-        # API 키 해시 생성
-        key_hash = hashlib.sha256(api_key.encode()).hexdigest()
-        
-        logger.info(f"🔍 Looking for API key with hash: {key_hash[:20]}...")
-        
-        # 데이터베이스에서 API 키 조회 (해시로 먼저 검색)
-        api_key_record = db.query(ApiKey).filter(
-            ApiKey.key_hash == key_hash,
-            ApiKey.is_active == True
-        ).first()
-        
-        # 해시로 찾지 못하면 평문으로 검색 (기존 데이터 호환성)
-        if not api_key_record:
-            logger.info("🔍 Hash search failed, trying plaintext for backward compatibility...")
-            api_key_record = db.query(ApiKey).filter(
-                ApiKey.key_hash == api_key,
-                ApiKey.is_active == True
-            ).first()
-        
-        if not api_key_record:
-            logger.warning("❌ API key not found or inactive")
-            return None
-        
-        logger.info(f"✅ Found API key: {api_key_record.name}")
-        
-        # API 키 사용 시간 업데이트
-        from datetime import datetime
-        api_key_record.last_used_at = datetime.utcnow()
-        db.commit()
-        
-        # 프로젝트 조회
-        project = db.query(Project).filter(Project.id == api_key_record.project_id).first()
-        if not project:
-            logger.warning("❌ Project not found for API key")
-            return None
-        
-        logger.info(f"✅ Found project: {project.name}")
-        
-        # 프로젝트 생성자 조회 (API 키로 인증된 사용자로 간주)
-        user = db.query(User).filter(User.id == api_key_record.created_by_id).first()
-        if not user:
-            logger.warning("❌ User not found for API key")
-            return None
-        
-        logger.info(f"✅ Authenticated user via API key: {user.email}")
-        return user
-        
-    except Exception as e:
-        logger.error(f"❌ Error processing project API key: {e}")
-        return None
+    cached_user = _get_cached_api_key_user(api_key, db)
+    if cached_user:
+        return cached_user
+    return _load_api_key_user(api_key, db, "API key")
 
 
 async def _get_user_from_mcp_api_key(api_key: str, db: Session) -> Optional[User]:
@@ -687,18 +525,57 @@ async def _get_user_from_mcp_api_key(api_key: str, db: Session) -> Optional[User
         api_key: MCP API 키 (mch_ 접두사로 시작)
         db: 데이터베이스 세션
         
+    Returns:
+        User 객체 또는 None
+    """
+    cached_user = _get_cached_api_key_user(api_key, db)
+    if cached_user:
+        return cached_user
+    return _load_api_key_user(api_key, db, "MCP API key")
+
+
+def _get_cached_api_key_user(api_key: str, db: Optional[Session] = None) -> Optional[User]:
+    """
+    API 키 인증 캐시 조회 - 히트 시 DB 조회 없이 사용자 반환
+    
+    db가 주어지면 사용자 객체를 해당 세션에 연결해서 관계 lazy load가 가능하게 합니다.
+    """
+    entry = api_key_auth_cache.get(api_key_auth_cache.hash_key(api_key))
+    if entry is None:
+        return None
+
+    user = entry.build_user()
+    if db is not None:
+        user = db.merge(user, load=False)
+    logger.debug(f"✅ API key auth cache hit: key={entry.api_key_id}, user={user.email}")
+    return user
+
+
+def _get_api_key_principal(api_key: str) -> Optional[CachedApiKeyPrincipal]:
+    """인증된 API 키의 캐시 항목 (키 ID, 프로젝트, 속도 제한) 조회"""
+    return api_key_auth_cache.peek(api_key_auth_cache.hash_key(api_key))
+
+
+def _load_api_key_user(api_key: str, db: Session, key_label: str) -> Optional[User]:
+    """
+    DB에서 API 키를 검증하고 키 생성자를 반환 - 성공 시 인증 캐시에 저장
+    
+    Args:
+        api_key: API 키 평문
+        db: 데이터베이스 세션
+        key_label: 로그용 키 종류 이름
+        
     Returns:
         User 객체 또는 None
     """
     try:
         from ..models.api_key import ApiKey
         from ..models.project import Project
-        import hashlib
         
-        # API 키 해시 생성 (프로젝트 API 키와 동일한 방식)
-        key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+        # API 키 해시 생성
+        key_hash = api_key_auth_cache.hash_key(api_key)
         
-        logger.info(f"🔍 Looking for MCP API key with hash: {key_hash[:20]}...")
+        logger.debug(f"🔍 Looking for {key_label} with hash: {key_hash[:20]}...")
         
         # 데이터베이스에서 API 키 조회 (해시로 먼저 검색)
         api_key_record = db.query(ApiKey).filter(
@@ -708,42 +585,43 @@ async def _get_user_from_mcp_api_key(api_key: str, db: Session) -> Optional[User
         
         # 해시로 찾지 못하면 평문으로 검색 (기존 데이터 호환성)
         if not api_key_record:
-            logger.info("🔍 Hash search failed, trying plaintext for backward compatibility...")
+            logger.debug("🔍 Hash search failed, trying plaintext for backward compatibility...")
             api_key_record = db.query(ApiKey).filter(
                 ApiKey.key_hash == api_key,
                 ApiKey.is_active == True
             ).first()
         
         if not api_key_record:
-            logger.warning("❌ MCP API key not found or inactive")
+            logger.warning(f"❌ {key_label} not found or inactive")
             return None
         
-        logger.info(f"✅ Found MCP API key: {api_key_record.name}")
+        logger.debug(f"✅ Found {key_label}: {api_key_record.name}")
         
-        # API 키 사용 시간 업데이트
+        # API 키 사용 시간 업데이트 (캐시 미스 시에만 - 캐시 TTL 단위로 갱신됨)
         from datetime import datetime
         api_key_record.last_used_at = datetime.utcnow()
         db.commit()
         
-        # 프로젝트 조회 (MCP API 키도 프로젝트에 연결됨)
+        # 프로젝트 조회
         project = db.query(Project).filter(Project.id == api_key_record.project_id).first()
         if not project:
-            logger.warning("❌ Project not found for MCP API key")
+            logger.warning(f"❌ Project not found for {key_label}")
             return None
         
-        logger.info(f"✅ Found project for MCP key: {project.name}")
+        logger.debug(f"✅ Found project: {project.name}")
         
         # 프로젝트 생성자 조회 (API 키로 인증된 사용자로 간주)
         user = db.query(User).filter(User.id == api_key_record.created_by_id).first()
         if not user:
-            logger.warning("❌ User not found for MCP API key")
+            logger.warning(f"❌ User not found for {key_label}")
             return None
         
-        logger.info(f"✅ Authenticated user via MCP API key: {user.email}")
+        api_key_auth_cache.put(key_hash, api_key_record, user)
+        logger.info(f"✅ Authenticated user via {key_label}: {user.email}")
         return user
         
     except Exception as e:
-        logger.error(f"❌ Error processing MCP API key: {e}")
+        logger.error(f"❌ Error processing {key_label}: {e}")
         return None
 
 
@@ -10,10 +10,10 @@ from uuid import UUID
 
 from fastapi import Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
 
-from ....database import get_db
-from ....models import Project, User
+from ....database import get_db, release_connection
+from ....models import User
+from ....services.server_repository import ServerRepository
 from ...jwt_auth import get_user_from_jwt_token
 
 
@@ -49,7 +49,7 @@ async def get_current_user_for_unified_mcp(
         )
     
     # 프로젝트 존재 여부 확인
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await ServerRepository.get_project(project_id)
     if not project:
         logger.warning(f"🚫 Unified MCP: 프로젝트 {project_id} 없음")
         raise HTTPException(
@@ -68,5 +68,9 @@ async def get_current_user_for_unified_mcp(
     # 프로젝트 멤버 여부 확인 (추가 권한 검사 필요시 여기에 추가)
     # 현재는 JWT 인증만으로 충분하다고 가정
     
+    # 통합 MCP 라우트는 인증 이후 sync 세션을 쓰지 않으므로
+    # SSE 스트림이 끝날 때까지 커넥션을 붙잡지 않도록 바로 반환
+    release_connection(db)
+    
     logger.info(f"✅ Unified MCP: 사용자 {user.email} 인증 성공 (프로젝트: {project_id})")
     return user
\ No newline at end of file
@@ -3,20 +3,20 @@ Fast Claude Code Compatible Routes
 간단하고 빠른 Claude Code 호환 라우트
 """
 
-import asyncio
 import json
 import logging
+import uuid
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Request, Depends, Query
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
 
-from ....database import get_db
-from ....models import McpServer
+from ....services.connection_registry import connection_registry
+from ....services.server_repository import ServerRepository
+from ....services.sse_frame_writer import SSEFrameWriter, DATA_KEEPALIVE_FRAME
+from ....services.sse_outbound_queue import OutboundQueue
 from .auth import get_current_user_for_unified_mcp
 
 logger = logging.getLogger(__name__)
@@ -29,8 +29,7 @@ async def fast_streamable_http_endpoint(
     request: Request,
     project_id: UUID,
     sessionId: Optional[str] = Query(None, description="Session ID for Streamable HTTP connection"),
-    current_user = Depends(get_current_user_for_unified_mcp),
-    db: Session = Depends(get_db)
+    current_user = Depends(get_current_user_for_unified_mcp)
 ):
     """
     ⚡ 초고속 Claude Code 호환 Streamable HTTP endpoint
@@ -42,17 +41,17 @@ async def fast_streamable_http_endpoint(
     """
     try:
         # 프로젝트의 활성 서버들 조회 (최소한의 쿼리)
-        project_servers = db.query(McpServer).filter(
-            and_(
-                McpServer.project_id == project_id,
-                McpServer.is_enabled == True
-            )
-        ).all()
+        project_servers = await ServerRepository.list_enabled_servers(project_id)
         
         logger.info(f"⚡ Fast unified MCP GET: project={project_id}, servers={len(project_servers)}")
         
         # 즉시 SSE 스트림 시작 (절대 블로킹 없음)
+        stream_id = str(uuid.uuid4())
+        
         async def ultra_fast_sse():
+            # 서버 알림 수신 및 프로젝트별 연결 집계를 위해 등록
+            queue = OutboundQueue(stream_id)
+            connection_registry.register(stream_id, project_id, "fast_streamable", queue.put)
             try:
                 # 즉시 준비 완료 신호 (Claude Code가 기다리는 것)
                 yield f"data: {json.dumps({'type': 'connection', 'status': 'ready', 'timestamp': datetime.utcnow().isoformat()})}\n\n"
@@ -69,16 +68,16 @@ async def fast_streamable_http_endpoint(
                 # Claude Code에게 "이제 POST 요청을 보내세요" 신호
                 yield f"data: {json.dumps({'type': 'ready', 'message': 'Ready for POST requests'})}\n\n"
                 
-                # 표준 keepalive (30초마다)
-                count = 0
-                while True:
-                    await asyncio.sleep(30)
-                    count += 1
-                    yield f"data: {json.dumps({'type': 'keepalive', 'count': count})}\n\n"
+                # 알림 전달 및 keepalive (유휴 시 공용 스케줄러가 전송)
+                async for chunk in SSEFrameWriter(queue, stream_id, DATA_KEEPALIVE_FRAME).frames():
+                    yield chunk
                     
             except Exception as e:
                 logger.error(f"❌ Ultra fast SSE error: {e}")
                 yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            finally:
+                connection_registry.unregister(stream_id)
+                queue.close()
         
         return StreamingResponse(
             ultra_fast_sse(),
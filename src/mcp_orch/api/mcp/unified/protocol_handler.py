@@ -5,7 +5,9 @@ Handles MCP protocol messages including initialization, tool listing,
 and tool execution across multiple servers.
 """
 
+import asyncio
 import logging
+import os
 from typing import Dict, Any, List, Optional
 from uuid import UUID
 
@@ -13,12 +15,17 @@ from fastapi.responses import JSONResponse
 
 from ....services.mcp_connection_service import mcp_connection_service
 from ....services.tool_filtering_service import ToolFilteringService
+from ....services.tool_catalog_cache import tool_catalog_cache
 from ....utils.namespace import create_namespaced_name
+from ....utils.json_codec import FastJSONResponse
 from .health_monitor import ServerHealthInfo, classify_error
 
 
 logger = logging.getLogger(__name__)
 
+# tools/list 응답을 기다리는 서버별 최대 시간 (초과한 서버는 나중에 list_changed로 알림)
+TOOLS_LIST_SERVER_DEADLINE_SECONDS = float(os.getenv("MCP_UNIFIED_TOOLS_LIST_DEADLINE_SECONDS", "5.0"))
+
 
 class UnifiedProtocolHandler:
     """Handles MCP protocol operations for unified transport"""
@@ -31,6 +38,7 @@ class UnifiedProtocolHandler:
             transport: UnifiedMCPTransport instance
         """
         self.transport = transport
+        self._late_tools_tasks: set = set()  # strong refs to background list_changed waiters
         
     async def handle_initialize(self, message: Dict[str, Any]) -> JSONResponse:
         """
@@ -55,7 +63,7 @@ class UnifiedProtocolHandler:
                 "capabilities": {
                     "experimental": {},
                     "tools": {
-                        "listChanged": False
+                        "listChanged": True
                     } if active_servers else {},
                     "logging": {},
                     "prompts": {},
@@ -76,11 +84,16 @@ class UnifiedProtocolHandler:
         logger.info(f"✅ Unified initialize response queued: session={self.transport.session_id}")
         
         # Return HTTP 202 Accepted (actual response sent via SSE)
-        return JSONResponse(content={"status": "processing"}, status_code=202)
+        return FastJSONResponse(content={"status": "processing"}, status_code=202)
     
     async def handle_tools_list(self, message: Dict[str, Any]) -> JSONResponse:
         """
         List tools from all active servers with namespacing and filtering
+        
+        Servers are queried concurrently. Servers that miss the per-server
+        deadline are left out of this response and announced later through
+        notifications/tools/list_changed once their tools are available.
+        Complete results are cached per project as a pre-serialized catalog.
         """
         all_tools = []
         failed_servers = []
@@ -89,72 +102,59 @@ class UnifiedProtocolHandler:
         request_id = message.get("id")
         legacy_mode = getattr(self.transport, '_legacy_mode', True)
         
+        # Serve the cached project catalog when the server set is unchanged
+        project_id = self.transport.project_id
+        catalog_variant = "sse-legacy" if legacy_mode else "sse"
+        servers_signature = tool_catalog_cache.servers_signature(active_servers)
+        catalog = tool_catalog_cache.get(project_id, catalog_variant, servers_signature)
+        if catalog:
+            logger.info(f"📦 Serving cached tool catalog {catalog.version} ({catalog.tool_count} tools) for session {self.transport.session_id}")
+            await self.transport.message_queue.put(catalog.render(request_id))
+            return FastJSONResponse(content={"status": "processing"}, status_code=202)
+        catalog_generation = tool_catalog_cache.generation(project_id)
+        
         logger.info(f"📋 Listing unified tools from {len(active_servers)} servers (legacy_mode: {legacy_mode})")
         
-        # Collect tools from each server
-        for server in active_servers:
-            try:
-                # Check server health
-                if not self.transport._is_server_available(server.name):
-                    logger.debug(f"Skipping unavailable server: {server.name}")
-                    failed_servers.append(server.name)
-                    continue
-                
-                # Build server config
-                server_config = self.transport._build_server_config_for_server(server)
-                if not server_config:
-                    error_msg = f"Failed to build config for server: {server.name}"
-                    logger.warning(error_msg)
-                    self.transport._record_server_failure(server.name, Exception(error_msg))
-                    failed_servers.append(server.name)
-                    continue
-                
-                # Get tools from server
-                tools = await mcp_connection_service.get_server_tools(
-                    str(server.id), server_config
-                )
-                
-                if tools is None:
-                    error_msg = f"No tools returned from server: {server.name}"
-                    logger.warning(error_msg)
-                    self.transport._record_server_failure(server.name, Exception(error_msg))
-                    failed_servers.append(server.name)
-                    continue
-                
-                # Apply tool filtering
-                filtered_tools = await ToolFilteringService.filter_tools_by_preferences(
-                    project_id=self.transport.project_id,
-                    server_id=server.id,
-                    tools=tools,
-                    db=None
-                )
-                
-                logger.info(f"🎯 Applied tool filtering for {server.name}: {len(filtered_tools)}/{len(tools)} tools enabled")
-                
-                # Process tools with namespacing
-                for tool in filtered_tools:
-                    try:
-                        namespaced_tool = self._create_namespaced_tool(tool, server)
-                        all_tools.append(namespaced_tool)
-                    except Exception as tool_error:
-                        logger.error(f"Error processing tool {tool.get('name', 'unknown')}: {tool_error}")
-                
-                # Record success
-                self.transport._record_server_success(server.name, len(filtered_tools))
-                
-            except Exception as e:
-                logger.error(f"❌ Failed to get tools from server {server.name}: {e}")
+        # Collect tools from all servers concurrently
+        tasks = {
+            asyncio.create_task(self._collect_server_tools(server)): server
+            for server in active_servers
+        }
+        done, pending = set(), set()
+        if tasks:
+            done, pending = await asyncio.wait(tasks.keys(), timeout=TOOLS_LIST_SERVER_DEADLINE_SECONDS)
+        
+        # Keep project server order stable in the response
+        for task, server in tasks.items():
+            if task not in done:
+                continue
+            server_tools = task.result()
+            if server_tools is None:
                 failed_servers.append(server.name)
-                self.transport._record_server_failure(server.name, e)
+            else:
+                all_tools.extend(server_tools)
+        
+        late_servers = [tasks[task].name for task in pending]
+        if pending:
+            logger.info(f"⏳ {len(pending)} servers missed the {TOOLS_LIST_SERVER_DEADLINE_SECONDS}s tools/list deadline: {late_servers}")
+            self._announce_late_tools(pending)
         
         # Note: Orchestrator meta-tools removed per user request
         # Only show actual MCP server tools
         
         # Log summary
-        logger.info(f"✅ Unified tools collected: {len(all_tools)} tools from {len(active_servers)} servers")
+        logger.info(f"✅ Unified tools collected: {len(all_tools)} tools from {len(done)}/{len(active_servers)} servers")
         if failed_servers:
             logger.warning(f"⚠️ Failed servers: {failed_servers}")
         
+        # Only complete results become the project catalog
+        if not failed_servers and not pending:
+            catalog = tool_catalog_cache.store(
+                project_id, catalog_variant, servers_signature, all_tools, catalog_generation
+            )
+            await self.transport.message_queue.put(catalog.render(request_id))
+            return FastJSONResponse(content={"status": "processing"}, status_code=202)
+        
         # Prepare response
         response_data = {
             "jsonrpc": "2.0",
@@ -167,7 +167,91 @@ class UnifiedProtocolHandler:
         # Queue response
         await self.transport.message_queue.put(response_data)
         
-        return JSONResponse(content={"status": "processing"}, status_code=202)
+        return FastJSONResponse(content={"status": "processing"}, status_code=202)
+    
+    async def _collect_server_tools(self, server) -> Optional[List[Dict[str, Any]]]:
+        """
+        Collect filtered, namespaced tools from a single server
+        
+        Returns:
+            List of namespaced tools, or None if the server failed
+        """
+        try:
+            # Check server health
+            if not self.transport._is_server_available(server.name):
+                logger.debug(f"Skipping unavailable server: {server.name}")
+                return None
+            
+            # Build server config
+            server_config = self.transport._build_server_config_for_server(server)
+            if not server_config:
+                error_msg = f"Failed to build config for server: {server.name}"
+                logger.warning(error_msg)
+                self.transport._record_server_failure(server.name, Exception(error_msg))
+                return None
+            
+            # Get tools from server
+            tools = await mcp_connection_service.get_server_tools(
+                str(server.id), server_config, raise_on_error=True
+            )
+            
+            if tools is None:
+                error_msg = f"No tools returned from server: {server.name}"
+                logger.warning(error_msg)
+                self.transport._record_server_failure(server.name, Exception(error_msg))
+                return None
+            
+            # Apply tool filtering
+            filtered_tools = await ToolFilteringService.filter_tools_by_preferences(
+                project_id=self.transport.project_id,
+                server_id=server.id,
+                tools=tools,
+                db=None
+            )
+            
+            logger.info(f"🎯 Applied tool filtering for {server.name}: {len(filtered_tools)}/{len(tools)} tools enabled")
+            
+            # Process tools with namespacing
+            namespaced_tools = []
+            for tool in filtered_tools:
+                try:
+                    namespaced_tools.append(self._create_namespaced_tool(tool, server))
+                except Exception as tool_error:
+                    logger.error(f"Error processing tool {tool.get('name', 'unknown')}: {tool_error}")
+            
+            # Record success
+            self.transport._record_server_success(server.name, len(filtered_tools))
+            return namespaced_tools
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to get tools from server {server.name}: {e}")
+            self.transport._record_server_failure(server.name, e)
+            return None
+    
+    def _announce_late_tools(self, pending: set):
+        """Send notifications/tools/list_changed as late servers finish"""
+        waiter = asyncio.create_task(self._wait_for_late_tools(pending))
+        self._late_tools_tasks.add(waiter)
+        waiter.add_done_callback(self._late_tools_tasks.discard)
+    
+    async def _wait_for_late_tools(self, pending: set):
+        """Wait for late servers and notify the client once per batch of completions"""
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if not any(task.result() for task in done if not task.cancelled()):
+                    continue
+                if not self.transport.is_connected:
+                    logger.debug(f"Session {self.transport.session_id} closed before late tools arrived")
+                    return
+                
+                await self.transport.message_queue.put({
+                    "jsonrpc": "2.0",
+                    "method": "notifications/tools/list_changed"
+                })
+                logger.info(f"📢 Sent tools/list_changed for late servers: session={self.transport.session_id}")
+        except Exception as e:
+            logger.error(f"❌ Error announcing late tools for session {self.transport.session_id}: {e}")
     
     async def handle_tool_call(self, message: Dict[str, Any]) -> JSONResponse:
         """
@@ -188,7 +272,7 @@ class UnifiedProtocolHandler:
                 }
             }
             await self.transport.message_queue.put(error_response)
-            return JSONResponse(content={"status": "processing"}, status_code=202)
+            return FastJSONResponse(content={"status": "processing"}, status_code=202)
         
         # Note: Orchestrator meta-tools removed per user request
         
@@ -207,7 +291,7 @@ class UnifiedProtocolHandler:
                 }
             }
             await self.transport.message_queue.put(error_response)
-            return JSONResponse(content={"status": "processing"}, status_code=202)
+            return FastJSONResponse(content={"status": "processing"}, status_code=202)
         
         if not server_name:
             error_response = {
@@ -219,7 +303,7 @@ class UnifiedProtocolHandler:
                 }
             }
             await self.transport.message_queue.put(error_response)
-            return JSONResponse(content={"status": "processing"}, status_code=202)
+            return FastJSONResponse(content={"status": "processing"}, status_code=202)
         
         # Execute tool on target server
         try:
@@ -245,7 +329,7 @@ class UnifiedProtocolHandler:
             }
         
         await self.transport.message_queue.put(response_data)
-        return JSONResponse(content={"status": "processing"}, status_code=202)
+        return FastJSONResponse(content={"status": "processing"}, status_code=202)
     
     async def handle_resources_list(self, message: Dict[str, Any]) -> JSONResponse:
         """
@@ -275,7 +359,7 @@ class UnifiedProtocolHandler:
             logger.info(f"✅ Unified resources/list complete: 0 resources (tools-focused implementation)")
             
             # HTTP 202 Accepted 반환 (실제 응답은 SSE를 통해 전송됨)
-            return JSONResponse(content={"status": "processing"}, status_code=202)
+            return FastJSONResponse(content={"status": "processing"}, status_code=202)
             
         except Exception as e:
             logger.error(f"❌ Unified resources/list error: {e}")
@@ -294,7 +378,7 @@ class UnifiedProtocolHandler:
             await self.transport.message_queue.put(error_response_data)
             
             # HTTP 202 Accepted 반환 (실제 응답은 SSE를 통해 전송됨)
-            return JSONResponse(content={"status": "processing"}, status_code=202)
+            return FastJSONResponse(content={"status": "processing"}, status_code=202)
     
     async def handle_resources_templates_list(self, message: Dict[str, Any]) -> JSONResponse:
         """
@@ -324,7 +408,7 @@ class UnifiedProtocolHandler:
             logger.info(f"✅ Unified resources/templates/list complete: 0 templates (tools-focused implementation)")
             
             # HTTP 202 Accepted 반환 (실제 응답은 SSE를 통해 전송됨)
-            return JSONResponse(content={"status": "processing"}, status_code=202)
+            return FastJSONResponse(content={"status": "processing"}, status_code=202)
             
         except Exception as e:
             logger.error(f"❌ Unified resources/templates/list error: {e}")
@@ -343,7 +427,7 @@ class UnifiedProtocolHandler:
             await self.transport.message_queue.put(error_response_data)
             
             # HTTP 202 Accepted 반환 (실제 응답은 SSE를 통해 전송됨)
-            return JSONResponse(content={"status": "processing"}, status_code=202)
+            return FastJSONResponse(content={"status": "processing"}, status_code=202)
     
     def _create_namespaced_tool(self, tool: Dict[str, Any], server) -> Dict[str, Any]:
         """Create namespaced version of tool (matches original logic)"""
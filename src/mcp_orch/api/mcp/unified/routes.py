@@ -13,12 +13,13 @@ from typing import Optional, Dict, List
 from uuid import UUID
 
 from fastapi import APIRouter, Request, Depends, Query, HTTPException
-from fastapi.responses import StreamingResponse, JSONResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from fastapi.responses import StreamingResponse, JSONResponse, Response
 
-from ....database import get_db
-from ....models import McpServer
+from ....services.connection_registry import connection_registry
+from ....services.server_repository import ServerRepository
+from ....services.sse_frame_writer import SSEFrameWriter, DATA_KEEPALIVE_FRAME
+from ....services.sse_outbound_queue import OutboundQueue
+from ....services.tool_catalog_cache import tool_catalog_cache
 from .auth import get_current_user_for_unified_mcp
 from .transport import UnifiedMCPTransport
 from ...mcp_sse_transport import sse_transports
@@ -30,7 +31,7 @@ router = APIRouter(tags=["unified-mcp"])
 
 
 
-async def handle_initialize_request(message: dict, project_id: UUID, sessionId: Optional[str], db) -> JSONResponse:
+async def handle_initialize_request(message: dict, project_id: UUID, sessionId: Optional[str]) -> JSONResponse:
     """Initialize 요청 처리 (SSE 구현과 동일한 로직)"""
     request_id = message.get("id")
     params = message.get("params", {})
@@ -38,12 +39,7 @@ async def handle_initialize_request(message: dict, project_id: UUID, sessionId:
     logger.info(f"🎯 Processing initialize request for project {project_id}, id={request_id}")
     
     # 프로젝트의 활성 서버들 조회
-    project_servers = db.query(McpServer).filter(
-        and_(
-            McpServer.project_id == project_id,
-            McpServer.is_enabled == True
-        )
-    ).all()
+    project_servers = await ServerRepository.list_enabled_servers(project_id)
     
     # MCP 표준 초기화 응답 (Claude Code 호환)
     capabilities = {
@@ -81,20 +77,24 @@ async def handle_initialize_request(message: dict, project_id: UUID, sessionId:
 
 
 
-async def handle_tools_list_request(message: dict, project_id: UUID, db) -> JSONResponse:
-    """Tools/list 요청 처리"""
+async def handle_tools_list_request(message: dict, project_id: UUID, if_none_match: Optional[str] = None) -> Response:
+    """Tools/list 요청 처리 (프로젝트 도구 카탈로그 캐시 사용)"""
     try:
         # 프로젝트의 활성 서버들 조회
-        project_servers = db.query(McpServer).filter(
-            and_(
-                McpServer.project_id == project_id,
-                McpServer.is_enabled == True
-            )
-        ).all()
+        project_servers = await ServerRepository.list_enabled_servers(project_id)
+        
+        # 캐시된 카탈로그가 있으면 직렬화 없이 재사용
+        servers_signature = tool_catalog_cache.servers_signature(project_servers)
+        catalog = tool_catalog_cache.get(project_id, "http", servers_signature)
+        if catalog:
+            logger.info(f"📦 Serving cached tool catalog {catalog.version} ({catalog.tool_count} tools)")
+            return _tool_catalog_response(catalog, message.get("id"), if_none_match)
+        catalog_generation = tool_catalog_cache.generation(project_id)
         
         logger.info(f"📋 Tools/list for {len(project_servers)} servers")
         
         all_tools = []
+        complete = True
         
         # 각 서버에서 도구 목록 병렬로 가져오기
         from ....services.mcp_connection_service import mcp_connection_service
@@ -107,7 +107,9 @@ async def handle_tools_list_request(message: dict, project_id: UUID, db) -> JSON
                 "args": server_record.args or [],
                 "env": server_record.env or {},
                 "timeout": server_record.timeout,
-                "is_enabled": server_record.is_enabled
+                "is_enabled": server_record.is_enabled,
+                "pool_min_size": server_record.pool_min_size,
+                "pool_max_size": server_record.pool_max_size
             }
             
             # Session manager가 기대하는 server_id 형식: "project_id.server_name"
@@ -115,7 +117,9 @@ async def handle_tools_list_request(message: dict, project_id: UUID, db) -> JSON
             logger.info(f"🔍 Unified routes - server: {server_record.name}, session_id: {session_manager_server_id}")
             
             task = asyncio.create_task(
-                mcp_connection_service.get_server_tools(session_manager_server_id, server_config)
+                mcp_connection_service.get_server_tools(
+                    session_manager_server_id, server_config, raise_on_error=True
+                )
             )
             server_tasks.append((server_record, task))
         
@@ -140,8 +144,17 @@ async def handle_tools_list_request(message: dict, project_id: UUID, db) -> JSON
                 
             except Exception as e:
                 logger.error(f"❌ Failed to load tools from server {server_record.name}: {e}")
+                complete = False
                 continue
         
+        # 모든 서버가 응답한 경우에만 카탈로그로 저장
+        if complete:
+            catalog = tool_catalog_cache.store(
+                project_id, "http", servers_signature, all_tools, catalog_generation
+            )
+            logger.info(f"📋 Sent {len(all_tools)} filtered tools (catalog {catalog.version})")
+            return _tool_catalog_response(catalog, message.get("id"), if_none_match)
+        
         response = {
             "jsonrpc": "2.0",
             "id": message.get("id"),
@@ -167,7 +180,22 @@ async def handle_tools_list_request(message: dict, project_id: UUID, db) -> JSON
         return JSONResponse(content=error_response)
 
 
-async def handle_tools_call_request(message: dict, project_id: UUID, db) -> JSONResponse:
+def _tool_catalog_response(catalog, request_id, if_none_match: Optional[str]) -> Response:
+    """
+    카탈로그 바이트 응답
+
+    POST에는 304를 쓸 수 없으므로 항상 전체 카탈로그를 200으로 반환하고,
+    클라이언트가 같은 버전을 갖고 있으면 _meta.unchanged 힌트만 추가
+    """
+    headers = {
+        "ETag": catalog.etag,
+        "Access-Control-Expose-Headers": "ETag"
+    }
+    content = catalog.render(request_id, unchanged=catalog.matches(if_none_match))
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+async def handle_tools_call_request(message: dict, project_id: UUID) -> JSONResponse:
     """Tools/call 요청 처리"""
     tool_name = None
     try:
@@ -187,13 +215,7 @@ async def handle_tools_call_request(message: dict, project_id: UUID, db) -> JSON
         server_name, actual_tool_name = tool_name.split("__", 1)
         
         # 프로젝트의 활성 서버들 조회
-        target_server = db.query(McpServer).filter(
-            and_(
-                McpServer.project_id == project_id,
-                McpServer.name == server_name,
-                McpServer.is_enabled == True
-            )
-        ).first()
+        target_server = await ServerRepository.get_enabled_server(project_id, server_name)
         
         if not target_server:
             error_response = {
@@ -212,7 +234,9 @@ async def handle_tools_call_request(message: dict, project_id: UUID, db) -> JSON
             "args": target_server.args or [],
             "env": target_server.env or {},
             "timeout": target_server.timeout or 30,
-            "is_enabled": target_server.is_enabled
+            "is_enabled": target_server.is_enabled,
+            "pool_min_size": target_server.pool_min_size,
+            "pool_max_size": target_server.pool_max_size
         }
         
         # 도구 호출
@@ -254,7 +278,7 @@ async def handle_tools_call_request(message: dict, project_id: UUID, db) -> JSON
         return JSONResponse(content=error_response)
 
 
-async def handle_resources_list_request(message: dict, project_id: UUID, db) -> JSONResponse:
+async def handle_resources_list_request(message: dict, project_id: UUID) -> JSONResponse:
     """Resources/list 요청 처리 - 현재는 빈 목록 반환"""
     try:
         logger.info(f"📁 Processing resources/list for project {project_id}")
@@ -285,7 +309,7 @@ async def handle_resources_list_request(message: dict, project_id: UUID, db) ->
         return JSONResponse(content=error_response)
 
 
-async def handle_resources_templates_list_request(message: dict, project_id: UUID, db) -> JSONResponse:
+async def handle_resources_templates_list_request(message: dict, project_id: UUID) -> JSONResponse:
     """Resources/templates/list 요청 처리 - Claude Code 호환성"""
     try:
         logger.info(f"📋 Processing resources/templates/list for project {project_id}")
@@ -343,8 +367,7 @@ async def unified_mcp_endpoint(
     request: Request,
     project_id: UUID,
     _legacy: Optional[bool] = Query(False, description="Enable legacy mode for compatibility"),
-    current_user = Depends(get_current_user_for_unified_mcp),
-    db: Session = Depends(get_db)
+    current_user = Depends(get_current_user_for_unified_mcp)
 ):
     """
     통합 MCP SSE endpoint - 프로젝트의 모든 활성 서버를 하나로 통합
@@ -359,7 +382,6 @@ async def unified_mcp_endpoint(
         project_id: Project UUID
         _legacy: Enable legacy mode for client compatibility
         current_user: Authenticated user
-        db: Database session
         
     Returns:
         SSE stream for MCP communication
@@ -368,12 +390,7 @@ async def unified_mcp_endpoint(
     session_id = str(uuid.uuid4())
     
     # 프로젝트의 활성 서버들 조회
-    project_servers = db.query(McpServer).filter(
-        and_(
-            McpServer.project_id == project_id,
-            McpServer.is_enabled == True
-        )
-    ).all()
+    project_servers = await ServerRepository.list_enabled_servers(project_id)
     
     logger.info(f"🎯 Starting unified MCP session: project={project_id}, user={current_user.email}, servers={len(project_servers)}")
     
@@ -428,8 +445,7 @@ async def unified_streamable_http_endpoint(
     project_id: UUID,
     sessionId: Optional[str] = Query(None, description="Session ID for Streamable HTTP connection"),
     _legacy: Optional[bool] = Query(False, description="Enable legacy mode for compatibility"),
-    current_user = Depends(get_current_user_for_unified_mcp),
-    db: Session = Depends(get_db)
+    current_user = Depends(get_current_user_for_unified_mcp)
 ):
     """
     Standard MCP Streamable HTTP endpoint - 프로젝트의 모든 활성 서버를 통합
@@ -447,24 +463,23 @@ async def unified_streamable_http_endpoint(
         project_id: Project UUID
         _legacy: Enable legacy mode for client compatibility
         current_user: Authenticated user
-        db: Database session
         
     Returns:
         Standard Streamable HTTP connection for MCP communication
     """
     try:
         # 프로젝트의 활성 서버들 조회
-        project_servers = db.query(McpServer).filter(
-            and_(
-                McpServer.project_id == project_id,
-                McpServer.is_enabled == True
-            )
-        ).all()
+        project_servers = await ServerRepository.list_enabled_servers(project_id)
         
         logger.info(f"🌊 Starting unified Streamable HTTP: project={project_id}, servers={len(project_servers)}")
         
         # SSE 스트림 생성기
+        stream_id = str(uuid.uuid4())
+        
         async def sse_stream():
+            # 서버 알림 수신 및 프로젝트별 연결 집계를 위해 등록
+            queue = OutboundQueue(stream_id)
+            connection_registry.register(stream_id, project_id, "unified_streamable", queue.put)
             try:
                 # 초기 연결 확인 메시지
                 yield f"data: {json.dumps({'type': 'connection', 'status': 'connected'})}\n\n"
@@ -480,20 +495,16 @@ async def unified_streamable_http_endpoint(
                 # 준비 완료 신호
                 yield f"data: {json.dumps({'type': 'ready', 'timestamp': datetime.utcnow().isoformat()})}\n\n"
                 
-                # 표준 keepalive (30초마다)
-                keepalive_count = 0
-                while True:
-                    await asyncio.sleep(30)
-                    keepalive_count += 1
-                    yield f"data: {json.dumps({
-                        'type': 'keepalive', 
-                        'count': keepalive_count,
-                        'timestamp': datetime.utcnow().isoformat()
-                    })}\n\n"
+                # 알림 전달 및 keepalive (유휴 시 공용 스케줄러가 전송)
+                async for chunk in SSEFrameWriter(queue, stream_id, DATA_KEEPALIVE_FRAME).frames():
+                    yield chunk
                     
             except Exception as e:
                 logger.error(f"❌ SSE stream error: {e}")
                 yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            finally:
+                connection_registry.unregister(stream_id)
+                queue.close()
         
         return StreamingResponse(
             sse_stream(),
@@ -520,8 +531,7 @@ async def unified_streamable_http_messages(
     request: Request,
     project_id: UUID,
     sessionId: Optional[str] = Query(None, description="Session ID from Streamable HTTP connection"),
-    current_user = Depends(get_current_user_for_unified_mcp),
-    db: Session = Depends(get_db)
+    current_user = Depends(get_current_user_for_unified_mcp)
 ):
     """
     통합 MCP Streamable HTTP 메시지 처리 endpoint
@@ -532,7 +542,6 @@ async def unified_streamable_http_messages(
         project_id: Project UUID
         sessionId: Session ID from Streamable HTTP connection (optional for initial requests)
         current_user: Authenticated user
-        db: Database session
         
     Returns:
         JSON response with MCP message processing result
@@ -553,15 +562,17 @@ async def unified_streamable_http_messages(
             
             # 메서드별 빠른 처리
             if method == 'initialize':
-                result = await handle_initialize_request(message, project_id, sessionId, db)
+                result = await handle_initialize_request(message, project_id, sessionId)
             elif method == 'tools/list':
-                result = await handle_tools_list_request(message, project_id, db)
+                result = await handle_tools_list_request(
+                    message, project_id, if_none_match=request.headers.get("if-none-match")
+                )
             elif method == 'tools/call':
-                result = await handle_tools_call_request(message, project_id, db)
+                result = await handle_tools_call_request(message, project_id)
             elif method == 'resources/list':
-                result = await handle_resources_list_request(message, project_id, db)
+                result = await handle_resources_list_request(message, project_id)
             elif method == 'resources/templates/list':
-                result = await handle_resources_templates_list_request(message, project_id, db)
+                result = await handle_resources_templates_list_request(message, project_id)
             elif method.startswith('notifications/'):
                 result = await handle_notification_request(message)
             else:
@@ -606,8 +617,7 @@ async def unified_mcp_messages_endpoint(
     request: Request,
     project_id: UUID,
     sessionId: str = Query(..., description="Session ID from SSE connection"),
-    current_user = Depends(get_current_user_for_unified_mcp),
-    db: Session = Depends(get_db)
+    current_user = Depends(get_current_user_for_unified_mcp)
 ):
     """
     통합 MCP 메시지 처리 endpoint (SSE)
@@ -618,7 +628,6 @@ async def unified_mcp_messages_endpoint(
         project_id: Project UUID
         sessionId: Session ID from SSE connection
         current_user: Authenticated user
-        db: Database session
         
     Returns:
         JSON response or 202 Accepted for async processing
@@ -644,8 +653,7 @@ async def unified_streamable_http_delete(
     request: Request,
     project_id: UUID,
     sessionId: Optional[str] = Query(None, description="Session ID for Streamable HTTP connection"),
-    current_user = Depends(get_current_user_for_unified_mcp),
-    db: Session = Depends(get_db)
+    current_user = Depends(get_current_user_for_unified_mcp)
 ):
     """
     통합 MCP Streamable HTTP 세션 종료 endpoint
@@ -654,7 +662,6 @@ async def unified_streamable_http_delete(
         project_id: Project UUID
         sessionId: Session ID for Streamable HTTP connection
         current_user: Authenticated user
-        db: Database session
         
     Returns:
         200 OK on successful session termination
@@ -16,7 +16,10 @@ from fastapi import Request
 from fastapi.responses import JSONResponse
 
 from ...mcp_sse_transport import MCPSSETransport
-from ....models import McpServer
+from ....services.connection_registry import connection_registry
+from ....utils.json_codec import json_codec, FastJSONResponse
+from ....services.server_repository import ServerSnapshot
+from ....services.sse_frame_writer import SSEFrameWriter
 from ....utils.namespace import (
     NamespaceRegistry, UnifiedToolNaming, NAMESPACE_SEPARATOR
 )
@@ -41,15 +44,15 @@ class UnifiedMCPTransport(MCPSSETransport):
     """
     
     def __init__(self, session_id: str, message_endpoint: str, 
-                 project_servers: List[McpServer], project_id: UUID,
+                 project_servers: List[ServerSnapshot], project_id: UUID,
                  transport_type: str = "sse"):
         
         # Initialize base MCPSSETransport with first server or dummy
         primary_server = project_servers[0] if project_servers else None
         if not primary_server:
             # Create dummy server if none available
-            from ....models.mcp_server import McpServer as McpServerModel
-            primary_server = McpServerModel(
+            primary_server = ServerSnapshot(
+                id=None,
                 name="unified-placeholder",
                 command="echo",
                 args=["Unified MCP Server"],
@@ -108,6 +111,7 @@ class UnifiedMCPTransport(MCPSSETransport):
             # Inspector standard format: event: endpoint\ndata: URL\n\n
             yield f"event: endpoint\ndata: {actual_message_endpoint}\n\n"
             self.is_connected = True
+            self._register_connection()
             logger.info(f"✅ Sent Inspector-compatible endpoint event: {actual_message_endpoint}")
             
             # 2. Initialize unified server logging
@@ -116,35 +120,14 @@ class UnifiedMCPTransport(MCPSSETransport):
             # 3. Connection stabilization wait
             await asyncio.sleep(0.1)
             
-            # 4. Message queue processing loop
+            # 4. Message queue processing loop (coalesced frames, 30s keepalive)
             logger.info(f"🔄 Starting message queue loop for session {self.session_id}")
-            keepalive_count = 0
-            
-            while self.is_connected:
-                try:
-                    # Wait for message (30 second timeout)
-                    message = await asyncio.wait_for(self.message_queue.get(), timeout=30.0)
-                    
-                    if message is None:  # Termination signal
-                        logger.info(f"📭 Received termination signal for session {self.session_id}")
-                        break
-                    
-                    # Format and send message (Inspector 호환 형식)
-                    yield f"data: {json.dumps(message)}\n\n"
-                    logger.debug(f"📤 Sent unified message to session {self.session_id}: {message.get('method', 'unknown')}")
-                    
-                except asyncio.TimeoutError:
-                    # Keep-alive 전송 (원본과 동일한 형식)
-                    keepalive_count += 1
-                    yield f": unified-keepalive-{keepalive_count}\n\n"
-                    
-                    if keepalive_count % 10 == 0:
-                        logger.debug(f"💓 Unified keepalive #{keepalive_count} for session {self.session_id}")
-                    
-                except Exception as e:
-                    logger.error(f"❌ Error in SSE stream for session {self.session_id}: {e}")
-                    self.is_connected = False
-                    break
+            try:
+                async for chunk in SSEFrameWriter(self.message_queue, self.session_id).frames():
+                    yield chunk
+            except Exception as e:
+                logger.error(f"❌ Error in SSE stream for session {self.session_id}: {e}")
+                self.is_connected = False
             
         except asyncio.CancelledError:
             logger.info(f"🔌 Unified SSE stream cancelled for session {self.session_id}")
@@ -160,11 +143,21 @@ class UnifiedMCPTransport(MCPSSETransport):
                     "message": f"Unified SSE stream error: {str(e)}"
                 }
             }
-            yield f"data: {json.dumps(error_event)}\n\n"
+            yield json_codec.sse_event(error_event)
         finally:
             self.is_connected = False
+            connection_registry.unregister(self.session_id)
             logger.info(f"🔚 SSE stream ended for session {self.session_id}")
     
+    def _register_connection(self):
+        """툴 변경 알림 대상으로 등록 - 프로젝트의 모든 서버 변경을 수신"""
+        connection_registry.register(
+            self.session_id,
+            self.project_id,
+            "unified",
+            self.send_notification
+        )
+    
     async def handle_post_message(self, request: Request) -> JSONResponse:
         """
         Handle POST messages to unified endpoint (overrides base class)
@@ -174,7 +167,14 @@ class UnifiedMCPTransport(MCPSSETransport):
         try:
             # Parse request body
             body = await request.body()
-            message = json.loads(body) if body else {}
+            try:
+                message = json_codec.loads(body) if body else {}
+            except ValueError as e:
+                logger.error(f"❌ JSON decode error: {e}")
+                return FastJSONResponse(
+                    content={"error": "Invalid JSON"},
+                    status_code=400
+                )
             
             method = message.get("method", "")
             logger.info(f"📨 Unified POST: method={method}, session={self.session_id}")
@@ -206,17 +206,11 @@ class UnifiedMCPTransport(MCPSSETransport):
                     }
                 }
                 await self.message_queue.put(error_response)
-                return JSONResponse(content={"status": "processing"}, status_code=202)
+                return FastJSONResponse(content={"status": "processing"}, status_code=202)
                 
-        except json.JSONDecodeError as e:
-            logger.error(f"❌ JSON decode error: {e}")
-            return JSONResponse(
-                content={"error": "Invalid JSON"},
-                status_code=400
-            )
         except Exception as e:
             logger.error(f"❌ Error handling POST message: {e}")
-            return JSONResponse(
+            return FastJSONResponse(
                 content={"error": str(e)},
                 status_code=500
             )
@@ -232,7 +226,7 @@ class UnifiedMCPTransport(MCPSSETransport):
             health_summary = self._get_server_health_summary()
             logger.info(f"📊 Server health at initialization: {json.dumps(health_summary, indent=2)}")
             
-        return JSONResponse(content={"status": "ok"}, status_code=200)
+        return FastJSONResponse(content={"status": "ok"}, status_code=200)
     
     def _register_servers(self):
         """Register namespaces for all servers"""
@@ -286,7 +280,7 @@ class UnifiedMCPTransport(MCPSSETransport):
             }
         }
     
-    def _build_server_config_for_server(self, server: McpServer) -> Optional[Dict[str, Any]]:
+    def _build_server_config_for_server(self, server: ServerSnapshot) -> Optional[Dict[str, Any]]:
         """Build server configuration for MCP connection service"""
         try:
             return {
@@ -294,7 +288,9 @@ class UnifiedMCPTransport(MCPSSETransport):
                 "args": server.args or [],
                 "env": server.env or {},
                 "timeout": server.timeout,
-                "is_enabled": server.is_enabled
+                "is_enabled": server.is_enabled,
+                "pool_min_size": server.pool_min_size,
+                "pool_max_size": server.pool_max_size
             }
         except Exception as e:
             logger.error(f"Failed to build config for server {server.name}: {e}")
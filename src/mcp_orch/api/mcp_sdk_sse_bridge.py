@@ -21,6 +21,7 @@ from sqlalchemy import and_
 # python-sdk 표준 구현 임포트
 from mcp.server.sse import SseServerTransport
 from mcp.server.lowlevel import Server
+from mcp.server.lowlevel.server import NotificationOptions
 from mcp.shared.message import SessionMessage
 import mcp.types as types
 
@@ -29,6 +30,7 @@ from ..models import Project, McpServer, User, ClientSession, LogLevel, LogCateg
 from .jwt_auth import get_user_from_jwt_token
 from ..services.mcp_connection_service import mcp_connection_service
 from ..services.server_log_service import get_log_service
+from ..services.connection_registry import connection_registry
 
 logger = logging.getLogger(__name__)
 
@@ -643,12 +645,28 @@ async def run_mcp_bridge_session(
                     )
                 ]
         
+        # 툴 변경 알림 대상으로 등록 (write_stream으로 직접 전송)
+        async def send_notification(notification: Dict[str, Any]):
+            await write_stream.send(SessionMessage(types.JSONRPCMessage(
+                types.JSONRPCNotification(**notification)
+            )))
+        
+        connection_registry.register(
+            session_id,
+            project_id,
+            "sdk_bridge",
+            send_notification,
+            server_id=server_record.id
+        )
+        
         # MCP 서버 실행
         logger.info(f"Running MCP server for {server_name} with dynamic tool loading")
         await mcp_server.run(
             read_stream,
             write_stream,
-            mcp_server.create_initialization_options()
+            mcp_server.create_initialization_options(
+                notification_options=NotificationOptions(tools_changed=True)
+            )
         )
         
     except Exception as e:
@@ -656,6 +674,8 @@ async def run_mcp_bridge_session(
         raise
         
     finally:
+        connection_registry.unregister(session_id)
+        
         # 세션 종료 처리 - 안전한 DB 세션 관리
         log_db = None
         try:
@@ -731,7 +751,9 @@ def _build_server_config_from_db(server: McpServer) -> Optional[Dict[str, Any]]:
             'env': server.env or {},
             'timeout': server.timeout or 60,
             'transportType': server.transport_type or 'stdio',
-            'disabled': not server.is_enabled
+            'disabled': not server.is_enabled,
+            'pool_min_size': server.pool_min_size,
+            'pool_max_size': server.pool_max_size
         }
     except Exception as e:
         logger.error(f"Error building server config: {e}")
@@ -16,12 +16,17 @@ from uuid import UUID
 from fastapi import APIRouter, Request, HTTPException, status, Depends, Query
 from fastapi.responses import StreamingResponse, JSONResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
 
-from ..database import get_db
-from ..models import Project, McpServer, User
+from ..database import get_db, release_connection
+from ..models import Project, User
 from .jwt_auth import get_user_from_jwt_token
 from ..services.mcp_connection_service import mcp_connection_service
+from ..services.connection_registry import connection_registry
+from ..services.server_repository import ServerRepository, ServerSnapshot
+from ..services.sse_outbound_queue import OutboundQueue
+from ..services.sse_frame_writer import SSEFrameWriter
+from ..services.rate_limiter import api_key_rate_limiter
+from ..utils.json_codec import json_codec, FastJSONResponse
 
 logger = logging.getLogger(__name__)
 
@@ -41,14 +46,15 @@ class MCPSSETransport:
     - 세션 ID 기반 연결 관리
     """
     
-    def __init__(self, session_id: str, message_endpoint: str, server: McpServer, project_id: UUID):
+    def __init__(self, session_id: str, message_endpoint: str, server: ServerSnapshot, project_id: UUID):
         self.session_id = session_id
         self.message_endpoint = message_endpoint
         self.server = server
         self.project_id = project_id
         self.is_connected = False
-        self.message_queue = asyncio.Queue()
+        self.message_queue = OutboundQueue(session_id, on_overflow=self._on_slow_consumer)
         self.created_at = datetime.utcnow()
+        self.api_key = None  # SSE 연결을 인증한 API 키 (메시지 속도 제한용)
         
         logger.info(f"🚀 MCPSSETransport created: session={session_id}, server={server.name}")
         
@@ -75,36 +81,17 @@ class MCPSSETransport:
             # Inspector 표준 형식: event: endpoint\ndata: URL\n\n
             yield f"event: endpoint\ndata: {actual_message_endpoint}\n\n"
             self.is_connected = True
+            self._register_connection()
             logger.info(f"✅ Sent Inspector-compatible endpoint event: {actual_message_endpoint}")
             logger.info(f"🎯 Inspector proxy will send POST to: {actual_message_endpoint}")
             
             # 2. 연결 안정화 대기
             await asyncio.sleep(0.1)
             
-            # 3. 메시지 큐 처리 루프
+            # 3. 메시지 큐 처리 루프 (대기 중인 프레임을 묶어서 전송, 30초 keepalive)
             logger.info(f"🔄 Starting message queue loop for session {self.session_id}")
-            keepalive_count = 0
-            
-            while self.is_connected:
-                try:
-                    # 메시지 대기 (30초 타임아웃)
-                    message = await asyncio.wait_for(self.message_queue.get(), timeout=30.0)
-                    
-                    if message is None:  # 종료 신호
-                        logger.info(f"📤 Received close signal for session {self.session_id}")
-                        break
-                        
-                    # 메시지 전송
-                    yield f"data: {json.dumps(message)}\n\n"
-                    logger.debug(f"📤 Sent message to session {self.session_id}: {message.get('method', 'unknown')}")
-                    
-                except asyncio.TimeoutError:
-                    # Keep-alive 전송
-                    keepalive_count += 1
-                    yield f": keepalive-{keepalive_count}\n\n"
-                    
-                    if keepalive_count % 10 == 0:
-                        logger.debug(f"💓 Keepalive #{keepalive_count} for session {self.session_id}")
+            async for chunk in SSEFrameWriter(self.message_queue, self.session_id).frames():
+                yield chunk
                         
         except asyncio.CancelledError:
             logger.info(f"🔌 SSE stream cancelled for session {self.session_id}")
@@ -120,7 +107,7 @@ class MCPSSETransport:
                     "message": f"SSE stream error: {str(e)}"
                 }
             }
-            yield f"data: {json.dumps(error_event)}\n\n"
+            yield json_codec.sse_event(error_event)
         finally:
             await self.close()
         
@@ -135,12 +122,13 @@ class MCPSSETransport:
         - notifications/*: 알림 처리
         """
         try:
-            message = await request.json()
+            message = json_codec.loads(await request.body())
             method = message.get("method")
             request_id = message.get("id")
             
             logger.info(f"📥 Session {self.session_id} received: {method} (id={request_id})")
-            logger.info(f"🔍 Full message content: {json.dumps(message, indent=2)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"🔍 Full message content: {json_codec.dumps_str(message)}")
             
             # JSON-RPC 2.0 검증
             if message.get("jsonrpc") != "2.0":
@@ -175,7 +163,7 @@ class MCPSSETransport:
                         "message": f"Method not found: {method}"
                     }
                 }
-                return JSONResponse(content=error_response, status_code=200)
+                return FastJSONResponse(content=error_response, status_code=200)
                 
         except HTTPException:
             raise
@@ -191,7 +179,7 @@ class MCPSSETransport:
                     "message": f"Internal error: {str(e)}"
                 }
             }
-            return JSONResponse(content=error_response, status_code=200)
+            return FastJSONResponse(content=error_response, status_code=200)
     
     async def handle_initialize(self, message: Dict[str, Any]) -> JSONResponse:
         """
@@ -219,7 +207,7 @@ class MCPSSETransport:
             "result": {
                 "protocolVersion": "2024-11-05",
                 "capabilities": {
-                    "tools": {} if has_tools else None,
+                    "tools": {"listChanged": True} if has_tools else None,
                     "logging": {},
                     "prompts": None,
                     "resources": None
@@ -237,7 +225,7 @@ class MCPSSETransport:
         logger.info(f"📋 Next step: Inspector Client should send 'notifications/initialized'")
         logger.info(f"✅ Inspector Transport should now be connected!")
         
-        return JSONResponse(content=response)
+        return FastJSONResponse(content=response)
     
     async def handle_tools_list(self, message: Dict[str, Any]) -> JSONResponse:
         """도구 목록 조회 처리 (필터링 적용)"""
@@ -273,7 +261,7 @@ class MCPSSETransport:
             }
             
             logger.info(f"📋 Sent {len(tools) if tools else 0} filtered tools for session {self.session_id}")
-            return JSONResponse(content=response)
+            return FastJSONResponse(content=response)
             
         except Exception as e:
             logger.error(f"❌ Tools list error in session {self.session_id}: {e}")
@@ -286,7 +274,7 @@ class MCPSSETransport:
                     "message": f"Failed to list tools: {str(e)}"
                 }
             }
-            return JSONResponse(content=error_response)
+            return FastJSONResponse(content=error_response)
     
     async def handle_tool_call(self, message: Dict[str, Any]) -> JSONResponse:
         """도구 호출 처리"""
@@ -331,7 +319,7 @@ class MCPSSETransport:
             }
             
             logger.info(f"✅ Tool call successful: {tool_name} in session {self.session_id}")
-            return JSONResponse(content=response)
+            return FastJSONResponse(content=response)
             
         except Exception as e:
             logger.error(f"❌ Tool call error in session {self.session_id}: {e}")
@@ -345,7 +333,7 @@ class MCPSSETransport:
                     "message": f"Tool execution failed: {str(e)}"
                 }
             }
-            return JSONResponse(content=error_response)
+            return FastJSONResponse(content=error_response)
     
     async def handle_notification(self, message: Dict[str, Any]) -> JSONResponse:
         """알림 메시지 처리"""
@@ -366,7 +354,7 @@ class MCPSSETransport:
             logger.debug(f"📢 Standard notification: {method}")
         
         # 모든 알림은 202 Accepted 반환 (MCP 표준)
-        return JSONResponse(content={"status": "accepted"}, status_code=202)
+        return FastJSONResponse(content={"status": "accepted"}, status_code=202)
     
     def _build_server_config(self) -> Optional[Dict[str, Any]]:
         """데이터베이스 서버 모델에서 설정 구성"""
@@ -377,7 +365,9 @@ class MCPSSETransport:
                 'env': self.server.env or {},
                 'timeout': self.server.timeout or 60,
                 'transportType': self.server.transport_type or 'stdio',
-                'disabled': not self.server.is_enabled
+                'disabled': not self.server.is_enabled,
+                'pool_min_size': self.server.pool_min_size,
+                'pool_max_size': self.server.pool_max_size
             }
         except Exception as e:
             logger.error(f"Error building server config: {e}")
@@ -389,11 +379,27 @@ class MCPSSETransport:
             await self.message_queue.put(notification)
             logger.debug(f"📤 Queued notification for session {self.session_id}: {notification.get('method')}")
     
+    def _register_connection(self):
+        """툴 변경 알림 대상으로 연결 등록"""
+        connection_registry.register(
+            self.session_id,
+            self.project_id,
+            "sse",
+            self.send_notification,
+            server_id=self.server.id
+        )
+    
+    def _on_slow_consumer(self, queue: OutboundQueue):
+        """송신 큐가 high-water mark를 넘어 닫힘 - 더 이상 알림을 받지 않도록 연결 해제"""
+        self.is_connected = False
+        connection_registry.unregister(self.session_id)
+    
     async def close(self):
         """Transport 종료"""
+        connection_registry.unregister(self.session_id)
         if self.is_connected:
             self.is_connected = False
-            await self.message_queue.put(None)  # 종료 신호
+            self.message_queue.close()  # 종료 신호
             logger.info(f"🔌 Transport closed for session {self.session_id}")
 
 
@@ -462,14 +468,8 @@ async def mcp_sse_endpoint(
         else:
             logger.info(f"🔓 MCP SSE connection (no auth): project={project_id}, server={server_name}")
         
-        # 2. 서버 존재 확인
-        server = db.query(McpServer).filter(
-            and_(
-                McpServer.project_id == project_id,
-                McpServer.name == server_name,
-                McpServer.is_enabled == True
-            )
-        ).first()
+        # 2. 서버 존재 확인 (스트림이 들고 있을 설정은 세션과 분리된 스냅샷으로)
+        server = await ServerRepository.get_enabled_server(project_id, server_name)
         
         if not server:
             raise HTTPException(
@@ -477,6 +477,9 @@ async def mcp_sse_endpoint(
                 detail=f"Server '{server_name}' not found or disabled in project {project_id}"
             )
         
+        # 스트림 시작 전에 인증에 쓴 커넥션을 풀에 반환
+        release_connection(db)
+        
         # 3. 세션 ID 생성
         session_id = str(uuid.uuid4())
         
@@ -486,6 +489,7 @@ async def mcp_sse_endpoint(
         
         # 5. MCPSSETransport 생성 및 저장
         transport = MCPSSETransport(session_id, message_endpoint, server, project_id)
+        transport.api_key = getattr(request.state, 'api_key', None)
         sse_transports[session_id] = transport
         
         logger.info(f"🚀 Starting MCP SSE transport: session={session_id}, endpoint={message_endpoint}")
@@ -574,7 +578,12 @@ async def mcp_messages_endpoint(
                 detail="Session project/server mismatch"
             )
         
-        # 3. Transport를 통한 메시지 처리
+        # 3. API 키 속도 제한 (헤더 없이 세션 ID만 오는 메시지는 세션의 API 키 기준)
+        rate_limit = await api_key_rate_limiter.check_request(request, transport.api_key)
+        if rate_limit and not rate_limit.allowed:
+            return rate_limit.to_response(jsonrpc=True)
+        
+        # 4. Transport를 통한 메시지 처리
         logger.info(f"✅ Routing message to transport for session {sessionId}")
         return await transport.handle_post_message(request)
         
@@ -592,7 +601,7 @@ async def mcp_messages_endpoint(
                 "message": f"Message processing failed: {str(e)}"
             }
         }
-        return JSONResponse(content=error_response, status_code=200)
+        return FastJSONResponse(content=error_response, status_code=200)
 
 
 # 유틸리티 함수들
@@ -604,7 +613,8 @@ async def get_active_sessions() -> Dict[str, Dict[str, Any]]:
             "project_id": str(transport.project_id),
             "is_connected": transport.is_connected,
             "created_at": transport.created_at.isoformat(),
-            "message_endpoint": transport.message_endpoint
+            "message_endpoint": transport.message_endpoint,
+            "queue": transport.message_queue.get_stats()
         }
         for session_id, transport in sse_transports.items()
     }
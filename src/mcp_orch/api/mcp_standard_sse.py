@@ -16,12 +16,16 @@ from fastapi.responses import StreamingResponse, JSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 
-from ..database import get_db
+from ..database import get_db, release_connection
 from ..models import Project, McpServer, User
 from ..models.mcp_server import McpServerStatus
 from .jwt_auth import get_user_from_jwt_token
 from ..services.mcp_connection_service import mcp_connection_service
 from ..services.server_status_service import ServerStatusService
+from ..services.connection_registry import connection_registry
+from ..services.server_repository import ServerRepository, ServerSnapshot
+from ..services.sse_outbound_queue import OutboundQueue
+from ..services.sse_frame_writer import SSEFrameWriter, DATA_KEEPALIVE_FRAME
 
 logger = logging.getLogger(__name__)
 
@@ -90,14 +94,8 @@ async def mcp_standard_sse_endpoint(
         else:
             logger.info(f"MCP SSE connection (no auth): project_id={project_id}, server={server_name}")
         
-        # 서버 존재 확인
-        server = db.query(McpServer).filter(
-            and_(
-                McpServer.project_id == project_id,
-                McpServer.name == server_name,
-                McpServer.is_enabled == True
-            )
-        ).first()
+        # 서버 존재 확인 (스트림이 들고 있을 설정은 세션과 분리된 스냅샷으로)
+        server = await ServerRepository.get_enabled_server(project_id, server_name)
         
         if not server:
             raise HTTPException(
@@ -105,6 +103,9 @@ async def mcp_standard_sse_endpoint(
                 detail=f"Server '{server_name}' not found or disabled in project {project_id}"
             )
         
+        # 스트림 시작 전에 인증에 쓴 커넥션을 풀에 반환
+        release_connection(db)
+        
         # SSE 연결 ID 생성
         connection_id = str(uuid.uuid4())
         
@@ -147,7 +148,7 @@ async def generate_mcp_sse_stream(
     connection_id: str, 
     project_id: UUID, 
     server_name: str, 
-    server: McpServer,
+    server: ServerSnapshot,
     request: Request = None
 ) -> AsyncGenerator[str, None]:
     """표준 MCP SSE 스트림 생성"""
@@ -159,8 +160,18 @@ async def generate_mcp_sse_stream(
             "server_name": server_name,
             "server": server,
             "created_at": datetime.utcnow(),
-            "message_queue": asyncio.Queue()
+            "message_queue": OutboundQueue(
+                connection_id,
+                on_overflow=lambda queue: connection_registry.unregister(connection_id)
+            )
         }
+        connection_registry.register(
+            connection_id,
+            project_id,
+            "standard_sse",
+            active_sse_connections[connection_id]["message_queue"].put,
+            server_id=server.id
+        )
         
         logger.info(f"MCP SSE connection {connection_id} established")
         
@@ -262,31 +273,11 @@ async def generate_mcp_sse_stream(
         except Exception as e:
             logger.error(f"Failed to send tools list: {e}")
         
-        # 8. 메시지 큐 처리 루프
+        # 8. 메시지 큐 처리 루프 (대기 중인 프레임을 묶어서 전송, 30초 keepalive)
         logger.info(f"Starting message queue loop for connection {connection_id}")
-        connection_info = active_sse_connections[connection_id]
-        message_queue = connection_info["message_queue"]
-        keepalive_count = 0
-        
-        while True:
-            try:
-                # 큐에서 메시지 대기 (타임아웃 30초)
-                message = await asyncio.wait_for(message_queue.get(), timeout=30.0)
-                
-                if message is None:  # 연결 종료 신호
-                    break
-                    
-                # 메시지 전송
-                yield f"data: {json.dumps(message)}\n\n"
-                logger.debug(f"Sent message to connection {connection_id}: {message.get('method', 'unknown')}")
-                
-            except asyncio.TimeoutError:
-                # Keep-alive 신호 전송 (mcp-inspector 스타일)
-                keepalive_count += 1
-                yield f": keepalive-{keepalive_count}\n\n"
-                
-                if keepalive_count % 10 == 0:
-                    logger.debug(f"Sent keepalive #{keepalive_count} to connection {connection_id}")
+        message_queue = active_sse_connections[connection_id]["message_queue"]
+        async for chunk in SSEFrameWriter(message_queue, connection_id).frames():
+            yield chunk
                 
     except asyncio.CancelledError:
         logger.info(f"MCP SSE connection {connection_id} cancelled")
@@ -318,6 +309,7 @@ async def generate_mcp_sse_stream(
                 logger.error(f"❌ Failed to update server status on SSE disconnect: {e}")
         
         # 연결 정리
+        connection_registry.unregister(connection_id)
         if connection_id in active_sse_connections:
             del active_sse_connections[connection_id]
         logger.info(f"MCP SSE connection {connection_id} closed")
@@ -548,7 +540,7 @@ async def handle_initialize(message: Dict[str, Any]):
         "result": {
             "protocolVersion": "2024-11-05",
             "capabilities": {
-                "tools": {}, 
+                "tools": {"listChanged": True}, 
                 "logging": {},
                 "prompts": {},
                 "resources": {}
@@ -575,7 +567,9 @@ def _build_server_config_from_db(server: McpServer) -> Optional[Dict[str, Any]]:
             'env': server.env or {},
             'timeout': server.timeout or 60,
             'transportType': server.transport_type or 'stdio',
-            'disabled': not server.is_enabled
+            'disabled': not server.is_enabled,
+            'pool_min_size': server.pool_min_size,
+            'pool_max_size': server.pool_max_size
         }
     except Exception as e:
         logger.error(f"Error building server config: {e}")
@@ -615,14 +609,8 @@ async def individual_streamable_http_endpoint(
         # 사용자 인증
         current_user = await get_current_user_for_mcp_sse(request, project_id, db)
         
-        # 서버 존재 확인
-        server = db.query(McpServer).filter(
-            and_(
-                McpServer.project_id == project_id,
-                McpServer.name == server_name,
-                McpServer.is_enabled == True
-            )
-        ).first()
+        # 서버 존재 확인 (스트림이 들고 있을 설정은 세션과 분리된 스냅샷으로)
+        server = await ServerRepository.get_enabled_server(project_id, server_name)
         
         if not server:
             raise HTTPException(
@@ -630,13 +618,21 @@ async def individual_streamable_http_endpoint(
                 detail=f"Server '{server_name}' not found or disabled in project {project_id}"
             )
         
+        # 스트림 시작 전에 인증에 쓴 커넥션을 풀에 반환
+        release_connection(db)
+        
         logger.info(f"🌊 Starting individual server Streamable HTTP: project={project_id}, server={server_name}")
         
         # SSE 스트림 생성기
+        stream_id = str(uuid.uuid4())
+        
         async def sse_stream():
+            # 서버 알림 수신 및 프로젝트별 연결 집계를 위해 등록
+            queue = OutboundQueue(stream_id)
+            connection_registry.register(stream_id, project_id, "streamable_http", queue.put, server_id=server.id)
             try:
                 # 초기 연결 확인 메시지
-                yield f"data: {json.dumps({'type': 'connection', 'status': 'connected'})}\\n\\n"
+                yield f"data: {json.dumps({'type': 'connection', 'status': 'connected'})}\n\n"
                 
                 # 서버 정보 전송
                 yield f"data: {json.dumps({
@@ -644,25 +640,21 @@ async def individual_streamable_http_endpoint(
                     'project_id': str(project_id),
                     'server_name': server_name,
                     'server_id': str(server.id)
-                })}\\n\\n"
+                })}\n\n"
                 
                 # 준비 완료 신호
-                yield f"data: {json.dumps({'type': 'ready', 'timestamp': datetime.utcnow().isoformat()})}\\n\\n"
+                yield f"data: {json.dumps({'type': 'ready', 'timestamp': datetime.utcnow().isoformat()})}\n\n"
                 
-                # 표준 keepalive (30초마다)
-                keepalive_count = 0
-                while True:
-                    await asyncio.sleep(30)
-                    keepalive_count += 1
-                    yield f"data: {json.dumps({
-                        'type': 'keepalive', 
-                        'count': keepalive_count,
-                        'timestamp': datetime.utcnow().isoformat()
-                    })}\\n\\n"
+                # 알림 전달 및 keepalive (유휴 시 공용 스케줄러가 전송)
+                async for chunk in SSEFrameWriter(queue, stream_id, DATA_KEEPALIVE_FRAME).frames():
+                    yield chunk
                     
             except Exception as e:
                 logger.error(f"❌ SSE stream error: {e}")
-                yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\\n\\n"
+                yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            finally:
+                connection_registry.unregister(stream_id)
+                queue.close()
         
         return StreamingResponse(
             sse_stream(),
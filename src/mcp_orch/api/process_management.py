@@ -287,6 +287,51 @@ async def get_process_metrics(
         raise HTTPException(status_code=500, detail=f"메트릭 조회 실패: {str(e)}")
 
 
+@router.get("/sessions")
+async def get_session_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """MCP 세션 풀 및 서버 키 캐시 상태 조회"""
+    from ..services.mcp_session_manager import get_session_manager
+    from ..services.server_key_resolver import server_key_resolver
+    from ..services.tool_call_log_writer import tool_call_log_writer
+    from ..services.tool_catalog_cache import tool_catalog_cache
+    from ..services.tool_preference_cache import tool_preference_cache
+    from ..services.connection_registry import connection_registry
+    from ..services.api_key_auth_cache import api_key_auth_cache
+    from ..services.jwt_verification_cache import jwt_verification_cache
+    from ..services.rate_limiter import api_key_rate_limiter
+    from ..services.process_output_pump import process_output_pump
+    from ..utils.json_codec import json_codec
+    from ..services.sse_outbound_queue import sse_queue_monitor
+    from ..services.sse_frame_writer import sse_writer_config
+    from ..services.sse_keepalive import sse_keepalive_scheduler
+    from ..database import get_pool_stats
+    
+    try:
+        session_manager = await get_session_manager()
+        return {
+            "pools": session_manager.get_pool_stats(),
+            "server_key_cache": server_key_resolver.get_stats(),
+            "tool_call_logs": tool_call_log_writer.get_stats(),
+            "tool_catalogs": tool_catalog_cache.get_stats(),
+            "tool_preferences": tool_preference_cache.get_stats(),
+            "connections": connection_registry.get_stats(),
+            "api_key_auth": api_key_auth_cache.get_stats(),
+            "jwt_auth": jwt_verification_cache.get_stats(),
+            "rate_limits": api_key_rate_limiter.get_stats(),
+            "process_output": process_output_pump.get_stats(),
+            "json_codec": json_codec.get_stats(),
+            "db_pool": get_pool_stats(),
+            "sse_queues": sse_queue_monitor.get_stats(),
+            "sse_writer": sse_writer_config.get_stats(),
+            "sse_keepalive": sse_keepalive_scheduler.get_stats(),
+            "timestamp": datetime.utcnow()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"세션 상태 조회 실패: {str(e)}")
+
+
 @router.get("/logs/{server_id}")
 async def get_server_logs(
     server_id: str,
@@ -332,6 +377,25 @@ async def get_server_logs(
 
 
 # 시스템 정보 엔드포인트
+@router.get("/output/{server_id}")
+async def get_server_output(
+    server_id: str,
+    limit: int = 100,
+    stream: Optional[str] = None,
+    current_user: User = Depends(get_current_user)
+):
+    """프로세스 stdout/stderr 최근 출력 조회 (링 버퍼)"""
+    if stream is not None and stream not in ("stdout", "stderr"):
+        raise HTTPException(status_code=400, detail="stream은 stdout 또는 stderr만 가능합니다")
+    
+    process_manager = get_process_manager()
+    return {
+        "server_id": server_id,
+        "stats": process_manager.output_pump.get_server_stats(server_id),
+        "lines": process_manager.output_pump.get_output(server_id, limit=limit, stream=stream)
+    }
+
+
 @router.get("/system/info")
 async def get_system_info(
     current_user: User = Depends(get_current_user)
@@ -19,6 +19,7 @@ from ..models.mcp_server import McpServerStatus
 from ..models.tool_call_log import CallStatus
 from .jwt_auth import get_user_from_jwt_token
 from ..services.mcp_connection_service import mcp_connection_service, ToolExecutionError
+from ..services.cache_invalidation_service import CacheInvalidationService
 
 router = APIRouter(prefix="/api", tags=["project-servers"])
 logger = logging.getLogger(__name__)
@@ -356,6 +357,9 @@ async def create_project_server(
     db.commit()
     db.refresh(new_server)
     
+    # 생성 전에 캐시된 '서버 없음' 해석 결과 제거
+    await CacheInvalidationService.on_server_created(project_id, new_server.id)
+    
     return ServerResponse(
         id=str(new_server.id),
         name=new_server.name,
@@ -443,6 +447,7 @@ async def update_project_server(
     
     # 서버 정보 업데이트
     logger.info(f"🔧 Updating server {server.name} with data: {server_data}")
+    name_changed = server_data.name is not None and server_data.name != server.name
     if server_data.name is not None:
         logger.info(f"🔥 Updating name: {server.name} -> {server_data.name}")
         server.name = server_data.name
@@ -475,6 +480,9 @@ async def update_project_server(
     logger.info(f"🔥 Server updates committed successfully")
     db.refresh(server)
     
+    if name_changed:
+        await CacheInvalidationService.on_server_renamed(project_id, server.id)
+    
     return ServerResponse(
         id=str(server.id),
         name=server.name,
@@ -540,6 +548,8 @@ async def delete_project_server(
     db.delete(server)
     db.commit()
     
+    await CacheInvalidationService.on_server_deleted(project_id, server_id)
+    
     return {"message": f"Server '{server_name}' deleted successfully"}
 
 
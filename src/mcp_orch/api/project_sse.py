@@ -16,6 +16,7 @@ from sqlalchemy import and_
 from ..database import get_db
 from ..models import Project, ProjectMember, User, McpServer, ApiKey
 from .jwt_auth import get_user_from_jwt_token
+from ..services.cache_invalidation_service import CacheInvalidationService
 from ..core.controller import DualModeController
 
 logger = logging.getLogger(__name__)
@@ -260,6 +261,9 @@ async def add_project_server(
     db.commit()
     db.refresh(server)
     
+    # 생성 전에 캐시된 '서버 없음' 해석 결과 제거
+    await CacheInvalidationService.on_server_created(project_id, server.id)
+    
     return {
         "id": str(server.id),
         "name": server.name,
@@ -329,6 +333,7 @@ async def update_project_server(
             )
     
     # 서버 정보 업데이트
+    name_changed = "name" in server_data and server_data["name"] != server.name
     if "name" in server_data:
         server.name = server_data["name"]
     if "command" in server_data:
@@ -346,6 +351,9 @@ async def update_project_server(
     db.commit()
     db.refresh(server)
     
+    if name_changed:
+        await CacheInvalidationService.on_server_renamed(project_id, server.id)
+    
     return {
         "id": str(server.id),
         "name": server.name,
@@ -402,6 +410,8 @@ async def delete_project_server(
     db.delete(server)
     db.commit()
     
+    await CacheInvalidationService.on_server_deleted(project_id, server_id)
+    
     return {"message": f"Server '{server_name}' deleted successfully"}
 
 
@@ -609,6 +619,7 @@ async def delete_project_api_key(
     key_name = api_key.name
     db.delete(api_key)
     db.commit()
+    CacheInvalidationService.on_api_key_revoked(key_id)
     
     return {"message": f"API key '{key_name}' deleted successfully"}
 
@@ -19,6 +19,7 @@ from pydantic import BaseModel, Field
 from ...database import get_db
 from ...models import Project, ProjectMember, User, ApiKey
 from ...services.activity_logger import ActivityLogger
+from ...services.cache_invalidation_service import CacheInvalidationService
 from .common import get_current_user_for_projects, verify_project_access
 
 router = APIRouter()
@@ -271,6 +272,7 @@ async def delete_project_api_key(
     key_name = api_key.name
     db.delete(api_key)
     db.commit()
+    CacheInvalidationService.on_api_key_revoked(key_id)
     
     # 활동 로깅
     try:
@@ -16,6 +16,7 @@ from pydantic import BaseModel, Field
 from ...database import get_db
 from ...models import Project, ProjectMember, User, ProjectRole, InviteSource, McpServer
 from ...services.activity_logger import ActivityLogger
+from ...services.cache_invalidation_service import CacheInvalidationService
 from .common import get_current_user_for_projects, verify_project_access, verify_project_owner, check_project_name_availability
 
 router = APIRouter()
@@ -328,6 +329,9 @@ async def delete_project(
     db.delete(project)
     db.commit()
     
+    # 삭제된 프로젝트의 API 키가 캐시로 계속 인증되지 않도록 즉시 제거
+    CacheInvalidationService.on_project_deleted(project_id)
+    
     # 활동 로깅 (프로젝트 삭제 후에는 project_id가 None)
     try:
         ActivityLogger.log_activity(
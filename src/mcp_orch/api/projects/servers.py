@@ -19,6 +19,7 @@ from ...database import get_db
 from ...models import Project, ProjectMember, User, McpServer, ProjectRole
 from ...services.mcp_connection_service import mcp_connection_service
 from ...services.activity_logger import ActivityLogger
+from ...services.cache_invalidation_service import CacheInvalidationService
 from .common import get_current_user_for_projects, verify_project_access, verify_project_member
 
 router = APIRouter()
@@ -33,6 +34,8 @@ class McpServerCreate(BaseModel):
     env: Optional[Dict[str, str]] = Field(default_factory=dict, description="환경변수")
     timeout: Optional[int] = Field(30, gt=0, le=300, description="연결 타임아웃 (초)")
     is_enabled: bool = Field(True, description="서버 활성화 상태")
+    pool_min_size: int = Field(1, ge=1, le=16, description="최소 워커 프로세스 수")
+    pool_max_size: int = Field(1, ge=1, le=16, description="최대 워커 프로세스 수")
 
 
 class McpServerUpdate(BaseModel):
@@ -43,6 +46,8 @@ class McpServerUpdate(BaseModel):
     timeout: Optional[int] = Field(None, gt=0, le=300, description="연결 타임아웃 (초)")
     is_enabled: Optional[bool] = Field(None, description="서버 활성화 상태")
     jwt_auth_required: Optional[bool] = Field(None, description="JWT 인증 필요 여부")
+    pool_min_size: Optional[int] = Field(None, ge=1, le=16, description="최소 워커 프로세스 수")
+    pool_max_size: Optional[int] = Field(None, ge=1, le=16, description="최대 워커 프로세스 수")
 
 
 class McpServerResponse(BaseModel):
@@ -362,6 +367,8 @@ async def create_project_server(
         env=server_data.env or {},
         timeout=server_data.timeout,
         is_enabled=server_data.is_enabled,
+        pool_min_size=server_data.pool_min_size,
+        pool_max_size=max(server_data.pool_min_size, server_data.pool_max_size),
         project_id=project_id,
         created_by_id=current_user.id
     )
@@ -370,6 +377,9 @@ async def create_project_server(
     db.commit()
     db.refresh(new_server)
     
+    # 생성 전에 캐시된 '서버 없음' 해석 결과 제거
+    await CacheInvalidationService.on_server_created(project_id, new_server.id)
+    
     # 활동 로깅
     try:
         ActivityLogger.log_activity(
@@ -513,12 +523,20 @@ async def update_project_server(
         if hasattr(server, field):
             old_values[field] = getattr(server, field)
             setattr(server, field, value)
+    name_changed = "name" in old_values and old_values["name"] != server.name
+    
+    # 풀 크기 보정 (max는 min 이상)
+    if server.pool_max_size < server.pool_min_size:
+        server.pool_max_size = server.pool_min_size
     
     server.updated_at = datetime.utcnow()
     
     db.commit()
     db.refresh(server)
     
+    if name_changed:
+        await CacheInvalidationService.on_server_renamed(project_id, server.id)
+    
     # 활동 로깅
     try:
         ActivityLogger.log_activity(
@@ -596,6 +614,8 @@ async def delete_project_server(
     db.delete(server)
     db.commit()
     
+    await CacheInvalidationService.on_server_deleted(project_id, server_id)
+    
     # 활동 로깅
     try:
         ActivityLogger.log_activity(
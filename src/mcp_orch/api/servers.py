@@ -12,6 +12,7 @@ from ..models.mcp_server import McpServer
 from ..models.user import User
 from .header_auth import get_user_from_headers
 from ..services.activity_logger import ActivityLogger
+from ..services.cache_invalidation_service import CacheInvalidationService
 
 router = APIRouter(prefix="/api/servers", tags=["servers"])
 
@@ -195,7 +196,10 @@ async def delete_server(
         db=db
     )
     
+    project_id = server.project_id
     db.delete(server)
     db.commit()
     
+    await CacheInvalidationService.on_server_deleted(project_id, server_uuid)
+    
     return {"message": "Server deleted successfully"}
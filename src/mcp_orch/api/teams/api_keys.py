@@ -15,6 +15,7 @@ from ...models.team import TeamMember, TeamRole
 from ...models.api_key import ApiKey
 from ...models import ProjectMember
 from ...services.activity_logger import ActivityLogger
+from ...services.cache_invalidation_service import CacheInvalidationService
 from .common import (
     TeamApiKeyResponse,
     CreateApiKeyRequest,
@@ -195,5 +196,6 @@ async def delete_team_api_key(
     
     db.delete(api_key)
     db.commit()
+    CacheInvalidationService.on_api_key_revoked(key_id)
     
     return {"message": "API key deleted successfully"}
\ No newline at end of file
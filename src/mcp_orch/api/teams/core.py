@@ -17,6 +17,7 @@ from ...models.project import Project, ProjectMember, InviteSource
 from ...models.api_key import ApiKey
 from ...models.activity import ActivityType, Activity
 from ...services.activity_logger import ActivityLogger
+from ...services.cache_invalidation_service import CacheInvalidationService
 from .common import (
     TeamResponse, 
     CreateTeamRequest, 
@@ -245,6 +246,7 @@ async def delete_team(
             )
         ).all()
         
+        revoked_key_ids = [api_key.id for api_key in team_api_keys]
         for api_key in team_api_keys:
             db.delete(api_key)
         
@@ -255,6 +257,9 @@ async def delete_team(
         db.delete(team)
         db.commit()
         
+        for key_id in revoked_key_ids:
+            CacheInvalidationService.on_api_key_revoked(key_id)
+        
         return {"message": f"Team '{team.name}' has been successfully deleted"}
         
     except Exception as e:
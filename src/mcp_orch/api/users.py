@@ -10,6 +10,7 @@ from jose import jwt
 
 from ..database import get_db
 from ..models.user import User
+from ..services.cache_invalidation_service import CacheInvalidationService
 from .jwt_auth import get_user_from_jwt_token
 
 # JWT 설정
@@ -534,6 +535,7 @@ async def update_user_admin(
         
         db.commit()
         db.refresh(user)
+        CacheInvalidationService.on_user_changed(user.id)
         
         return AdminUserResponse(
             id=str(user.id),
@@ -592,6 +594,7 @@ async def delete_user_admin(
         user.updated_at = datetime.now(timezone.utc)
         
         db.commit()
+        CacheInvalidationService.on_user_changed(user_id)
         
         return {"message": "사용자가 성공적으로 비활성화되었습니다."}
         
@@ -673,6 +676,8 @@ async def bulk_delete_users_admin(
         # 성공한 변경사항 커밋
         if successful_deletions:
             db.commit()
+            for user_id in successful_deletions:
+                CacheInvalidationService.on_user_changed(user_id)
         
         return BulkDeleteResponse(
             message=f"{len(successful_deletions)}명의 사용자가 성공적으로 비활성화되었습니다.",
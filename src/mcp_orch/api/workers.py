@@ -4,7 +4,7 @@
 APScheduler 기반 백그라운드 워커 제어 및 모니터링
 """
 
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request
@@ -46,6 +46,12 @@ class JobHistoryEntry(BaseModel):
     checked_count: Optional[int] = None
     updated_count: Optional[int] = None
     error_count: Optional[int] = None
+    timeout_count: Optional[int] = None
+    tools_synced_count: Optional[int] = None
+    concurrency: Optional[int] = None
+    spread_seconds: Optional[float] = None
+    commit_batches: Optional[int] = None
+    timings: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     
     class Config:
@@ -197,7 +203,7 @@ async def trigger_immediate_check(
     try:
         # 백그라운드에서 즉시 실행
         import asyncio
-        asyncio.create_task(scheduler_service._check_all_servers_status())
+        asyncio.create_task(scheduler_service._check_all_servers_status(spread=False))
         
         return {"message": "Immediate server status check triggered"}
     except Exception as e:
@@ -130,6 +130,8 @@ class MCPSessionConfig(BaseModel):
     Controls the behavior of persistent MCP server sessions including:
     - How long to keep unused sessions alive
     - How frequently to check for expired sessions
+    - How many requests may be in flight on one session at once
+    - When per-server session pools add or remove worker processes
     """
     
     # Session timeout: How long to keep unused sessions alive (in minutes)
@@ -147,6 +149,42 @@ class MCPSessionConfig(BaseModel):
         default=5,
         description="Cleanup interval in minutes - how often to check for expired sessions"
     )
+    
+    # Max in-flight requests: How many JSON-RPC requests may be pipelined over one session
+    # Environment variable: MCP_SESSION_MAX_IN_FLIGHT
+    # Default: 32 requests
+    max_in_flight_requests: int = Field(
+        default=32,
+        ge=1,
+        description="Maximum concurrent in-flight requests per session - further calls wait for a free slot"
+    )
+    
+    # Pool scale-up threshold: Outstanding requests per replica that trigger a new worker process
+    # Environment variable: MCP_SESSION_POOL_SCALE_UP_THRESHOLD
+    # Default: 4 requests per replica
+    pool_scale_up_threshold: int = Field(
+        default=4,
+        ge=1,
+        description="Average outstanding requests per replica at which a server's session pool scales up"
+    )
+    
+    # Pool scale-down idle time: How long an extra replica may sit idle before it is stopped (in seconds)
+    # Environment variable: MCP_SESSION_POOL_SCALE_DOWN_IDLE_SECONDS
+    # Default: 120 seconds
+    pool_scale_down_idle_seconds: int = Field(
+        default=120,
+        ge=0,
+        description="Idle seconds after which replicas above a pool's min size are stopped"
+    )
+    
+    # Max message size: Largest single JSON-RPC message accepted from a server's stdout (in bytes)
+    # Environment variable: MCP_SESSION_MAX_MESSAGE_BYTES
+    # Default: 64 MiB
+    max_message_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=1024,
+        description="Maximum size of one MCP message - larger messages are discarded and fail their request"
+    )
 
 
 class Settings(BaseSettings):
@@ -1,7 +1,9 @@
 """Database configuration and session management."""
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Callable, Optional, TypeVar
 
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy import create_engine, text
@@ -114,6 +116,13 @@ SessionLocal = sessionmaker(
     bind=sync_engine
 )
 
+# Dedicated worker threads for legacy sync Session work called from async code
+# (kept separate from the default executor so DB waits cannot starve other to_thread users)
+SYNC_DB_WORKERS = int(os.getenv("DB_SYNC_WORKERS", "8"))
+_sync_db_executor = ThreadPoolExecutor(max_workers=SYNC_DB_WORKERS, thread_name_prefix="mcp-orch-db")
+
+T = TypeVar("T")
+
 
 async def init_db() -> None:
     """Initialize database tables."""
@@ -154,6 +163,58 @@ def get_db():
         db.close()
 
 
+async def run_sync_db(fn: Callable[..., T], *args, db: Optional[Session] = None) -> T:
+    """
+    Run fn(session, *args) in a DB worker thread without blocking the event loop.
+
+    Uses the caller's sync session when given (the caller must not use it
+    concurrently); otherwise a new session is opened and closed in the worker.
+    """
+    def call() -> T:
+        if db is not None:
+            return fn(db, *args)
+        session = SessionLocal()
+        try:
+            return fn(session, *args)
+        finally:
+            session.close()
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_sync_db_executor, call)
+
+
+def release_connection(db: Session) -> None:
+    """
+    Return the session's pooled connection before a long-lived response.
+
+    Streaming endpoints call this once they have loaded what they need, so an
+    idle SSE client does not pin a connection until the stream ends. close()
+    expunges every loaded ORM object: instances such as the authenticated user
+    become detached, and touching an unloaded attribute or lazy relationship
+    raises DetachedInstanceError. Copy what the stream needs first (as
+    ServerSnapshot does). A new query on the session checks out a fresh
+    connection, and the get_db() teardown close() becomes a no-op.
+    """
+    db.close()
+
+
+def get_pool_stats() -> dict:
+    """Checked-out / pooled connection counts for the sync and async engines."""
+    def describe(pool) -> dict:
+        return {
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+            "size": pool.size(),
+        }
+
+    return {
+        "sync": describe(sync_engine.pool),
+        "async": describe(engine.pool),
+        "max_connections": POOL_SIZE + MAX_OVERFLOW,
+    }
+
+
 def init_sync_db() -> None:
     """Initialize database tables (sync version)."""
     # Create mcp_orch schema if it doesn't exist
@@ -53,6 +53,10 @@ class McpServer(Base):
     transport_type = Column(String(50), default="stdio", nullable=False)
     compatibility_mode = Column(String(50), default="resource_connection", nullable=False, comment="MCP compatibility mode: resource_connection (single mode)")
     
+    # Session pool settings (worker processes per server)
+    pool_min_size = Column(Integer, default=1, nullable=False, comment="Minimum warm session replicas for this server")
+    pool_max_size = Column(Integer, default=1, nullable=False, comment="Maximum session replicas for this server")
+    
     # Status and control
     status = Column(SQLEnum(McpServerStatus), default=McpServerStatus.INACTIVE, nullable=False)
     is_enabled = Column(Boolean, default=True, nullable=False)
@@ -85,6 +89,9 @@ class McpServer(Base):
     # Metadata for server-specific information and failure tracking
     server_metadata = Column(JSON, default=dict, nullable=False, comment="Server metadata including failure tracking")
     
+    # Tool sync tracking
+    tools_hash = Column(String(64), nullable=True, comment="Content hash of the last synced tool list")
+    
     # Relationships
     project = relationship("Project", back_populates="servers")
     created_by = relationship("User")
@@ -266,6 +273,7 @@ class McpTool(Base):
     
     # Tool schema
     input_schema = Column(JSON, nullable=True)
+    content_hash = Column(String(64), nullable=True, comment="Content hash of display name, description and input schema")
     
     # Usage tracking
     call_count = Column(Integer, default=0, nullable=False)
@@ -0,0 +1,157 @@
+"""
+API 키 인증 캐시
+
+project_/mch_ API 키 인증 결과(키 ID, 프로젝트, 사용자)를 키 해시 기준
+LRU로 짧게 캐시해서 요청마다 반복되는 ApiKey/Project/User 조회를 생략합니다.
+
+- 최대 크기: MCP_API_KEY_CACHE_MAX_SIZE (기본 1024)
+- TTL: MCP_API_KEY_CACHE_TTL_SECONDS (기본 60초)
+- 키 폐기/삭제/수정 시 evict_api_key()로 즉시 제거
+- 캐시 히트 시 요청마다 새 User 인스턴스를 만들어 세션 간 객체 공유를 피함
+"""
+
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from ..models.user import User
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedApiKeyPrincipal:
+    """캐시된 API 키 인증 결과"""
+    api_key_id: UUID
+    project_id: UUID
+    rate_limit_per_minute: Optional[int]
+    rate_limit_per_day: Optional[int]
+    user_columns: Dict[str, Any]
+    expires_at: float
+
+    def build_user(self) -> User:
+        """캐시된 컬럼 값으로 detached User 인스턴스 생성 (요청마다 별도 객체)"""
+        user = User(**self.user_columns)
+        make_transient_to_detached(user)
+        return user
+
+
+class ApiKeyAuthCache:
+    """키 해시 기반 API 키 인증 LRU 캐시"""
+
+    def __init__(self, max_size: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        self.max_size = max(1, max_size if max_size is not None else int(
+            os.getenv('MCP_API_KEY_CACHE_MAX_SIZE', '1024')
+        ))
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv('MCP_API_KEY_CACHE_TTL_SECONDS', '60')
+        )
+        self._entries: "OrderedDict[str, CachedApiKeyPrincipal]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def hash_key(api_key: str) -> str:
+        """API 키 해시 (DB key_hash와 동일한 방식)"""
+        return hashlib.sha256(api_key.encode()).hexdigest()
+
+    def get(self, key_hash: str) -> Optional[CachedApiKeyPrincipal]:
+        """유효한 캐시 항목 조회 (LRU 갱신)"""
+        entry = self._entries.get(key_hash)
+        if entry is None:
+            self._misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key_hash]
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key_hash)
+        self._hits += 1
+        return entry
+
+    def peek(self, key_hash: str) -> Optional[CachedApiKeyPrincipal]:
+        """통계/LRU 순서에 영향 없이 항목 조회 (인증 직후 키 정보 참조용)"""
+        return self._entries.get(key_hash)
+
+    def put(self, key_hash: str, api_key_record: Any, user: User) -> CachedApiKeyPrincipal:
+        """인증 성공 결과 저장 - 가장 오래 사용되지 않은 항목부터 밀어냄"""
+        user_columns = {
+            attr.key: getattr(user, attr.key)
+            for attr in sa_inspect(User).column_attrs
+        }
+        entry = CachedApiKeyPrincipal(
+            api_key_id=api_key_record.id,
+            project_id=api_key_record.project_id,
+            rate_limit_per_minute=api_key_record.rate_limit_per_minute,
+            rate_limit_per_day=api_key_record.rate_limit_per_day,
+            user_columns=user_columns,
+            expires_at=time.monotonic() + self.ttl_seconds
+        )
+        self._entries[key_hash] = entry
+        self._entries.move_to_end(key_hash)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return entry
+
+    def evict_api_key(self, api_key_id: Any) -> int:
+        """특정 API 키의 캐시 항목 제거 - 폐기/삭제/설정 변경 시 호출"""
+        key_id = str(api_key_id)
+        stale = [key_hash for key_hash, entry in self._entries.items() if str(entry.api_key_id) == key_id]
+        for key_hash in stale:
+            del self._entries[key_hash]
+        self._evictions += len(stale)
+        if stale:
+            logger.info(f"🔄 [CACHE] Evicted API key {key_id} from auth cache")
+        return len(stale)
+
+    def evict_project(self, project_id: Any) -> int:
+        """프로젝트의 모든 API 키 캐시 항목 제거"""
+        project_key = str(project_id)
+        stale = [key_hash for key_hash, entry in self._entries.items() if str(entry.project_id) == project_key]
+        for key_hash in stale:
+            del self._entries[key_hash]
+        self._evictions += len(stale)
+        return len(stale)
+
+    def evict_user(self, user_id: Any) -> int:
+        """사용자 스냅샷을 담은 항목 제거 - 사용자 권한/상태 변경 시 호출"""
+        target = str(user_id)
+        stale = [
+            key_hash for key_hash, entry in self._entries.items()
+            if str(entry.user_columns.get("id")) == target
+        ]
+        for key_hash in stale:
+            del self._entries[key_hash]
+        self._evictions += len(stale)
+        return len(stale)
+
+    def clear(self):
+        """전체 캐시 비우기"""
+        self._evictions += len(self._entries)
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+# 글로벌 API 키 인증 캐시 인스턴스
+api_key_auth_cache = ApiKeyAuthCache()
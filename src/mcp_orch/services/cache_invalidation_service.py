@@ -30,13 +30,20 @@ class CacheInvalidationService:
         """
         
         try:
+            # 0. 🎯 프로젝트 툴 설정 캐시 무효화 (필터링 맵)
+            from .tool_filtering_service import ToolFilteringService
+            await ToolFilteringService.invalidate_cache(project_id, server_id)
+            
             # 1. 🔧 MCP 세션 매니저 캐시 무효화 (기존 시스템 통합)
             await CacheInvalidationService._invalidate_session_cache(project_id, server_id)
             
+            # 1-1. 📦 프로젝트 통합 도구 카탈로그 무효화
+            CacheInvalidationService._invalidate_tool_catalog(project_id)
+            
             # 2. 🗄️ PostgreSQL Materialized View 새로고침 (향후 적용)
             # await CacheInvalidationService._refresh_materialized_views(project_id, server_id)
             
-            # 3. 📡 활성 SSE 연결에 업데이트 알림 (향후 적용)
+            # 3. 📡 활성 SSE 연결에 업데이트 알림
             await CacheInvalidationService._notify_active_connections(
                 project_id, 
                 {
@@ -60,11 +67,10 @@ class CacheInvalidationService:
             from .mcp_session_manager import get_session_manager
             
             session_manager = await get_session_manager()
-            server_key = f"{project_id}.{server_id}"
+            server_key = str(server_id)  # 세션 매니저 정규 키 (서버 UUID)
             
-            if server_key in session_manager.sessions:
-                # 기존 세션의 툴 캐시 무효화
-                session_manager.sessions[server_key].tools_cache = None
+            if session_manager.invalidate_tools_cache(server_key):
+                # 기존 세션 풀의 툴 캐시 무효화
                 logger.info(f"🔄 [CACHE] Invalidated session cache: {server_key}")
             else:
                 logger.debug(f"🔍 [CACHE] No active session found for: {server_key}")
@@ -72,6 +78,17 @@ class CacheInvalidationService:
         except Exception as e:
             logger.error(f"❌ [CACHE] Session cache invalidation failed: {e}")
     
+    @staticmethod
+    def _invalidate_tool_catalog(project_id: UUID):
+        """프로젝트 통합 도구 카탈로그 무효화"""
+        try:
+            from .tool_catalog_cache import tool_catalog_cache
+            
+            tool_catalog_cache.invalidate(project_id)
+            
+        except Exception as e:
+            logger.error(f"❌ [CACHE] Tool catalog invalidation failed: {e}")
+    
     @staticmethod
     async def _refresh_materialized_views(project_id: UUID, server_id: UUID):
         """PostgreSQL Materialized View 새로고침 (향후 구현)"""
@@ -90,14 +107,19 @@ class CacheInvalidationService:
     
     @staticmethod
     async def _notify_active_connections(project_id: UUID, update_data: Dict[str, Any]):
-        """활성 SSE 연결에 업데이트 알림 (향후 구현)"""
+        """활성 SSE 연결에 notifications/tools/list_changed 전파 (연속 변경은 병합)"""
         try:
-            # TODO: SSE 연결 매니저와 통합하여 실시간 알림 구현
-            # - 프로젝트의 활성 SSE 연결 목록 조회
-            # - 각 연결에 업데이트 메시지 전송
-            # - 실패한 연결은 자동 정리
+            from .connection_registry import connection_registry
             
-            logger.info(f"📡 [CACHE] SSE notification prepared for project {project_id}: {update_data['type']}")
+            # 프로젝트의 영향받는 연결에만 전송, 실패한 연결은 레지스트리에서 자동 정리
+            scheduled = connection_registry.notify_tools_changed(
+                project_id, server_id=update_data.get("server_id")
+            )
+            
+            if scheduled:
+                logger.info(f"📡 [CACHE] tools/list_changed scheduled for project {project_id}: {update_data['type']}")
+            else:
+                logger.debug(f"📡 [CACHE] No active connections to notify in project {project_id}")
             
         except Exception as e:
             logger.error(f"❌ [CACHE] SSE notification failed: {e}")
@@ -145,4 +167,100 @@ class CacheInvalidationService:
             project_id=project_id,
             server_id=server_id,
             invalidation_type=f"user_preference_changed:{tool_name}"
-        )
\ No newline at end of file
+        )
+    
+    @staticmethod
+    async def on_server_created(project_id: UUID, server_id: UUID):
+        """서버 생성 시 자동 호출 - 생성 전에 캐시된 '서버 없음' 해석 결과 제거"""
+        try:
+            from .server_key_resolver import server_key_resolver
+            
+            removed = server_key_resolver.invalidate(project_id=project_id)
+            CacheInvalidationService._invalidate_tool_catalog(project_id)
+            await CacheInvalidationService._notify_active_connections(
+                project_id, {"type": "server_created", "server_id": str(server_id)}
+            )
+            logger.info(f"🔄 [CACHE] Server key cache invalidated on create: server {server_id} ({removed} entries)")
+            
+        except Exception as e:
+            logger.error(f"❌ [CACHE] Server creation cache invalidation failed: {e}")
+    
+    @staticmethod
+    async def on_server_renamed(project_id: UUID, server_id: UUID):
+        """서버 이름 변경 시 자동 호출 - 서버 키 해석 캐시 무효화"""
+        try:
+            from .server_key_resolver import server_key_resolver
+            
+            removed = server_key_resolver.invalidate(server_id=server_id, project_id=project_id)
+            CacheInvalidationService._invalidate_tool_catalog(project_id)
+            await CacheInvalidationService._notify_active_connections(
+                project_id, {"type": "server_renamed", "server_id": str(server_id)}
+            )
+            logger.info(f"🔄 [CACHE] Server key cache invalidated on rename: server {server_id} ({removed} entries)")
+            
+        except Exception as e:
+            logger.error(f"❌ [CACHE] Server key cache invalidation failed: {e}")
+    
+    @staticmethod
+    async def on_server_deleted(project_id: UUID, server_id: UUID):
+        """서버 삭제 시 자동 호출 - 서버 키 해석 캐시 무효화 및 세션 종료"""
+        try:
+            from .server_key_resolver import server_key_resolver
+            from .mcp_session_manager import get_session_manager
+            
+            removed = server_key_resolver.invalidate(server_id=server_id, project_id=project_id)
+            
+            CacheInvalidationService._invalidate_tool_catalog(project_id)
+            
+            session_manager = await get_session_manager()
+            await session_manager.close_session(str(server_id))
+            
+            await CacheInvalidationService._notify_active_connections(
+                project_id, {"type": "server_deleted", "server_id": str(server_id)}
+            )
+            
+            logger.info(f"🔄 [CACHE] Server key cache invalidated on delete: server {server_id} ({removed} entries)")
+            
+        except Exception as e:
+            logger.error(f"❌ [CACHE] Server deletion cache invalidation failed: {e}")
+    
+    @staticmethod
+    def on_api_key_revoked(api_key_id: UUID):
+        """API 키 삭제/비활성화/설정 변경 시 호출 - 인증 캐시에서 즉시 제거"""
+        try:
+            from .api_key_auth_cache import api_key_auth_cache
+            
+            api_key_auth_cache.evict_api_key(api_key_id)
+            
+        except Exception as e:
+            logger.error(f"❌ [CACHE] API key auth cache eviction failed: {e}")
+    
+    @staticmethod
+    def on_project_deleted(project_id: UUID):
+        """프로젝트 삭제 시 호출 - 프로젝트 API 키 인증 캐시와 프로젝트 단위 캐시 제거"""
+        try:
+            from .api_key_auth_cache import api_key_auth_cache
+            from .server_key_resolver import server_key_resolver
+            from .tool_preference_cache import tool_preference_cache
+            
+            evicted = api_key_auth_cache.evict_project(project_id)
+            server_key_resolver.invalidate(project_id=project_id)
+            tool_preference_cache.invalidate(project_id)
+            CacheInvalidationService._invalidate_tool_catalog(project_id)
+            logger.info(f"🔄 [CACHE] Project caches cleared on delete: project {project_id} ({evicted} API keys)")
+            
+        except Exception as e:
+            logger.error(f"❌ [CACHE] Project deletion cache invalidation failed: {e}")
+    
+    @staticmethod
+    def on_user_changed(user_id: UUID):
+        """사용자 권한/상태 변경 시 호출 - JWT/API 키 인증 캐시의 사용자 스냅샷 제거"""
+        try:
+            from .api_key_auth_cache import api_key_auth_cache
+            from .jwt_verification_cache import jwt_verification_cache
+            
+            jwt_verification_cache.evict_user(user_id)
+            api_key_auth_cache.evict_user(user_id)
+            
+        except Exception as e:
+            logger.error(f"❌ [CACHE] User auth cache eviction failed: {e}")
@@ -0,0 +1,185 @@
+"""
+활성 MCP 클라이언트 연결 레지스트리
+
+여러 전송 계층(개별 SSE, Unified SSE, 표준 SSE, Streamable HTTP GET 스트림, python-sdk SSE 브리지)의
+살아있는 연결을 프로젝트 단위로 추적하고, 툴 변경 시
+notifications/tools/list_changed를 해당 프로젝트 연결에만 전파합니다.
+
+짧은 시간 안에 연속으로 들어오는 변경(일괄 설정 변경 등)은
+MCP_TOOLS_CHANGED_COALESCE_MS 동안 모아서 연결당 한 번만 알립니다.
+"""
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+TOOLS_LIST_CHANGED_NOTIFICATION = {
+    "jsonrpc": "2.0",
+    "method": "notifications/tools/list_changed"
+}
+
+# 프로젝트 전체 변경 표시 (서버 단위가 아닌 변경)
+_ALL_SERVERS = "*"
+
+
+@dataclass
+class ConnectionEntry:
+    """등록된 클라이언트 연결"""
+    connection_id: str
+    project_id: UUID
+    transport_type: str
+    send: Callable[[Dict[str, Any]], Awaitable[None]]
+    server_id: Optional[UUID] = None  # None이면 프로젝트 전체 서버(Unified)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+    def is_affected_by(self, changed_servers: Set[str]) -> bool:
+        """변경된 서버 집합이 이 연결에 영향을 주는지"""
+        if self.server_id is None or _ALL_SERVERS in changed_servers:
+            return True
+        return str(self.server_id) in changed_servers
+
+
+class ConnectionRegistry:
+    """프로젝트별 활성 연결 레지스트리"""
+
+    def __init__(self, coalesce_seconds: Optional[float] = None):
+        self.coalesce_seconds = coalesce_seconds if coalesce_seconds is not None else (
+            float(os.getenv('MCP_TOOLS_CHANGED_COALESCE_MS', '250')) / 1000
+        )
+        self._connections: Dict[str, ConnectionEntry] = {}
+        self._by_project: Dict[UUID, Set[str]] = {}
+        self._pending_changes: Dict[UUID, Set[str]] = {}
+        self._flush_tasks: Dict[UUID, asyncio.Task] = {}
+        self._notifications_sent = 0
+        self._changes_coalesced = 0
+        self._send_failures = 0
+
+    def register(
+        self,
+        connection_id: str,
+        project_id: UUID,
+        transport_type: str,
+        send: Callable[[Dict[str, Any]], Awaitable[None]],
+        server_id: Optional[UUID] = None
+    ) -> ConnectionEntry:
+        """연결 등록"""
+        entry = ConnectionEntry(
+            connection_id=connection_id,
+            project_id=project_id,
+            transport_type=transport_type,
+            send=send,
+            server_id=server_id
+        )
+        self._connections[connection_id] = entry
+        self._by_project.setdefault(project_id, set()).add(connection_id)
+        logger.debug(f"📡 Registered {transport_type} connection {connection_id} for project {project_id}")
+        return entry
+
+    def unregister(self, connection_id: str):
+        """연결 해제 (없으면 무시)"""
+        entry = self._connections.pop(connection_id, None)
+        if entry is None:
+            return
+        project_connections = self._by_project.get(entry.project_id)
+        if project_connections is not None:
+            project_connections.discard(connection_id)
+            if not project_connections:
+                del self._by_project[entry.project_id]
+        logger.debug(f"📡 Unregistered {entry.transport_type} connection {connection_id}")
+
+    def connections_for_project(self, project_id: UUID) -> List[ConnectionEntry]:
+        """프로젝트의 활성 연결 목록"""
+        return [
+            self._connections[connection_id]
+            for connection_id in self._by_project.get(project_id, ())
+            if connection_id in self._connections
+        ]
+
+    def notify_tools_changed(self, project_id: UUID, server_id: Optional[Any] = None) -> bool:
+        """
+        툴 변경 알림 예약 - 병합 구간이 끝나면 한 번에 전송
+
+        Returns:
+            bool: 알림 대상 연결이 있어 예약되었는지 여부
+        """
+        if project_id not in self._by_project:
+            return False
+
+        changes = self._pending_changes.setdefault(project_id, set())
+        if changes:
+            self._changes_coalesced += 1
+        changes.add(str(server_id) if server_id else _ALL_SERVERS)
+
+        flush_task = self._flush_tasks.get(project_id)
+        if flush_task is None or flush_task.done():
+            self._flush_tasks[project_id] = asyncio.create_task(self._flush_project(project_id))
+        return True
+
+    async def _flush_project(self, project_id: UUID):
+        """병합 구간 후 영향받는 연결에 list_changed 전송"""
+        try:
+            await asyncio.sleep(self.coalesce_seconds)
+            changed_servers = self._pending_changes.pop(project_id, set())
+            # 전송 중에 들어오는 변경은 새 병합 구간으로 예약되도록 먼저 해제
+            self._flush_tasks.pop(project_id, None)
+            targets = [
+                entry for entry in self.connections_for_project(project_id)
+                if entry.is_affected_by(changed_servers)
+            ]
+            if not targets:
+                return
+
+            results = await asyncio.gather(
+                *(entry.send(dict(TOOLS_LIST_CHANGED_NOTIFICATION)) for entry in targets),
+                return_exceptions=True
+            )
+            for entry, result in zip(targets, results):
+                if isinstance(result, Exception):
+                    self._send_failures += 1
+                    logger.warning(f"⚠️ Failed to notify connection {entry.connection_id}, removing: {result}")
+                    self.unregister(entry.connection_id)
+                else:
+                    self._notifications_sent += 1
+
+            logger.info(f"📡 [CACHE] Sent tools/list_changed to {len(targets)} connections in project {project_id}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Error sending tools/list_changed for project {project_id}: {e}")
+        finally:
+            if self._flush_tasks.get(project_id) is asyncio.current_task():
+                del self._flush_tasks[project_id]
+
+    def project_counts(self) -> Dict[str, Dict[str, int]]:
+        """프로젝트별 전송 계층별 활성 연결 수"""
+        counts: Dict[str, Dict[str, int]] = {}
+        for entry in self._connections.values():
+            project_counts = counts.setdefault(str(entry.project_id), {})
+            project_counts[entry.transport_type] = project_counts.get(entry.transport_type, 0) + 1
+        return counts
+
+    def get_stats(self) -> Dict[str, Any]:
+        """연결 및 알림 통계"""
+        by_transport: Dict[str, int] = {}
+        for entry in self._connections.values():
+            by_transport[entry.transport_type] = by_transport.get(entry.transport_type, 0) + 1
+        return {
+            "total_connections": len(self._connections),
+            "by_project": {str(project_id): len(ids) for project_id, ids in self._by_project.items()},
+            "by_project_transport": self.project_counts(),
+            "by_transport": by_transport,
+            "notifications_sent": self._notifications_sent,
+            "changes_coalesced": self._changes_coalesced,
+            "send_failures": self._send_failures,
+            "coalesce_seconds": self.coalesce_seconds,
+        }
+
+
+# 글로벌 연결 레지스트리 인스턴스
+connection_registry = ConnectionRegistry()
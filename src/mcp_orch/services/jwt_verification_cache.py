@@ -0,0 +1,156 @@
+"""
+검증된 JWT 캐시
+
+JWT 토큰 다이제스트(sha256) 기준으로 디코딩/검증이 끝난 클레임과
+사용자 스냅샷을 LRU로 캐시해서, 같은 토큰의 반복 요청에서
+base64 헤더 파싱, jwt.decode, User 조회를 생략합니다.
+
+- 클레임: 토큰의 exp 까지 유효 (exp가 없으면 MCP_JWT_CACHE_MAX_TTL_SECONDS)
+- 사용자 스냅샷: MCP_JWT_USER_CACHE_TTL_SECONDS (기본 60초) 마다 재조회
+- 최대 크기: MCP_JWT_CACHE_MAX_SIZE (기본 2048)
+- 사용자 권한/상태 변경 시 evict_user()로 즉시 제거
+"""
+
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from ..models.user import User
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VerifiedToken:
+    """검증된 JWT 캐시 항목"""
+    claims: Dict[str, Any]
+    expires_at: float  # epoch 초 (토큰 exp)
+    user_columns: Optional[Dict[str, Any]] = None
+    user_expires_at: float = 0.0
+
+    @property
+    def user_id(self) -> Optional[str]:
+        return self.claims.get("sub") or self.claims.get("id")
+
+    def build_user(self) -> Optional[User]:
+        """캐시된 사용자 스냅샷으로 detached User 생성 (만료 시 None)"""
+        if self.user_columns is None or self.user_expires_at <= time.time():
+            return None
+        user = User(**self.user_columns)
+        make_transient_to_detached(user)
+        return user
+
+
+class JwtVerificationCache:
+    """토큰 다이제스트 기반 검증 JWT LRU 캐시"""
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        max_ttl_seconds: Optional[float] = None,
+        user_ttl_seconds: Optional[float] = None
+    ):
+        self.max_size = max(1, max_size if max_size is not None else int(
+            os.getenv('MCP_JWT_CACHE_MAX_SIZE', '2048')
+        ))
+        self.max_ttl_seconds = max_ttl_seconds if max_ttl_seconds is not None else float(
+            os.getenv('MCP_JWT_CACHE_MAX_TTL_SECONDS', '3600')
+        )
+        self.user_ttl_seconds = user_ttl_seconds if user_ttl_seconds is not None else float(
+            os.getenv('MCP_JWT_USER_CACHE_TTL_SECONDS', '60')
+        )
+        self._entries: "OrderedDict[str, VerifiedToken]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._user_hits = 0
+        self._evictions = 0
+
+    @staticmethod
+    def digest(token: str) -> str:
+        """토큰 다이제스트 - 원본 토큰은 메모리에 키로 보관하지 않음"""
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[VerifiedToken]:
+        """만료되지 않은 검증 결과 조회 (LRU 갱신)"""
+        key = self.digest(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        if entry.expires_at <= time.time():
+            del self._entries[key]
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry
+
+    def store_claims(self, token: str, claims: Dict[str, Any]) -> VerifiedToken:
+        """검증된 클레임 저장 - exp까지, 최대 max_ttl_seconds"""
+        now = time.time()
+        expires_at = now + self.max_ttl_seconds
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+
+        key = self.digest(token)
+        entry = VerifiedToken(claims=claims, expires_at=expires_at)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return entry
+
+    def get_user(self, entry: VerifiedToken) -> Optional[User]:
+        """항목의 사용자 스냅샷 조회"""
+        user = entry.build_user()
+        if user is not None:
+            self._user_hits += 1
+        return user
+
+    def store_user(self, entry: VerifiedToken, user: User):
+        """DB에서 조회한 사용자 스냅샷을 항목에 저장"""
+        entry.user_columns = {
+            attr.key: getattr(user, attr.key)
+            for attr in sa_inspect(User).column_attrs
+        }
+        entry.user_expires_at = min(entry.expires_at, time.time() + self.user_ttl_seconds)
+
+    def evict_user(self, user_id: Any) -> int:
+        """사용자의 모든 토큰 항목 제거 - 권한/상태 변경 시 호출"""
+        target = str(user_id)
+        stale = [key for key, entry in self._entries.items() if str(entry.user_id) == target]
+        for key in stale:
+            del self._entries[key]
+        self._evictions += len(stale)
+        return len(stale)
+
+    def clear(self):
+        """전체 캐시 비우기"""
+        self._evictions += len(self._entries)
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "user_hits": self._user_hits,
+            "evictions": self._evictions,
+            "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            "user_ttl_seconds": self.user_ttl_seconds,
+        }
+
+
+# 글로벌 JWT 검증 캐시 인스턴스
+jwt_verification_cache = JwtVerificationCache()
@@ -14,6 +14,7 @@ Components:
 - config_manager: Configuration management
 - logger: MCP-specific logging
 - error_handler: Error processing and classification
+- framing: Newline-delimited JSON-RPC stdio framing
 - orchestrator: Unified facade for backward compatibility
 """
 
@@ -33,6 +34,7 @@ from .status_checker import McpStatusChecker
 from .config_manager import McpConfigManager
 from .logger import McpLogger
 from .error_handler import McpErrorHandler
+from .framing import JsonLineDecoder, MessageTooLargeError
 
 # Import orchestrator components without circular dependency
 def get_orchestrator():
@@ -59,6 +61,8 @@ __all__ = [
     'McpConfigManager',
     'McpLogger',
     'McpErrorHandler',
+    'JsonLineDecoder',
+    'MessageTooLargeError',
     'get_orchestrator',
     'get_connection_service'
 ]
\ No newline at end of file
@@ -53,7 +53,9 @@ class McpConfigManager(IMcpConfigManager):
                 "env": db_server.env or {},
                 "timeout": db_server.timeout or self.default_timeout,
                 "is_enabled": db_server.is_enabled,
-                "project_id": str(db_server.project_id)
+                "project_id": str(db_server.project_id),
+                "pool_min_size": db_server.pool_min_size,
+                "pool_max_size": db_server.pool_max_size
             }
             
             # Add optional fields if present
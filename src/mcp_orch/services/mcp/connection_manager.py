@@ -181,50 +181,93 @@ class McpConnectionManager(IMcpConnectionManager):
                 env=full_env
             )
             
-            # Send initialization message
-            init_json = json.dumps(init_message) + '\n'
-            process.stdin.write(init_json.encode())
-            await process.stdin.drain()
+            # Drain stderr concurrently so a chatty server cannot block on a full pipe
+            stderr_buffer = bytearray()
+            stderr_task = asyncio.create_task(self._drain_probe_stderr(process.stderr, stderr_buffer))
             
-            # Wait for response with timeout
             try:
-                stdout_data, stderr_data = await asyncio.wait_for(
-                    process.communicate(), timeout=timeout
+                # Send initialization message
+                init_json = json.dumps(init_message) + '\n'
+                process.stdin.write(init_json.encode())
+                await process.stdin.drain()
+                
+                # Wait only for the initialize response, not for the process to exit
+                succeeded = await asyncio.wait_for(
+                    self._read_probe_response(process.stdout, init_message["id"]), timeout=timeout
                 )
                 
-                if process.returncode == 0:
-                    # Parse response
-                    response_lines = stdout_data.decode().strip().split('\n')
-                    logger.debug(f"📥 MCP server response lines: {len(response_lines)}")
-                    
-                    for line in response_lines:
-                        if line.strip():
-                            try:
-                                response = json.loads(line)
-                                if response.get('id') == 1 and 'result' in response:
-                                    logger.debug("✅ MCP connection test successful")
-                                    return True
-                            except json.JSONDecodeError:
-                                logger.debug(f"⚠️ Failed to parse JSON: {line[:100]}")
-                                continue
+                if succeeded:
+                    logger.debug("✅ MCP connection test successful")
+                    return True
                 
                 logger.debug("❌ MCP connection test failed - no valid response")
-                if stderr_data:
-                    error_msg = self.error_handler.extract_meaningful_error(stderr_data.decode())
+                if stderr_buffer:
+                    error_msg = self.error_handler.extract_meaningful_error(stderr_buffer.decode(errors='replace'))
                     logger.debug(f"Error details: {error_msg}")
                 
                 return False
                 
             except asyncio.TimeoutError:
                 logger.debug("⏰ MCP connection test timed out")
-                process.kill()
-                await process.wait()
                 return False
+            finally:
+                # The probe has served its purpose - kill it right away
+                await self._kill_probe(process)
+                stderr_task.cancel()
                 
         except Exception as e:
             logger.error(f"MCP connection test failed: {e}")
             return False
     
+    async def _read_probe_response(self, stdout: asyncio.StreamReader, request_id: int) -> bool:
+        """Read stdout lines until the response for request_id arrives (or EOF)"""
+        while True:
+            try:
+                line = await stdout.readline()
+            except (asyncio.LimitOverrunError, ValueError):
+                logger.debug("⚠️ MCP probe output line exceeded buffer limit")
+                return False
+            if not line:
+                return False
+            
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                logger.debug(f"⚠️ Failed to parse JSON: {line[:100]}")
+                continue
+            
+            if isinstance(response, dict) and response.get('id') == request_id:
+                return 'result' in response
+    
+    @staticmethod
+    async def _drain_probe_stderr(stderr: asyncio.StreamReader, buffer: bytearray, limit: int = 65536):
+        """Collect up to limit bytes of stderr for error reporting, discard the rest"""
+        try:
+            while True:
+                chunk = await stderr.read(4096)
+                if not chunk:
+                    break
+                if len(buffer) < limit:
+                    buffer.extend(chunk[:limit - len(buffer)])
+        except asyncio.CancelledError:
+            pass
+    
+    @staticmethod
+    async def _kill_probe(process: asyncio.subprocess.Process):
+        """Kill a probe process and reap it"""
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        try:
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except asyncio.TimeoutError:
+            logger.warning(f"⚠️ MCP probe process {process.pid} did not exit after kill")
+    
     async def is_connection_alive(self, connection: McpConnection) -> bool:
         """
         Check if existing connection is still alive
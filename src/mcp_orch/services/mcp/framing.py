@@ -0,0 +1,140 @@
+"""
+MCP stdio Message Framing
+
+Newline-delimited JSON-RPC framing over a byte stream. Incoming chunks are
+appended to a single bytearray; newline scanning resumes from the last
+scanned offset so each byte is inspected once, and only complete lines are
+handed to the JSON parser (which accepts UTF-8 bytes directly).
+"""
+
+import re
+from typing import Any, Optional
+
+# Bytes requested from the stream per read
+READ_CHUNK_SIZE = 65536
+
+# Bytes of an oversized message kept for diagnostics / request id recovery
+OVERSIZED_PREFIX_BYTES = 1024
+
+_ID_PATTERN = re.compile(rb'"id"\s*:\s*("(?:[^"\\]|\\.)*"|-?\d+)')
+_BODY_PATTERN = re.compile(rb'"(?:result|error)"\s*:')
+
+
+class MessageTooLargeError(ValueError):
+    """Raised when a single message exceeds the configured maximum size"""
+
+    def __init__(self, size: int, max_size: int, prefix: bytes):
+        super().__init__(f"MCP message exceeds maximum size ({size} > {max_size} bytes)")
+        self.size = size
+        self.max_size = max_size
+        self.prefix = prefix
+
+    @property
+    def request_id(self) -> Optional[Any]:
+        """Best-effort JSON-RPC id from the message prefix (None if not found)"""
+        body = _BODY_PATTERN.search(self.prefix)
+        head = self.prefix[:body.start()] if body else self.prefix
+        match = _ID_PATTERN.search(head)
+        if not match:
+            return None
+        raw = match.group(1)
+        if raw.startswith(b'"'):
+            return raw[1:-1].decode('utf-8', errors='replace')
+        return int(raw)
+
+
+class JsonLineDecoder:
+    """
+    Incremental newline framing decoder
+
+    Usage:
+        decoder.feed(chunk)
+        while (line := decoder.next_line()) is not None:
+            message = json.loads(line)
+
+    A message larger than max_message_bytes raises MessageTooLargeError once;
+    the rest of that line is discarded and decoding resumes at the next line.
+    """
+
+    def __init__(self, max_message_bytes: int):
+        self.max_message_bytes = max_message_bytes
+        self._buffer = bytearray()
+        self._start = 0  # start of the first unconsumed line
+        self._scan = 0  # position from which to resume the newline search
+        self._discarding = False
+        self._discarded = 0
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Bytes received but not yet returned as a complete line"""
+        return len(self._buffer) - self._start
+
+    def feed(self, data: bytes) -> None:
+        """Append a chunk read from the stream"""
+        self._buffer += data
+
+    def next_line(self) -> Optional[bytes]:
+        """
+        Return the next complete, non-empty line (without the newline)
+
+        Returns:
+            Optional[bytes]: line bytes, or None when more data is needed
+
+        Raises:
+            MessageTooLargeError: a line grew past max_message_bytes
+        """
+        while True:
+            newline = self._buffer.find(b'\n', self._scan)
+
+            if newline < 0:
+                self._scan = len(self._buffer)
+                self._compact()
+                if self._discarding:
+                    self._discarded += len(self._buffer)
+                    self._buffer.clear()
+                    self._scan = 0
+                elif len(self._buffer) > self.max_message_bytes:
+                    self._begin_discard()
+                return None
+
+            start = self._start
+            self._start = self._scan = newline + 1
+
+            if self._discarding:
+                # End of an oversized line - resume normal decoding
+                self._discarding = False
+                self._discarded = 0
+                continue
+
+            size = newline - start
+            if size > self.max_message_bytes:
+                prefix = bytes(self._buffer[start:start + OVERSIZED_PREFIX_BYTES])
+                raise MessageTooLargeError(size, self.max_message_bytes, prefix)
+
+            line = bytes(memoryview(self._buffer)[start:newline]).strip()
+            if line:
+                return line
+
+    def reset(self) -> None:
+        """Drop all buffered data"""
+        self._buffer = bytearray()
+        self._start = self._scan = 0
+        self._discarding = False
+        self._discarded = 0
+
+    def _compact(self) -> None:
+        """Release consumed bytes (amortized: only the partial line is moved)"""
+        if self._start:
+            del self._buffer[:self._start]
+            self._scan -= self._start
+            self._start = 0
+
+    def _begin_discard(self) -> None:
+        """Switch to discarding the current oversized line"""
+        size = len(self._buffer)
+        prefix = bytes(self._buffer[:OVERSIZED_PREFIX_BYTES])
+        self._discarding = True
+        self._discarded = size
+        self._buffer.clear()
+        self._scan = 0
+        raise MessageTooLargeError(size, self.max_message_bytes, prefix)
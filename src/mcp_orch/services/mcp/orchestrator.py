@@ -126,11 +126,15 @@ class McpOrchestrator:
         server_id: str, 
         server_config: Dict, 
         db: Optional[Session] = None, 
-        project_id: Optional[str] = None
+        project_id: Optional[str] = None,
+        raise_on_error: bool = False
     ) -> List[Dict]:
         """
         BACKWARD COMPATIBILITY: Original get_server_tools method
         Delegates to session manager (for now) but can be gradually migrated
+        
+        Failures return [] unless raise_on_error is set, so callers that cache
+        the result can tell a failed server from one with no tools.
         """
         try:
             logger.info(f"🔧 Getting tools for server {server_id}")
@@ -144,10 +148,14 @@ class McpOrchestrator:
             from ..mcp_session_manager import get_session_manager
             
             session_manager = await get_session_manager()
-            return await session_manager.get_server_tools(server_id, server_config)
+            return await session_manager.get_server_tools(
+                server_id, server_config, raise_on_error=raise_on_error
+            )
                 
         except Exception as e:
             logger.error(f"❌ Error getting tools for server {server_id}: {e}")
+            if raise_on_error:
+                raise
             return []
     
     async def call_tool(
@@ -12,6 +12,7 @@ Extracted from mcp_connection_service.py to follow Single Responsibility Princip
 
 import asyncio
 import logging
+import os
 from typing import Dict, Optional, Any
 from datetime import datetime, timedelta
 
@@ -41,6 +42,7 @@ class McpStatusChecker(IMcpStatusChecker):
         # Status caching to avoid excessive checks
         self.status_cache: Dict[str, Dict] = {}
         self.cache_duration = timedelta(seconds=30)  # Cache status for 30 seconds
+        self.ping_timeout = float(os.getenv('MCP_STATUS_PING_TIMEOUT_SECONDS', '5'))
         
     async def check_server_status(self, server_id: str, server_config: Dict) -> str:
         """
@@ -67,8 +69,10 @@ class McpStatusChecker(IMcpStatusChecker):
             # Perform actual status check
             logger.debug(f"🔍 Checking real-time status for server {server_id}")
             
-            # Test connection to determine status
-            is_online = await self.connection_manager.test_connection(server_config)
+            # Prefer a ping over the live session; only spawn a probe when none exists
+            is_online = await self._ping_live_session(server_id)
+            if is_online is None:
+                is_online = await self.connection_manager.test_connection(server_config)
             
             if is_online:
                 status = "online"
@@ -90,6 +94,25 @@ class McpStatusChecker(IMcpStatusChecker):
             
             return "error"
     
+    async def _ping_live_session(self, server_id: str) -> Optional[bool]:
+        """
+        Check status through an existing persistent session
+        
+        Returns:
+            Optional[bool]: ping result, or None when the server has no live session
+        """
+        try:
+            from ..mcp_session_manager import get_session_manager
+            
+            session_manager = await get_session_manager()
+            result = await session_manager.ping_session(server_id, timeout=self.ping_timeout)
+            if result is not None:
+                logger.debug(f"🏓 Status for server {server_id} from live session ping: {result}")
+            return result
+        except Exception as e:
+            logger.debug(f"Live session ping unavailable for server {server_id}: {e}")
+            return None
+    
     async def validate_server_config(self, server_config: Dict) -> bool:
         """
         Validate server configuration
@@ -191,19 +214,14 @@ class McpStatusChecker(IMcpStatusChecker):
                     "error": str(e)
                 }
             
-            # Connection test (if not disabled)
+            # Connection test (if not disabled) - the status check above already
+            # pinged the live session or ran a probe, so reuse its result
             if server_config.get('is_enabled', True):
-                try:
-                    connection_test = await self.connection_manager.test_connection(server_config)
-                    health_info["checks"]["connection_test"] = {
-                        "passed": connection_test,
-                        "result": "success" if connection_test else "failed"
-                    }
-                except Exception as e:
-                    health_info["checks"]["connection_test"] = {
-                        "passed": False,
-                        "error": str(e)
-                    }
+                connection_test = health_info["status"] == "online"
+                health_info["checks"]["connection_test"] = {
+                    "passed": connection_test,
+                    "result": "success" if connection_test else "failed"
+                }
             else:
                 health_info["checks"]["connection_test"] = {
                     "passed": True,
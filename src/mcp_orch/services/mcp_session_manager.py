@@ -4,7 +4,6 @@ MCP Python SDK의 ClientSession 패턴을 따른 지속적 세션 관리
 """
 
 import asyncio
-import json
 import logging
 import time
 from typing import Dict, List, Optional, Any, Union, Tuple
@@ -13,10 +12,14 @@ from uuid import UUID
 from dataclasses import dataclass, field
 from sqlalchemy.orm import Session
 
-from ..models import McpServer, ToolCallLog, CallStatus, ClientSession, ServerLog, LogLevel, LogCategory
+from ..models import McpServer, CallStatus, ClientSession, ServerLog, LogLevel, LogCategory
 from ..models.mcp_server import McpServerStatus
 from ..config import MCPSessionConfig
 from .server_status_service import ServerStatusService
+from .server_key_resolver import ServerKeyResolver, server_key_resolver
+from .tool_call_log_writer import tool_call_log_writer
+from .mcp.framing import READ_CHUNK_SIZE, JsonLineDecoder, MessageTooLargeError
+from ..utils.json_codec import json_codec
 
 logger = logging.getLogger(__name__)
 
@@ -33,9 +36,45 @@ class McpSession:
     last_used_at: datetime
     tools_cache: Optional[List[Dict]] = None
     is_initialized: bool = False
+    server_info: Optional[Dict] = None  # initialize 응답 result (프로토콜 버전, capabilities 등)
     initialization_lock: Optional[asyncio.Lock] = None
-    _read_buffer: str = ""  # MCP 메시지 읽기용 버퍼
-    _message_queue: List[Dict] = field(default_factory=list)  # 순서가 맞지 않는 메시지 임시 저장용
+    request_semaphore: Optional[asyncio.Semaphore] = None  # 세션당 동시 요청 수 제한
+    _decoder: Optional[JsonLineDecoder] = None  # stdout 줄 단위 프레이밍 디코더
+    _pending_requests: Dict[Any, asyncio.Future] = field(default_factory=dict)  # 요청 ID별 응답 대기 Future
+    _reader_task: Optional[asyncio.Task] = None  # 응답 라우팅용 백그라운드 읽기 태스크
+    _queued_requests: int = 0  # 동시 요청 슬롯을 기다리는 요청 수
+
+    @property
+    def outstanding_requests(self) -> int:
+        """응답 대기 중이거나 전송 대기 중인 요청 수"""
+        return len(self._pending_requests) + self._queued_requests
+
+
+@dataclass
+class McpSessionPool:
+    """하나의 MCP 서버에 대한 워커 프로세스(세션) 풀"""
+    server_id: str
+    min_size: int = 1
+    max_size: int = 1
+    replicas: List[McpSession] = field(default_factory=list)
+    scale_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    _scaling_task: Optional[asyncio.Task] = None
+
+    @property
+    def outstanding_requests(self) -> int:
+        """풀 전체의 미처리 요청 수 (큐 깊이)"""
+        return sum(replica.outstanding_requests for replica in self.replicas)
+
+    @property
+    def last_used_at(self) -> Optional[datetime]:
+        """풀에서 가장 최근에 사용된 시각"""
+        return max((replica.last_used_at for replica in self.replicas), default=None)
+
+    def least_loaded(self) -> Optional[McpSession]:
+        """미처리 요청이 가장 적은 세션 (least-outstanding-requests)"""
+        if not self.replicas:
+            return None
+        return min(self.replicas, key=lambda replica: replica.outstanding_requests)
 
 
 class ToolExecutionError(Exception):
@@ -67,11 +106,15 @@ class McpSessionManager:
             import os
             config = MCPSessionConfig(
                 session_timeout_minutes=int(os.getenv('MCP_SESSION_TIMEOUT_MINUTES', '30')),
-                cleanup_interval_minutes=int(os.getenv('MCP_SESSION_CLEANUP_INTERVAL_MINUTES', '5'))
+                cleanup_interval_minutes=int(os.getenv('MCP_SESSION_CLEANUP_INTERVAL_MINUTES', '5')),
+                max_in_flight_requests=int(os.getenv('MCP_SESSION_MAX_IN_FLIGHT', '32')),
+                pool_scale_up_threshold=int(os.getenv('MCP_SESSION_POOL_SCALE_UP_THRESHOLD', '4')),
+                pool_scale_down_idle_seconds=int(os.getenv('MCP_SESSION_POOL_SCALE_DOWN_IDLE_SECONDS', '120')),
+                max_message_bytes=int(os.getenv('MCP_SESSION_MAX_MESSAGE_BYTES', str(64 * 1024 * 1024)))
             )
             
         self.config = config
-        self.sessions: Dict[str, McpSession] = {}
+        self.pools: Dict[str, McpSessionPool] = {}
         self.session_timeout = timedelta(minutes=config.session_timeout_minutes)
         self.cleanup_interval = timedelta(minutes=config.cleanup_interval_minutes)
         self._cleanup_task: Optional[asyncio.Task] = None
@@ -80,11 +123,14 @@ class McpSessionManager:
         logger.info(f"🔧 MCP Session Manager initialized:")
         logger.info(f"   Session timeout: {config.session_timeout_minutes} minutes")
         logger.info(f"   Cleanup interval: {config.cleanup_interval_minutes} minutes")
+        logger.info(f"   Max in-flight requests per session: {config.max_in_flight_requests}")
+        logger.info(f"   Pool scale-up threshold: {config.pool_scale_up_threshold} requests/replica")
         
     async def start_manager(self):
         """세션 매니저 시작 - 정리 작업 스케줄링"""
         if self._cleanup_task is None:
             self._cleanup_task = asyncio.create_task(self._cleanup_expired_sessions())
+            tool_call_log_writer.start()
             logger.info("🟢 MCP Session Manager started")
     
     async def stop_manager(self):
@@ -98,9 +144,11 @@ class McpSessionManager:
             self._cleanup_task = None
             
         # 모든 활성 세션 종료
-        for session in list(self.sessions.values()):
-            await self._close_session(session)
-        self.sessions.clear()
+        for server_id in list(self.pools.keys()):
+            await self.close_session(server_id)
+        
+        # 대기 중인 도구 호출 로그 저장
+        await tool_call_log_writer.stop()
         logger.info("🔴 MCP Session Manager stopped")
     
     def _get_next_message_id(self) -> int:
@@ -108,80 +156,183 @@ class McpSessionManager:
         self._message_id_counter += 1
         return self._message_id_counter
     
-    def _resolve_server_id(self, server_id: str) -> Tuple[Optional[UUID], Optional[UUID]]:
+    async def _resolve_server_id(self, server_id: str) -> Tuple[Optional[UUID], Optional[UUID]]:
         """
         server_id를 해석해서 (project_id, actual_server_id) 튜플 반환
         
         Args:
-            server_id: "project_id.server_name" 형식 또는 UUID 문자열
+            server_id: "project_id.server_name", "project_id_server_name" 형식 또는 UUID 문자열
             
         Returns:
             tuple: (project_id, actual_server_id) - 둘 다 UUID 또는 None
         """
-        if '.' in server_id:
-            try:
-                project_id_str, server_name = server_id.split('.', 1)
-                project_id = UUID(project_id_str)
-                
-                # DB에서 실제 서버 ID 조회
-                from ..database import get_db
-                from ..models import McpServer
-                db = next(get_db())
-                try:
-                    server = db.query(McpServer).filter(
-                        McpServer.project_id == project_id,
-                        McpServer.name == server_name
-                    ).first()
-                    if server:
-                        logger.debug(f"Resolved server_id {server_id} to project={project_id}, server={server.id}")
-                        return project_id, server.id
-                    else:
-                        logger.warning(f"Server not found for {server_id}")
-                        return project_id, None
-                finally:
-                    db.close()
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Failed to parse server_id format {server_id}: {e}")
-                return None, None
-        else:
-            # UUID 또는 UUID_server_name 형식 처리
-            try:
-                # '_'가 포함된 경우 UUID 부분만 추출
-                if '_' in server_id:
-                    uuid_part = server_id.split('_')[0]
-                    actual_server_id = UUID(uuid_part)
-                    logger.debug(f"Extracted UUID {uuid_part} from server_id {server_id}")
-                else:
-                    # 순수 UUID 형식
-                    actual_server_id = UUID(server_id)
-                return None, actual_server_id
-            except (ValueError, TypeError) as e:
-                logger.error(f"Cannot convert server_id {server_id} to UUID: {e}")
-                return None, None
+        resolved = await server_key_resolver.resolve_async(server_id)
+        if resolved:
+            return resolved.project_id, resolved.server_id
+        
+        # DB에 없는 서버: 키에서 알 수 있는 부분만 반환
+        project_id, actual_server_id, _ = ServerKeyResolver.parse_key(server_id)
+        if project_id is None and actual_server_id is None:
+            logger.warning(f"Cannot resolve server_id {server_id}")
+        return project_id, actual_server_id
+    
+    async def _status_target(self, server_id: str) -> Optional[Tuple[str, UUID]]:
+        """서버 상태 업데이트 대상 ("project_id.server_name", project_id) 반환"""
+        resolved = await server_key_resolver.resolve_async(server_id)
+        if resolved:
+            return resolved.status_key, resolved.project_id
+        return None
     
     async def get_or_create_session(self, server_id: str, server_config: Dict) -> McpSession:
-        """서버 세션을 가져오거나 새로 생성 (MCP 표준 패턴)"""
-        # 기존 세션이 있고 유효한지 확인
-        if server_id in self.sessions:
-            session = self.sessions[server_id]
-            
-            # 세션이 살아있는지 확인
-            if await self._is_session_alive(session):
-                session.last_used_at = datetime.utcnow()
-                logger.info(f"♻️ Reusing existing session for server {server_id}")
-                return session
-            else:
-                # 죽은 세션 정리
-                logger.warning(f"⚠️ Session for server {server_id} is dead, creating new one")
-                await self._close_session(session)
-                del self.sessions[server_id]
-        
-        # 새 세션 생성 (MCP stdio_client 패턴)
-        session = await self._create_new_session(server_id, server_config)
-        self.sessions[server_id] = session
-        logger.info(f"🆕 Created new session for server {server_id}")
+        """
+        서버 세션을 가져오거나 새로 생성 (MCP 표준 패턴)
+        
+        서버별 세션 풀에서 미처리 요청이 가장 적은 세션을 선택하고,
+        큐 깊이에 따라 백그라운드에서 워커 프로세스를 늘리거나 줄입니다.
+        """
+        server_id = await server_key_resolver.canonical_key_async(server_id)
+        pool = self.pools.get(server_id)
+        if pool is None:
+            pool = McpSessionPool(server_id=server_id)
+            self.pools[server_id] = pool
+        self._apply_pool_size(pool, server_config)
+        
+        # 죽은 세션 정리
+        for replica in list(pool.replicas):
+            if not await self._is_session_alive(replica):
+                logger.warning(f"⚠️ Session {replica.session_id} for server {server_id} is dead, removing from pool")
+                pool.replicas.remove(replica)
+                await self._close_session(replica, update_status=False)
+        
+        if not pool.replicas:
+            async with pool.scale_lock:
+                if not pool.replicas:
+                    session = await self._create_new_session(server_id, server_config)
+                    pool.replicas.append(session)
+                    logger.info(f"🆕 Created new session for server {server_id}")
+        
+        session = pool.least_loaded()
+        session.last_used_at = datetime.utcnow()
+        
+        self._maybe_scale_pool(pool, server_config)
+        
+        logger.debug(f"♻️ Dispatching to session {session.session_id} ({session.outstanding_requests} outstanding, {len(pool.replicas)} replicas)")
         return session
     
+    def _apply_pool_size(self, pool: McpSessionPool, server_config: Dict) -> None:
+        """서버 설정의 풀 크기(min/max replicas) 반영"""
+        min_size = max(1, int(server_config.get('pool_min_size') or 1))
+        max_size = max(min_size, int(server_config.get('pool_max_size') or min_size))
+        if (pool.min_size, pool.max_size) != (min_size, max_size):
+            logger.info(f"🔧 Session pool size for server {pool.server_id}: min={min_size}, max={max_size}")
+            pool.min_size, pool.max_size = min_size, max_size
+    
+    def _maybe_scale_pool(self, pool: McpSessionPool, server_config: Dict) -> None:
+        """큐 깊이에 따른 스케일 업/다운 예약 (백그라운드)"""
+        if pool._scaling_task is not None and not pool._scaling_task.done():
+            return
+        
+        replica_count = len(pool.replicas)
+        below_min = replica_count < pool.min_size
+        overloaded = (
+            replica_count < pool.max_size and
+            pool.outstanding_requests >= replica_count * self.config.pool_scale_up_threshold
+        )
+        
+        if below_min or overloaded:
+            pool._scaling_task = asyncio.create_task(self._scale_up_pool(pool, server_config))
+        elif replica_count > pool.min_size and self._has_idle_replica(pool):
+            pool._scaling_task = asyncio.create_task(self._scale_down_pool(pool))
+    
+    def _has_idle_replica(self, pool: McpSessionPool) -> bool:
+        """스케일 다운 대상 유휴 세션 존재 여부"""
+        idle_since = datetime.utcnow() - timedelta(seconds=self.config.pool_scale_down_idle_seconds)
+        return any(
+            replica.outstanding_requests == 0 and replica.last_used_at < idle_since
+            for replica in pool.replicas
+        )
+    
+    async def _scale_up_pool(self, pool: McpSessionPool, server_config: Dict) -> None:
+        """워커 세션 추가 - 초기화가 끝난 세션만 풀에 투입"""
+        async with pool.scale_lock:
+            if len(pool.replicas) >= pool.max_size:
+                return
+            
+            session = None
+            try:
+                session = await self._create_new_session(pool.server_id, server_config)
+                await self.initialize_session(session)
+            except Exception as e:
+                logger.error(f"❌ Failed to scale up session pool for server {pool.server_id}: {e}")
+                if session:
+                    await self._close_session(session, update_status=False)
+                return
+            
+            if self.pools.get(pool.server_id) is not pool:
+                # 스케일 업 중에 풀이 닫힘
+                await self._close_session(session, update_status=False)
+                return
+            
+            pool.replicas.append(session)
+            logger.info(f"📈 Scaled up session pool for server {pool.server_id}: {len(pool.replicas)} replicas ({pool.outstanding_requests} outstanding)")
+    
+    async def _scale_down_pool(self, pool: McpSessionPool) -> None:
+        """min_size를 초과하는 유휴 세션 정리"""
+        idle_threshold = timedelta(seconds=self.config.pool_scale_down_idle_seconds)
+        now = datetime.utcnow()
+        
+        async with pool.scale_lock:
+            for replica in list(reversed(pool.replicas)):
+                if len(pool.replicas) <= pool.min_size:
+                    break
+                if replica.outstanding_requests == 0 and now - replica.last_used_at > idle_threshold:
+                    pool.replicas.remove(replica)
+                    await self._close_session(replica, update_status=False)
+                    logger.info(f"📉 Scaled down session pool for server {pool.server_id}: {len(pool.replicas)} replicas")
+    
+    async def close_session(self, server_id: str) -> None:
+        """서버의 세션 풀 전체 종료"""
+        pool = self.pools.pop(await server_key_resolver.canonical_key_async(server_id), None)
+        if pool is None:
+            return
+        
+        if pool._scaling_task and not pool._scaling_task.done():
+            pool._scaling_task.cancel()
+        
+        replicas, pool.replicas = pool.replicas, []
+        for index, replica in enumerate(replicas):
+            # 서버 상태는 마지막 세션 종료 시 한 번만 갱신
+            await self._close_session(replica, update_status=(index == len(replicas) - 1))
+    
+    async def _discard_replica(self, session: McpSession) -> None:
+        """풀에서 세션 하나만 제거하고 종료 - 빈 자리는 다음 요청/스케일링이 채움"""
+        pool = self.pools.get(session.server_id)
+        if pool is not None and session in pool.replicas:
+            pool.replicas.remove(session)
+        await self._close_session(session, update_status=False)
+    
+    def invalidate_tools_cache(self, server_id: str) -> bool:
+        """서버 풀의 모든 세션 도구 캐시 무효화"""
+        pool = self.pools.get(server_key_resolver.canonical_key(server_id))
+        if pool is None:
+            return False
+        for replica in pool.replicas:
+            replica.tools_cache = None
+        return True
+    
+    def get_pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """서버별 세션 풀 상태 조회"""
+        return {
+            server_id: {
+                "replicas": len(pool.replicas),
+                "min_size": pool.min_size,
+                "max_size": pool.max_size,
+                "outstanding_requests": pool.outstanding_requests,
+                "per_replica": [replica.outstanding_requests for replica in pool.replicas]
+            }
+            for server_id, pool in self.pools.items()
+        }
+    
     async def _create_new_session(self, server_id: str, server_config: Dict) -> McpSession:
         """새 MCP 세션 생성 - stdio_client 패턴"""
         command = server_config.get('command', '')
@@ -226,9 +377,13 @@ class McpSessionManager:
             session_id=f"session_{server_id}_{int(time.time())}",
             created_at=datetime.utcnow(),
             last_used_at=datetime.utcnow(),
-            initialization_lock=asyncio.Lock()
+            initialization_lock=asyncio.Lock(),
+            request_semaphore=asyncio.Semaphore(self.config.max_in_flight_requests)
         )
         
+        # 응답 라우팅용 읽기 태스크 시작 (StdioConnection 패턴)
+        session._reader_task = asyncio.create_task(self._reader_loop(session))
+        
         return session
     
     async def initialize_session(self, session: McpSession) -> None:
@@ -271,18 +426,17 @@ class McpSessionManager:
                         }
                     }
                     
-                    # 초기화 메시지 전송
-                    await self._send_message(session, init_message)
-                    
-                    # 초기화 응답 대기 (메시지 ID 매칭) - Context7 등 복잡한 서버를 위해 타임아웃 증가
-                    init_response = await self._read_message(session, timeout=30, expected_id=init_message['id'])
-                    if not init_response or init_response.get('id') != init_message['id']:
+                    # 초기화 요청 전송 및 응답 대기 - Context7 등 복잡한 서버를 위해 타임아웃 증가
+                    init_response = await self._send_request(session, init_message, timeout=30)
+                    if not init_response:
                         raise Exception("Failed to receive initialization response")
                     
                     if 'error' in init_response:
                         error_msg = init_response['error'].get('message', 'Unknown error')
                         raise Exception(f"Server initialization failed: {error_msg}")
                     
+                    session.server_info = init_response.get('result')
+                    
                     # initialized notification 전송 (MCP 표준)
                     initialized_notification = {
                         "jsonrpc": "2.0",
@@ -304,13 +458,13 @@ class McpSessionManager:
             
             # 🔄 서버 상태 자동 업데이트: MCP 세션 초기화 성공 시 ACTIVE로 설정
             try:
-                # server_id에서 프로젝트 ID 추출 (server_id가 "project_id.server_name" 형태인 경우)
-                if '.' in session.server_id:
-                    project_id_str, server_name = session.server_id.split('.', 1)
-                    project_id = UUID(project_id_str)
+                # 정규 키(서버 UUID)에서 "project_id.server_name" 형식으로 변환
+                status_target = await self._status_target(session.server_id)
+                if status_target:
+                    status_key, project_id = status_target
                     
                     await ServerStatusService.update_server_status_on_connection(
-                        server_id=session.server_id,
+                        server_id=status_key,
                         project_id=project_id,
                         status=McpServerStatus.ACTIVE,
                         connection_type="MCP_SESSION_INIT"
@@ -383,13 +537,15 @@ class McpSessionManager:
         last_error = None
         
         for attempt in range(max_retries):
+            used_sessions: List[McpSession] = []
             try:
                 if attempt > 0:
                     logger.info(f"🔄 Retrying tool call {tool_name} (attempt {attempt + 1}/{max_retries})")
                 
                 result = await self._call_tool_single(
                     server_id, server_config, tool_name, arguments,
-                    session_id, project_id, user_agent, ip_address, db
+                    session_id, project_id, user_agent, ip_address, db,
+                    used_sessions=used_sessions
                 )
                 
                 if attempt > 0:
@@ -405,12 +561,11 @@ class McpSessionManager:
                     logger.warning(f"❌ Tool call {tool_name} failed (attempt {attempt + 1}): {e}")
                     logger.info(f"🔄 Will retry due to {error_type} error")
                     
-                    # 심각한 초기화 오류의 경우 세션 재생성 고려
-                    if error_type == 'initialization' and attempt > 0:
+                    # 심각한 초기화 오류의 경우 실패한 세션만 교체 (풀의 다른 세션은 유지)
+                    if error_type == 'initialization' and attempt > 0 and used_sessions:
                         try:
                             logger.info(f"🔄 Recreating session due to persistent initialization issues")
-                            if server_id in self.sessions:
-                                await self.close_session(server_id)
+                            await self._discard_replica(used_sessions[0])
                         except Exception as cleanup_error:
                             logger.warning(f"⚠️ Session cleanup failed: {cleanup_error}")
                     
@@ -434,9 +589,14 @@ class McpSessionManager:
         project_id: Optional[Union[str, UUID]] = None,
         user_agent: Optional[str] = None,
         ip_address: Optional[str] = None,
-        db: Optional[Session] = None
+        db: Optional[Session] = None,
+        used_sessions: Optional[List[McpSession]] = None
     ) -> Dict:
-        """단일 MCP 도구 호출 (재시도 로직 없음)"""
+        """
+        단일 MCP 도구 호출 (재시도 로직 없음)
+        
+        used_sessions가 주어지면 호출에 사용한 세션을 기록합니다 (실패한 세션만 교체하기 위함).
+        """
         start_time = time.time()
         
         # 프로젝트 ID 변환
@@ -451,7 +611,7 @@ class McpSessionManager:
                 logger.warning(f"Invalid project_id format: {project_id}, error: {e}")
         
         # server_id 해석: "project_id.server_name" 형식 또는 UUID
-        resolved_project_id, actual_server_id = self._resolve_server_id(server_id)
+        resolved_project_id, actual_server_id = await self._resolve_server_id(server_id)
         
         # 로그 데이터 준비
         log_data = {
@@ -474,6 +634,8 @@ class McpSessionManager:
             
             # 세션 가져오기 또는 생성
             session = await self.get_or_create_session(server_id, server_config)
+            if used_sessions is not None:
+                used_sessions.append(session)
             
             # 세션 초기화 (필요시)
             await self.initialize_session(session)
@@ -496,27 +658,21 @@ class McpSessionManager:
                 # 일부 MCP 서버는 빈 arguments를 기대하므로 명시적으로 추가
                 tool_message["params"]["arguments"] = {}
             
-            logger.info(f"🔧 Sending tool call message: {json.dumps(tool_message)}")
-            
-            # 메시지 전송
-            await self._send_message(session, tool_message)
-            logger.info(f"📤 Sent tool call message for {tool_name} (ID: {tool_message['id']})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"🔧 Sending tool call message: {json_codec.dumps_str(tool_message)}")
             
-            # 응답 대기 (메시지 ID 매칭)
+            # 요청 전송 및 응답 대기 (읽기 태스크가 ID로 응답 라우팅)
             timeout = server_config.get('timeout', 60)
-            response = await self._read_message(session, timeout=timeout, expected_id=tool_message['id'])
+            response = await self._send_request(session, tool_message, timeout=timeout)
             
             # 응답 디버깅
             if not response:
                 logger.error(f"❌ No response received for tool call {tool_name} (ID: {tool_message['id']})")
                 raise ToolExecutionError("No response received from MCP server")
             
-            logger.info(f"📥 Received response for {tool_name}: ID={response.get('id')}, expected={tool_message['id']}")
-            logger.info(f"📥 Full response content: {json.dumps(response)}")
-            
-            if response.get('id') != tool_message['id']:
-                logger.error(f"❌ Message ID mismatch: expected {tool_message['id']}, got {response.get('id')}")
-                raise ToolExecutionError(f"Message ID mismatch: expected {tool_message['id']}, got {response.get('id')}")
+            logger.info(f"📥 Received response for {tool_name}: ID={response.get('id')}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"📥 Full response content: {json_codec.dumps_str(response)}")
             
             if 'error' in response:
                 error_msg = response['error'].get('message', 'Unknown error')
@@ -532,7 +688,7 @@ class McpSessionManager:
             # 성공 로그 저장
             if db:
                 await self._save_tool_call_log(
-                    db, log_data, execution_time, CallStatus.SUCCESS, 
+                    log_data, execution_time, CallStatus.SUCCESS, 
                     {'result': result}
                 )
             
@@ -547,14 +703,91 @@ class McpSessionManager:
             if db:
                 status = CallStatus.TIMEOUT if "timeout" in str(e).lower() else CallStatus.FAILED
                 await self._save_tool_call_log(
-                    db, log_data, execution_time, status, 
+                    log_data, execution_time, status, 
                     {'error': str(e)}
                 )
             logger.error(f"❌ Error calling tool {tool_name} on server {server_id}: {e}")
             raise
     
-    async def get_server_tools(self, server_id: str, server_config: Dict) -> List[Dict]:
-        """서버 도구 목록 조회 - 캐시된 결과 사용 + 툴 필터링 적용"""
+    async def forward_message(self, server_id: str, server_config: Dict, message: Dict) -> Optional[Dict]:
+        """
+        클라이언트 JSON-RPC 메시지를 지속 세션으로 그대로 전달
+        
+        프로세스 시작/초기화 비용은 세션 생성 시 한 번만 발생합니다.
+        - initialize: 세션 초기화 때 받은 서버 응답을 클라이언트 요청 ID로 반환
+        - 알림(id 없음): 전송만 하고 None 반환 (initialized는 세션이 이미 전송함)
+        - 그 외 요청: 세션 내부 ID로 바꿔 전송한 뒤 응답 ID를 원래 값으로 복원
+        """
+        session = await self.get_or_create_session(server_id, server_config)
+        await self.initialize_session(session)
+        session.last_used_at = datetime.utcnow()
+        
+        method = message.get('method')
+        client_request_id = message.get('id')
+        
+        if method == 'initialize':
+            return {
+                "jsonrpc": "2.0",
+                "id": client_request_id,
+                "result": session.server_info or {}
+            }
+        
+        if client_request_id is None:
+            if method != 'notifications/initialized':
+                await self._send_message(session, message)
+            return None
+        
+        forwarded = dict(message)
+        forwarded['id'] = self._get_next_message_id()
+        response = await self._send_request(session, forwarded, timeout=server_config.get('timeout', 60))
+        
+        response = dict(response)
+        response['id'] = client_request_id
+        return response
+    
+    async def ping_session(self, server_id: str, timeout: float = 5.0) -> Optional[bool]:
+        """
+        살아있는 세션에 ping을 보내 서버 상태 확인 (새 세션/프로세스는 만들지 않음)
+
+        상태 확인용 요청이므로 세션의 last_used_at은 갱신하지 않습니다.
+
+        Returns:
+            True/False: 세션 응답 여부, None: 확인할 수 있는 초기화된 세션 없음
+        """
+        pool = self.pools.get(await server_key_resolver.canonical_key_async(server_id))
+        if pool is None:
+            return None
+
+        session = pool.least_loaded()
+        if session is None or not session.is_initialized or not await self._is_session_alive(session):
+            return None
+
+        ping_message = {
+            "jsonrpc": "2.0",
+            "id": self._get_next_message_id(),
+            "method": "ping"
+        }
+        try:
+            # 동시 요청 슬롯 대기 시간까지 포함한 전체 마감
+            response = await asyncio.wait_for(
+                self._send_request(session, ping_message, timeout=timeout), timeout=timeout
+            )
+        except (asyncio.TimeoutError, ToolExecutionError) as e:
+            logger.warning(f"⚠️ Ping failed for session {session.session_id} (server {server_id}): {e}")
+            return False
+
+        # ping 미지원 서버의 method-not-found 오류도 살아있는 응답으로 간주
+        return response is not None
+
+    async def get_server_tools(
+        self, server_id: str, server_config: Dict, raise_on_error: bool = False
+    ) -> List[Dict]:
+        """
+        서버 도구 목록 조회 - 캐시된 결과 사용 + 툴 필터링 적용
+        
+        실패 시 빈 목록을 반환하고, raise_on_error가 설정되면 예외를 그대로 전달합니다
+        (도구 카탈로그 캐시가 실패한 서버를 도구 없는 서버로 저장하지 않도록).
+        """
         try:
             # 세션 가져오기 또는 생성
             session = await self.get_or_create_session(server_id, server_config)
@@ -563,7 +796,7 @@ class McpSessionManager:
             await self.initialize_session(session)
             
             # 🆕 server_id 해석: "project_id.server_name" 형식 또는 UUID
-            project_id, actual_server_id = self._resolve_server_id(server_id)
+            project_id, actual_server_id = await self._resolve_server_id(server_id)
             
             # 캐시된 도구 목록이 있으면 필터링 후 반환
             if session.tools_cache is not None:
@@ -591,13 +824,10 @@ class McpSessionManager:
                 "params": {}
             }
             
-            # 메시지 전송
-            await self._send_message(session, tools_message)
-            
-            # 응답 대기 (메시지 ID 매칭)
-            response = await self._read_message(session, timeout=30, expected_id=tools_message['id'])
+            # 요청 전송 및 응답 대기
+            response = await self._send_request(session, tools_message, timeout=30)
             
-            if not response or response.get('id') != tools_message['id']:
+            if not response:
                 raise Exception("Invalid tools list response")
             
             if 'error' in response:
@@ -637,75 +867,135 @@ class McpSessionManager:
             
         except Exception as e:
             logger.error(f"❌ Error getting tools for server {server_id}: {e}")
+            if raise_on_error:
+                raise
             return []
     
     async def _send_message(self, session: McpSession, message: Dict) -> None:
         """메시지 전송"""
         try:
-            message_json = json.dumps(message) + '\n'
-            session.write_stream.write(message_json.encode())
+            session.write_stream.write(json_codec.dumps(message) + b'\n')
             await session.write_stream.drain()
             logger.debug(f"📤 Sent message: {message.get('method', message.get('id'))}")
         except Exception as e:
             logger.error(f"❌ Failed to send message: {e}")
             raise
     
-    async def _read_message(self, session: McpSession, timeout: int = 60, expected_id: Optional[int] = None) -> Optional[Dict]:
-        """메시지 읽기 - ID 기반 매칭 지원 (UTF-8 안전 처리)"""
+    async def _send_request(self, session: McpSession, message: Dict, timeout: float = 60) -> Optional[Dict]:
+        """
+        요청 전송 및 응답 대기
+        
+        응답은 세션의 읽기 태스크가 요청 ID별 Future로 전달하므로
+        하나의 세션에서 여러 요청을 동시에 처리할 수 있습니다.
+        """
+        request_id = message['id']
+        
+        session._queued_requests += 1
+        try:
+            await session.request_semaphore.acquire()
+        finally:
+            session._queued_requests -= 1
+        
         try:
-            # 세션에 읽기 버퍼, 바이트 버퍼, 디코더, 메시지 큐가 없으면 초기화
-            if not hasattr(session, '_read_buffer'):
-                session._read_buffer = ""
-            if not hasattr(session, '_byte_buffer'):
-                session._byte_buffer = b""
-            if not hasattr(session, '_utf8_decoder'):
-                import codecs
-                session._utf8_decoder = codecs.getincrementaldecoder('utf-8')(errors='strict')
-            if not hasattr(session, '_message_queue'):
-                session._message_queue = []
-            
-            # 먼저 큐에서 expected_id와 일치하는 메시지 찾기
-            if expected_id is not None:
-                for i, queued_message in enumerate(session._message_queue):
-                    if queued_message.get('id') == expected_id:
-                        # 일치하는 메시지 발견, 큐에서 제거하고 반환
-                        return session._message_queue.pop(i)
+            if session._reader_task is None or session._reader_task.done():
+                raise ToolExecutionError("Connection closed by MCP server", "CONNECTION_CLOSED")
             
+            future = asyncio.get_running_loop().create_future()
+            session._pending_requests[request_id] = future
+            
+            try:
+                await self._send_message(session, message)
+                return await asyncio.wait_for(future, timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.error(f"❌ Message read timeout after {timeout} seconds (ID: {request_id})")
+                raise ToolExecutionError(f"Message read timeout after {timeout} seconds")
+            finally:
+                session._pending_requests.pop(request_id, None)
+        finally:
+            session.request_semaphore.release()
+    
+    async def _reader_loop(self, session: McpSession) -> None:
+        """세션 stdout을 지속적으로 읽어 응답을 요청 ID별 Future로 라우팅"""
+        error: Exception = ToolExecutionError("Connection closed by MCP server", "CONNECTION_CLOSED")
+        try:
             while True:
-                # 완전한 라인이 버퍼에 있는지 먼저 확인
-                if '\n' in session._read_buffer:
-                    lines = session._read_buffer.split('\n')
-                    session._read_buffer = lines.pop()  # 마지막 불완전한 라인은 버퍼에 유지
+                try:
+                    message = await self._read_message(session)
+                except MessageTooLargeError as e:
+                    # 너무 큰 메시지는 버리고 해당 요청만 실패 처리 후 계속 읽기
+                    self._fail_oversized_request(session, e)
+                    continue
+                if message is None:
+                    break
+                
+                message_id = message.get('id')
+                future = session._pending_requests.get(message_id) if message_id is not None else None
+                
+                if future is not None and 'method' not in message:
+                    if not future.done():
+                        future.set_result(message)
+                else:
+                    # 서버 알림 또는 대기 중이 아닌 응답 (타임아웃 이후 도착 등)
+                    logger.debug(f"📭 Unrouted message from server {session.server_id}: {message.get('method', message_id)}")
                     
-                    # 모든 완전한 라인 처리
-                    for line_text in lines:
-                        line_text = line_text.strip()
-                        if line_text:
-                            try:
-                                response = json.loads(line_text)
-                                logger.debug(f"📥 Received message ({len(line_text)} bytes): {response.get('method', response.get('id'))}")
-                                logger.debug(f"📥 Message content: {response}")
-                                
-                                # expected_id가 지정되었고 일치하면 즉시 반환
-                                if expected_id is not None and response.get('id') == expected_id:
-                                    return response
-                                # expected_id가 지정되지 않았으면 첫 번째 메시지 반환
-                                elif expected_id is None:
-                                    return response
-                                # ID가 일치하지 않으면 큐에 저장
-                                else:
-                                    session._message_queue.append(response)
-                                    logger.debug(f"📦 Queued message ID {response.get('id')}, waiting for ID {expected_id}")
-                                    
-                            except json.JSONDecodeError as e:
-                                logger.error(f"❌ JSON decode error: {e}")
-                                logger.error(f"❌ Invalid JSON content: {line_text[:500]}...")
-                                # JSON 파싱 오류는 무시하고 다음 라인 처리
-                                continue
+        except asyncio.CancelledError:
+            error = ToolExecutionError("Session closed", "CONNECTION_CLOSED")
+            raise
+        except Exception as e:
+            logger.error(f"❌ Reader loop failed for server {session.server_id}: {e}")
+            error = e if isinstance(e, ToolExecutionError) else ToolExecutionError(f"Connection error: {e}", "CONNECTION_ERROR")
+        finally:
+            self._fail_pending_requests(session, error)
+    
+    def _fail_oversized_request(self, session: McpSession, error: MessageTooLargeError) -> None:
+        """최대 크기를 넘은 응답의 요청 ID를 찾아 해당 요청만 에러로 종료"""
+        request_id = error.request_id
+        logger.error(f"❌ {error} from server {session.server_id} (request ID: {request_id})")
+        
+        future = session._pending_requests.get(request_id) if request_id is not None else None
+        if future is not None and not future.done():
+            future.set_exception(ToolExecutionError(
+                str(error),
+                "MESSAGE_TOO_LARGE",
+                {"size": error.size, "max_size": error.max_size}
+            ))
+    
+    def _fail_pending_requests(self, session: McpSession, error: Exception) -> None:
+        """대기 중인 모든 요청을 에러로 종료"""
+        for future in list(session._pending_requests.values()):
+            if not future.done():
+                future.set_exception(error)
+        session._pending_requests.clear()
+    
+    async def _read_message(self, session: McpSession, timeout: Optional[float] = None) -> Optional[Dict]:
+        """
+        다음 JSON-RPC 메시지 읽기 - 읽기 태스크 전용
+        
+        바이트 단위로 줄을 잘라 완전한 줄만 JSON 파싱합니다 (json_codec이 UTF-8 바이트를 직접 처리).
+        max_message_bytes를 넘는 메시지는 MessageTooLargeError로 알리고 버립니다.
+        """
+        if session._decoder is None:
+            session._decoder = JsonLineDecoder(self.config.max_message_bytes)
+        decoder = session._decoder
+        
+        try:
+            while True:
+                # 완전한 라인이 버퍼에 있는지 먼저 확인
+                line = decoder.next_line()
+                while line is not None:
+                    try:
+                        response = json_codec.loads(line)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"📥 Received message ({len(line)} bytes): {response.get('method', response.get('id'))}")
+                        return response
+                    except ValueError as e:
+                        logger.error(f"❌ JSON decode error: {e}")
+                        logger.error(f"❌ Invalid JSON content: {line[:500]!r}...")
+                        # JSON 파싱 오류는 무시하고 다음 라인 처리
+                        line = decoder.next_line()
                 
-                # MCP SDK와 동일한 패턴: 청크 기반 읽기 (UTF-8 안전 처리)
                 chunk = await asyncio.wait_for(
-                    session.read_stream.read(8192),  # 8KB 청크 크기
+                    session.read_stream.read(READ_CHUNK_SIZE),
                     timeout=timeout
                 )
                 
@@ -714,36 +1004,13 @@ class McpSessionManager:
                     logger.warning("⚠️ Connection closed by MCP server")
                     return None
                 
-                # 바이트 버퍼에 새 청크 추가
-                session._byte_buffer += chunk
-                
-                # 증분 디코더로 안전하게 UTF-8 디코딩
-                try:
-                    # 가능한 한 많은 바이트를 디코딩하고, 불완전한 멀티바이트 문자는 버퍼에 유지
-                    decoded_text = session._utf8_decoder.decode(session._byte_buffer, final=False)
-                    session._byte_buffer = b""  # 성공적으로 디코딩된 바이트는 제거
-                    
-                    # 디코딩된 텍스트를 문자열 버퍼에 추가
-                    session._read_buffer += decoded_text
-                    
-                except UnicodeDecodeError as decode_error:
-                    # 불완전한 멀티바이트 문자가 청크 끝에 있을 경우
-                    # 다음 청크를 읽어서 완성할 때까지 바이트 버퍼에 유지
-                    logger.debug(f"📦 Incomplete UTF-8 sequence at chunk boundary, buffering: {len(session._byte_buffer)} bytes")
-                    continue
+                decoder.feed(chunk)
             
         except asyncio.TimeoutError:
             logger.error(f"❌ Message read timeout after {timeout} seconds")
             raise ToolExecutionError(f"Message read timeout after {timeout} seconds")
-        except json.JSONDecodeError as e:
-            logger.error(f"❌ Invalid JSON response: {e}")
-            logger.error(f"❌ Raw message: {line_text[:500]}..." if 'line_text' in locals() else "❌ No line_text available")
-            raise ToolExecutionError(f"Invalid JSON response: {e}")
-        except UnicodeDecodeError as e:
-            logger.error(f"❌ Critical UTF-8 encoding error: {e}")
-            logger.error(f"❌ Byte buffer length: {len(getattr(session, '_byte_buffer', b''))}")
-            logger.error(f"❌ Read buffer length: {len(getattr(session, '_read_buffer', ''))}")
-            raise ToolExecutionError(f"Critical UTF-8 encoding error: {e}")
+        except MessageTooLargeError:
+            raise
         except Exception as e:
             logger.error(f"❌ Error reading message: {e}")
             raise
@@ -754,17 +1021,30 @@ class McpSessionManager:
             if session.process.returncode is not None:
                 return False
             
+            # 읽기 태스크가 종료되었으면 stdout이 닫힌 상태
+            if session._reader_task is not None and session._reader_task.done():
+                return False
+            
             # 간단한 ping 메시지로 확인 (선택적)
             return True
             
         except Exception:
             return False
     
-    async def _close_session(self, session: McpSession) -> None:
+    async def _close_session(self, session: McpSession, update_status: bool = True) -> None:
         """세션 종료"""
         try:
             logger.info(f"🔴 Closing session for server {session.server_id}")
             
+            # 읽기 태스크 중지 (대기 중인 요청은 에러로 종료됨)
+            if session._reader_task and not session._reader_task.done():
+                session._reader_task.cancel()
+                try:
+                    await session._reader_task
+                except asyncio.CancelledError:
+                    pass
+            self._fail_pending_requests(session, ToolExecutionError("Session closed", "CONNECTION_CLOSED"))
+            
             # 프로세스 종료
             if session.process.returncode is None:
                 session.process.terminate()
@@ -783,27 +1063,23 @@ class McpSessionManager:
                     pass
             
             # 버퍼 정리
-            if hasattr(session, '_read_buffer'):
-                session._read_buffer = ""
-            if hasattr(session, '_byte_buffer'):
-                session._byte_buffer = b""
-            if hasattr(session, '_utf8_decoder'):
-                session._utf8_decoder = None
-            if hasattr(session, '_message_queue'):
-                session._message_queue.clear()
+            if session._decoder is not None:
+                session._decoder.reset()
             
         except Exception as e:
             logger.error(f"❌ Error closing session for {session.server_id}: {e}")
         
         # 🔄 서버 상태 자동 업데이트: MCP 세션 종료 시 INACTIVE로 설정
+        if not update_status:
+            return
         try:
-            # server_id에서 프로젝트 ID 추출 (server_id가 "project_id.server_name" 형태인 경우)
-            if '.' in session.server_id:
-                project_id_str, server_name = session.server_id.split('.', 1)
-                project_id = UUID(project_id_str)
+            # 정규 키(서버 UUID)에서 "project_id.server_name" 형식으로 변환
+            status_target = await self._status_target(session.server_id)
+            if status_target:
+                status_key, project_id = status_target
                 
                 await ServerStatusService.update_server_status_on_connection(
-                    server_id=session.server_id,
+                    server_id=status_key,
                     project_id=project_id,
                     status=McpServerStatus.INACTIVE,
                     connection_type="MCP_SESSION_CLOSE"
@@ -826,24 +1102,32 @@ class McpSessionManager:
                 now = datetime.utcnow()
                 expired_sessions = []
                 
-                for server_id, session in self.sessions.items():
-                    if now - session.last_used_at > self.session_timeout:
+                for server_id, pool in list(self.pools.items()):
+                    last_used_at = pool.last_used_at
+                    if last_used_at is None or now - last_used_at > self.session_timeout:
                         expired_sessions.append(server_id)
+                    else:
+                        # 활성 풀은 min_size 초과 유휴 세션만 정리
+                        await self._scale_down_pool(pool)
                 
                 for server_id in expired_sessions:
-                    session = self.sessions.pop(server_id, None)
-                    if session:
-                        await self._close_session(session)
-                        logger.info(f"🧹 Cleaned up expired session for server {server_id}")
+                    pool = self.pools.pop(server_id, None)
+                    if pool:
+                        if pool._scaling_task and not pool._scaling_task.done():
+                            pool._scaling_task.cancel()
+                        for replica in pool.replicas:
+                            await self._close_session(replica, update_status=False)
+                        pool.replicas = []
+                        logger.info(f"🧹 Cleaned up expired session pool for server {server_id}")
                         
                         # 🔄 만료된 세션에 대한 추가 상태 업데이트
                         try:
-                            if '.' in server_id:
-                                project_id_str, server_name = server_id.split('.', 1)
-                                project_id = UUID(project_id_str)
+                            status_target = await self._status_target(server_id)
+                            if status_target:
+                                status_key, project_id = status_target
                                 
                                 await ServerStatusService.update_server_status_on_connection(
-                                    server_id=server_id,
+                                    server_id=status_key,
                                     project_id=project_id,
                                     status=McpServerStatus.INACTIVE,
                                     connection_type="MCP_SESSION_EXPIRED"
@@ -858,7 +1142,6 @@ class McpSessionManager:
     
     async def _save_tool_call_log(
         self,
-        db: Session,
         log_data: Dict,
         execution_time: float,
         status: CallStatus,
@@ -866,47 +1149,33 @@ class McpSessionManager:
         error_message: Optional[str] = None,
         error_code: Optional[str] = None
     ):
-        """ToolCallLog 데이터베이스에 저장"""
+        """ToolCallLog를 배치 저장 큐에 추가 (DB 커밋은 백그라운드에서 수행)"""
         try:
-            # 데이터베이스 세션 타입 검증
-            if db is None:
-                logger.warning("⚠️ Database session is None, skipping ToolCallLog save")
+            if log_data.get('server_id') is None:
+                logger.warning(f"⚠️ Unresolved server_id, skipping ToolCallLog for tool {log_data.get('tool_name')}")
                 return
             
-            if not hasattr(db, 'add') or not hasattr(db, 'commit') or not hasattr(db, 'rollback'):
-                logger.error(f"❌ Invalid database session type: {type(db)}, expected SQLAlchemy Session")
-                return
-            
-            # 저장할 데이터 로깅
-            logger.info(f"🔍 Saving ToolCallLog: server_id={log_data.get('server_id')} (type: {type(log_data.get('server_id'))}), project_id={log_data.get('project_id')}, tool={log_data.get('tool_name')}")
-            
-            tool_call_log = ToolCallLog(
-                session_id=log_data.get('session_id'),
-                server_id=log_data.get('server_id'),
-                project_id=log_data.get('project_id'),
-                tool_name=log_data.get('tool_name'),
-                tool_namespace=f"{log_data.get('server_id')}.{log_data.get('tool_name')}",
-                arguments=log_data.get('arguments'),
-                result=output_data.get('result') if output_data else None,
-                error_message=error_message or (output_data.get('error') if output_data else None),
-                error_code=error_code,
-                execution_time_ms=int(execution_time),  # 밀리초 단위로 저장 (DB 스키마에 맞춰)
-                status=status,
-                user_agent=log_data.get('user_agent'),
-                ip_address=log_data.get('ip_address'),
-                created_at=log_data.get('timestamp')
-            )
-            
-            db.add(tool_call_log)
-            db.commit()
+            await tool_call_log_writer.submit({
+                'session_id': log_data.get('session_id'),
+                'server_id': log_data.get('server_id'),
+                'project_id': log_data.get('project_id'),
+                'tool_name': log_data.get('tool_name'),
+                'tool_namespace': f"{log_data.get('server_id')}.{log_data.get('tool_name')}",
+                'arguments': log_data.get('arguments'),
+                'result': output_data.get('result') if output_data else None,
+                'error_message': error_message or (output_data.get('error') if output_data else None),
+                'error_code': error_code,
+                'execution_time_ms': int(execution_time),  # 밀리초 단위로 저장 (DB 스키마에 맞춰)
+                'status': status,
+                'user_agent': log_data.get('user_agent'),
+                'ip_address': log_data.get('ip_address'),
+                'created_at': log_data.get('timestamp')
+            })
             
-            logger.info(f"✅ ToolCallLog saved successfully: id={tool_call_log.id}, server_id={tool_call_log.server_id}, project_id={tool_call_log.project_id}, tool={tool_call_log.tool_name} ({status.value}) in {execution_time:.3f}ms")
+            logger.debug(f"📝 Queued ToolCallLog: tool={log_data.get('tool_name')} ({status.value}) in {execution_time:.3f}ms")
             
         except Exception as e:
-            logger.error(f"❌ Failed to save ToolCallLog: {e}")
-            logger.error(f"❌ Log data: {log_data}")
-            logger.error(f"❌ Output data: {output_data}")
-            db.rollback()
+            logger.error(f"❌ Failed to queue ToolCallLog for tool {log_data.get('tool_name')}: {e}")
 
 
 # 글로벌 세션 매니저 인스턴스
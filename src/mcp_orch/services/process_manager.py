@@ -8,7 +8,8 @@ import psutil
 import time
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
+from uuid import UUID
 from contextlib import asynccontextmanager
 
 from sqlalchemy.orm import Session
@@ -17,6 +18,7 @@ from sqlalchemy import select, update
 from ..database import async_session
 from ..models.mcp_server import McpServer, McpServerStatus
 from .mcp_session_manager import McpSessionManager
+from .process_output_pump import process_output_pump
 
 logger = logging.getLogger(__name__)
 
@@ -26,15 +28,33 @@ class ProcessManager:
     
     def __init__(self):
         self.session_manager = McpSessionManager()
+        self.output_pump = process_output_pump
         self.health_check_task: Optional[asyncio.Task] = None
         self.is_shutting_down = False
         
+        # 이벤트 기반 프로세스 종료 감지 (서버 ID -> process.wait() 태스크)
+        self.process_watchers: Dict[str, asyncio.Task] = {}
+        self._expected_exits: Set[str] = set()
+        # 반영 대기 중인 종료 이벤트 (서버 ID -> (PID, 종료 코드))
+        self._pending_exits: Dict[str, Tuple[int, Optional[int]]] = {}
+        self._exit_flush_task: Optional[asyncio.Task] = None
+        # start_server 진행 중인 서버 (시작 검증 중 종료는 start_server가 처리)
+        self._starting: Set[str] = set()
+        # 연속 비정상 종료 횟수와 프로세스 시작 시각 (crash loop 백오프용, 메모리에만 유지)
+        self._consecutive_exits: Dict[str, int] = {}
+        self._started_at: Dict[str, float] = {}
+        
         # 설정값들
-        self.HEALTH_CHECK_INTERVAL = 300  # 5분
+        self.HEALTH_CHECK_INTERVAL = 300  # 5분 (감시되지 않는 프로세스 보정용)
+        self.HEALTH_CHECK_REFRESH = 300  # 감시되지 않는 프로세스의 last_health_check 갱신 주기
         self.MAX_RESTART_ATTEMPTS = 3
         self.FAILURE_THRESHOLD = 5  # 1시간 내 5회 실패
         self.FAILURE_WINDOW_HOURS = 1
         self.PROCESS_START_TIMEOUT = 30
+        self.EXIT_FLUSH_DELAY = float(os.getenv('MCP_PROCESS_EXIT_FLUSH_SECONDS', '0.5'))
+        self.RESTART_BACKOFF_BASE = 5
+        self.RESTART_BACKOFF_MAX = 300
+        self.RESTART_STABLE_SECONDS = self.RESTART_BACKOFF_BASE * 12  # 이만큼 살아있었으면 연속 종료 횟수 초기화
         
     async def initialize_on_startup(self):
         """FastAPI 시작 시 초기화"""
@@ -64,6 +84,14 @@ class ProcessManager:
         # 모든 프로세스 안전하게 종료
         await self.stop_all_servers()
         
+        # 종료 감시 태스크 정리
+        for watcher in self.process_watchers.values():
+            watcher.cancel()
+        self.process_watchers.clear()
+        
+        # 남은 프로세스 출력 저장
+        await self.output_pump.stop()
+        
         logger.info("✅ ProcessManager 종료 완료")
     
     async def start_enabled_servers(self):
@@ -99,6 +127,8 @@ class ProcessManager:
                 logger.info(f"서버 {server.name} 이미 실행 중 (PID: {server.process_id})")
                 return True
             
+            self._starting.add(str(server.id))
+            process = None
             try:
                 # 서버 상태를 STARTING으로 변경
                 server.status = McpServerStatus.STARTING
@@ -115,6 +145,12 @@ class ProcessManager:
                     stderr=asyncio.subprocess.PIPE
                 )
                 
+                # stdout/stderr 수집 시작 - 읽지 않으면 파이프가 가득 차 서버가 멈춤
+                self.output_pump.attach(str(server.id), process)
+                
+                # 종료 이벤트 감시 시작
+                self._watch_process(str(server.id), process)
+                
                 # PID 저장 및 상태 업데이트
                 server.process_id = process.pid
                 server.last_started_at = datetime.utcnow()
@@ -137,12 +173,14 @@ class ProcessManager:
                     return True
                 else:
                     # 시작 실패
-                    await self._handle_startup_failure(server, "시작 검증 실패")
+                    await self._handle_startup_failure(server, "시작 검증 실패", process.pid)
                     return False
                     
             except Exception as e:
-                await self._handle_startup_failure(server, str(e))
+                await self._handle_startup_failure(server, str(e), process.pid if process else None)
                 return False
+            finally:
+                self._starting.discard(str(server.id))
     
     async def stop_server(self, server_id: str) -> bool:
         """개별 서버 중지"""
@@ -157,6 +195,10 @@ class ProcessManager:
                 return True
             
             try:
+                # 의도한 종료는 자동 재시작하지 않음
+                self._expected_exits.add(str(server.id))
+                self._consecutive_exits.pop(str(server.id), None)
+                
                 # 우아한 종료 시도
                 success = await self._terminate_process_gracefully(server.process_id)
                 
@@ -165,6 +207,9 @@ class ProcessManager:
                 server.status = McpServerStatus.INACTIVE
                 await db.commit()
                 
+                # 남은 출력 읽고 저장
+                await self.output_pump.detach(str(server.id))
+                
                 # TODO: 세션 매니저 통합 필요
                 # await self.session_manager.unregister_process(server_id)
                 
@@ -185,7 +230,13 @@ class ProcessManager:
         return await self.start_server(server_id)
     
     async def health_check_all(self):
-        """모든 서버 헬스체크"""
+        """
+        감시되지 않는 프로세스 보정 헬스체크
+        
+        ProcessManager가 직접 시작한 프로세스는 종료 이벤트로 즉시 감지되므로 건너뛰고,
+        이전 실행에서 남은 프로세스처럼 감시되지 않는 PID만 확인합니다.
+        DB는 상태가 바뀐 경우에만 한 번에 커밋합니다.
+        """
         if self.is_shutting_down:
             return
             
@@ -198,59 +249,170 @@ class ProcessManager:
             result = await db.execute(stmt)
             servers = result.scalars().all()
             
-            logger.debug(f"🔍 {len(servers)}개 서버 헬스체크 시작")
+            unwatched = [server for server in servers if not self._is_watched(str(server.id))]
+            logger.debug(f"🔍 {len(unwatched)}/{len(servers)}개 감시되지 않는 서버 헬스체크 시작")
             
-            # 각 서버를 개별적으로 처리하여 세션 문제 방지
-            for server in servers:
+            changed = False
+            restarts = []
+            now = datetime.utcnow()
+            for server in unwatched:
                 server_id = str(server.id)
                 server_name = server.name
                 process_id = server.process_id
                 
                 is_alive = await self._check_process_alive(process_id)
                 
-                # 서버 상태를 새로운 쿼리로 가져와서 세션 문제 방지
-                fresh_server = await db.get(McpServer, server.id)
-                if not fresh_server:
-                    continue
-                
                 if is_alive:
-                    # 프로세스 살아있음 - 성공
-                    fresh_server.last_health_check = datetime.utcnow()
-                    fresh_server.health_check_failures = 0
-                    if fresh_server.status != McpServerStatus.ACTIVE:
-                        fresh_server.status = McpServerStatus.ACTIVE
+                    # 프로세스 살아있음 - 상태가 바뀌었거나 헬스체크 시각이 오래된 경우만 기록
+                    stale = (
+                        server.last_health_check is None or
+                        (now - server.last_health_check).total_seconds() >= self.HEALTH_CHECK_REFRESH
+                    )
+                    if server.status != McpServerStatus.ACTIVE or server.health_check_failures or stale:
+                        server.last_health_check = now
+                        server.health_check_failures = 0
+                        server.status = McpServerStatus.ACTIVE
+                        changed = True
                         
                     logger.debug(f"✅ {server_name} (PID {process_id}) 정상")
                     
                 else:
                     # 프로세스 죽음 - 실패 처리
                     logger.warning(f"🚨 {server_name} (PID {process_id}) 프로세스 중단 감지!")
-                    
-                    fresh_server.health_check_failures += 1
-                    fresh_server.failure_reason = "프로세스 중단"
-                    fresh_server.status = McpServerStatus.INACTIVE
-                    fresh_server.process_id = None
-                    
-                    # 자동 재시작 시도 여부 판단 (현재 세션의 데이터로)
-                    should_restart = (
-                        fresh_server.is_auto_restart_enabled and
-                        fresh_server.health_check_failures < self.FAILURE_THRESHOLD
-                    )
-                    
-                    if should_restart:
-                        # 별도 태스크로 재시작 처리
-                        asyncio.create_task(self._attempt_auto_restart_async(server_id))
-                    else:
-                        # 재시작 포기
-                        fresh_server.is_enabled = False
-                        logger.error(f"❌ {server_name} 자동 재시작 포기 (실패가 너무 많음)")
+                    exits = self._record_exit(server_id)
+                    if self._apply_process_exit(server, "프로세스 중단", exits):
+                        restarts.append((server_id, exits))
+                    changed = True
             
-            await db.commit()
+            if changed:
+                await db.commit()
+        
+        for server_id, exits in restarts:
+            self._schedule_restart(server_id, exits)
     
+    def _is_watched(self, server_id: str) -> bool:
+        """종료 이벤트 감시 중인 서버인지 확인"""
+        watcher = self.process_watchers.get(server_id)
+        return watcher is not None and not watcher.done()
     
+    def _watch_process(self, server_id: str, process: asyncio.subprocess.Process):
+        """프로세스 종료 이벤트 감시 시작 (폴링 없이 child watcher/pidfd로 대기)"""
+        previous = self.process_watchers.get(server_id)
+        if previous is not None and not previous.done():
+            previous.cancel()
+        self._expected_exits.discard(server_id)
+        self._started_at[server_id] = time.monotonic()
+        self.process_watchers[server_id] = asyncio.create_task(self._wait_for_exit(server_id, process))
     
-    async def _attempt_auto_restart_async(self, server_id: str):
-        """별도 세션에서 자동 재시작 시도"""
+    async def _wait_for_exit(self, server_id: str, process: asyncio.subprocess.Process):
+        """프로세스 종료를 기다렸다가 상태 전이 기록 및 재시작 예약"""
+        returncode = await process.wait()
+        
+        # 그 사이 새 프로세스로 교체된 경우 이전 프로세스 종료는 무시
+        if self.process_watchers.get(server_id) is not asyncio.current_task():
+            return
+        del self.process_watchers[server_id]
+        
+        # 남은 출력 저장
+        await self.output_pump.detach(server_id)
+        
+        if server_id in self._expected_exits:
+            self._expected_exits.discard(server_id)
+            logger.debug(f"프로세스 {process.pid} 정상 종료 (서버 {server_id}, 코드 {returncode})")
+            return
+        if self.is_shutting_down:
+            return
+        if server_id in self._starting:
+            # 시작 검증 중 종료 - start_server가 시작 실패로 처리하므로 재시작 예약하지 않음
+            logger.warning(f"🚨 서버 {server_id} (PID {process.pid}) 시작 중 종료 (코드 {returncode})")
+            return
+        
+        logger.warning(f"🚨 서버 {server_id} (PID {process.pid}) 프로세스 종료 감지 (코드 {returncode})")
+        self._pending_exits[server_id] = (process.pid, returncode)
+        if self._exit_flush_task is None or self._exit_flush_task.done():
+            self._exit_flush_task = asyncio.create_task(self._flush_exit_transitions())
+    
+    async def _flush_exit_transitions(self):
+        """짧은 시간 동안 모인 종료 이벤트를 한 세션, 한 커밋으로 반영"""
+        while self._pending_exits:
+            # 동시에 여러 프로세스가 종료되는 경우 한 번에 모아서 처리
+            await asyncio.sleep(self.EXIT_FLUSH_DELAY)
+            exits, self._pending_exits = self._pending_exits, {}
+            restarts = []
+            
+            try:
+                async with async_session() as db:
+                    stmt = select(McpServer).where(McpServer.id.in_([UUID(server_id) for server_id in exits]))
+                    result = await db.execute(stmt)
+                    for server in result.scalars().all():
+                        server_id = str(server.id)
+                        pid, returncode = exits[server_id]
+                        if server.process_id != pid:
+                            # 이미 다른 프로세스로 교체되었거나 중지 처리됨
+                            continue
+                        exits_count = self._record_exit(server_id)
+                        if self._apply_process_exit(server, f"프로세스 종료 (코드 {returncode})", exits_count):
+                            restarts.append((server_id, exits_count))
+                    await db.commit()
+            except Exception as e:
+                logger.error(f"프로세스 종료 상태 반영 중 오류: {e}")
+                continue
+            
+            for server_id, exits_count in restarts:
+                self._schedule_restart(server_id, exits_count)
+    
+    def _record_exit(self, server_id: str) -> int:
+        """
+        비정상 종료 기록 - 연속 종료 횟수 반환
+        
+        재시작 성공 시 초기화되는 health_check_failures와 달리, 프로세스가
+        RESTART_STABLE_SECONDS 이상 살아있었던 경우에만 초기화되므로
+        시작 직후 죽는 crash loop도 백오프와 재시작 포기에 도달합니다.
+        """
+        started_at = self._started_at.pop(server_id, None)
+        if started_at is None or time.monotonic() - started_at >= self.RESTART_STABLE_SECONDS:
+            self._consecutive_exits.pop(server_id, None)
+        exits = self._consecutive_exits.get(server_id, 0) + 1
+        self._consecutive_exits[server_id] = exits
+        return exits
+    
+    def _apply_process_exit(self, server: McpServer, reason: str, consecutive_exits: int) -> bool:
+        """종료된 프로세스의 상태 전이 적용 (커밋하지 않음) - 재시작 필요 여부 반환"""
+        server.health_check_failures += 1
+        server.failure_reason = reason
+        server.status = McpServerStatus.INACTIVE
+        server.process_id = None
+        
+        # 자동 재시작 시도 여부 판단
+        should_restart = (
+            server.is_auto_restart_enabled and
+            consecutive_exits < self.FAILURE_THRESHOLD
+        )
+        if not should_restart:
+            # 재시작 포기
+            server.is_enabled = False
+            self._consecutive_exits.pop(str(server.id), None)
+            logger.error(f"❌ {server.name} 자동 재시작 포기 (연속 종료 {consecutive_exits}회)")
+        return should_restart
+    
+    def _schedule_restart(self, server_id: str, consecutive_exits: int):
+        """재시작 예약 - 첫 종료는 즉시, 연속 종료는 지수 백오프"""
+        if self.is_shutting_down:
+            return
+        delay = 0 if consecutive_exits <= 1 else min(
+            self.RESTART_BACKOFF_BASE * (2 ** (consecutive_exits - 2)),
+            self.RESTART_BACKOFF_MAX
+        )
+        if delay:
+            logger.info(f"⏳ 서버 {server_id} 재시작 {delay}초 후 예약 (연속 종료 {consecutive_exits}회)")
+        asyncio.create_task(self._attempt_auto_restart_async(server_id, delay))
+    
+    async def _attempt_auto_restart_async(self, server_id: str, delay: float = 0):
+        """별도 세션에서 자동 재시작 시도 (delay초 대기 후)"""
+        if delay:
+            await asyncio.sleep(delay)
+        if self.is_shutting_down:
+            return
         await self._attempt_auto_restart(server_id)
 
     async def _attempt_auto_restart(self, server_id: str):
@@ -377,13 +539,16 @@ class ProcessManager:
         except (OSError, ProcessLookupError):
             return True
     
-    async def _handle_startup_failure(self, server: McpServer, error: str):
-        """시작 실큨 처리"""
+    async def _handle_startup_failure(self, server: McpServer, error: str, pid: Optional[int] = None):
+        """시작 실큨 처리 (pid가 주어지면 그 프로세스가 아직 기록된 경우에만)"""
         try:
             # 서버 정보를 새로 가져와서 업데이트
             async with async_session() as db:
                 fresh_server = await db.get(McpServer, server.id)
-                if fresh_server:
+                if fresh_server and pid is not None and fresh_server.process_id not in (None, pid):
+                    # 그 사이 다른 시작 시도가 새 프로세스를 기록함
+                    logger.warning(f"⚠️ 서버 {fresh_server.name} 시작 실패 무시 (PID {fresh_server.process_id}로 교체됨)")
+                elif fresh_server:
                     fresh_server.status = McpServerStatus.ERROR
                     fresh_server.last_error = error
                     fresh_server.process_id = None
@@ -431,6 +596,7 @@ class ProcessManager:
             return {
                 "id": str(server.id),
                 "name": server.name,
+                "output": self.output_pump.get_server_stats(str(server.id)),
                 "status": server.status.value,
                 "is_enabled": server.is_enabled,
                 "is_running": is_running,
@@ -442,7 +608,8 @@ class ProcessManager:
                 "last_error": server.last_error,
                 "memory_mb": memory_mb,
                 "cpu_percent": cpu_percent,
-                "is_healthy": server.is_healthy,
+                # 감시 중인 프로세스는 종료 시 즉시 반영되므로 실행 중이면 정상
+                "is_healthy": server.is_healthy or (is_running and self._is_watched(str(server.id))),
                 "needs_restart": server.needs_restart
             }
     
@@ -478,7 +645,9 @@ class ProcessManager:
                     "args": server.args or [],
                     "env": server.env or {},
                     "timeout": server.timeout,
-                    "is_enabled": server.is_enabled
+                    "is_enabled": server.is_enabled,
+                    "pool_min_size": server.pool_min_size,
+                    "pool_max_size": server.pool_max_size
                 }
             
             # 세션 매니저 사용하여 초기화 시도
@@ -0,0 +1,342 @@
+"""
+MCP 서버 프로세스 출력 수집 서비스
+
+ProcessManager가 시작한 프로세스의 stdout/stderr 파이프를 계속 읽어서
+파이프가 가득 차 서버가 멈추는 문제를 막습니다.
+
+- 서버별 링 버퍼: 최근 출력 줄을 UI 조회용으로 보관 (MCP_PROCESS_OUTPUT_BUFFER_LINES, 기본 500)
+- 저장: 서버별 분당 줄 수 제한 후 ServerLogService로 배치 저장
+  (MCP_PROCESS_OUTPUT_PERSIST_PER_MINUTE 기본 300, MCP_PROCESS_OUTPUT_FLUSH_INTERVAL_SECONDS 기본 2초)
+- 통계: 서버/스트림별 누적 바이트와 초당 바이트 (최근 MCP_PROCESS_OUTPUT_RATE_WINDOW_SECONDS 초 기준)
+"""
+
+import asyncio
+import logging
+import os
+import re
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from ..models.server_log import LogCategory, LogLevel
+
+logger = logging.getLogger(__name__)
+
+STREAMS = ('stdout', 'stderr')
+READ_CHUNK_SIZE = 65536
+
+_ERROR_PATTERN = re.compile(r'\b(error|exception|traceback|fatal|critical)\b', re.IGNORECASE)
+_WARNING_PATTERN = re.compile(r'\bwarn(ing)?\b', re.IGNORECASE)
+
+
+def _infer_level(stream: str, line: str) -> LogLevel:
+    """출력 줄 내용으로 로그 레벨 추정 (stdout은 INFO 고정)"""
+    if stream == 'stderr':
+        if _ERROR_PATTERN.search(line):
+            return LogLevel.ERROR
+        if _WARNING_PATTERN.search(line):
+            return LogLevel.WARNING
+    return LogLevel.INFO
+
+
+class ServerOutputState:
+    """서버 한 대의 출력 버퍼, 카운터, 저장 대기열"""
+
+    def __init__(self, server_id: str, buffer_lines: int, persist_per_minute: int):
+        self.server_id = server_id
+        self.lines: Deque[Dict[str, Any]] = deque(maxlen=buffer_lines)
+        self.readers: List[asyncio.Task] = []
+        self.process: Any = None
+        self.pid: Optional[int] = None
+
+        self.total_bytes = {stream: 0 for stream in STREAMS}
+        self.total_lines = {stream: 0 for stream in STREAMS}
+        # (초 단위 시각, 바이트) - 초당 바이트 계산용
+        self.rate_samples: Deque[Tuple[int, int]] = deque()
+
+        # 저장 속도 제한 (토큰 버킷, 분당 persist_per_minute 줄)
+        self.persist_capacity = float(persist_per_minute)
+        self.persist_tokens = float(persist_per_minute)
+        self.persist_updated_at = time.monotonic()
+        self.pending: List[Dict[str, Any]] = []
+        self.suppressed = 0
+        self.suppressed_total = 0
+
+    def record_bytes(self, stream: str, size: int, window_seconds: int):
+        """바이트 카운터 갱신"""
+        self.total_bytes[stream] += size
+        now = int(time.monotonic())
+        if self.rate_samples and self.rate_samples[-1][0] == now:
+            self.rate_samples[-1] = (now, self.rate_samples[-1][1] + size)
+        else:
+            self.rate_samples.append((now, size))
+        while self.rate_samples and self.rate_samples[0][0] <= now - window_seconds:
+            self.rate_samples.popleft()
+
+    def bytes_per_second(self, window_seconds: int) -> float:
+        """최근 window_seconds 동안의 초당 바이트"""
+        cutoff = int(time.monotonic()) - window_seconds
+        recent = sum(size for second, size in self.rate_samples if second > cutoff)
+        return round(recent / window_seconds, 1)
+
+    def take_persist_token(self) -> bool:
+        """저장 예산에서 한 줄 소비 - 초과 시 False"""
+        if self.persist_capacity <= 0:
+            return False
+        now = time.monotonic()
+        elapsed = now - self.persist_updated_at
+        self.persist_updated_at = now
+        self.persist_tokens = min(self.persist_capacity, self.persist_tokens + elapsed * self.persist_capacity / 60)
+        if self.persist_tokens < 1:
+            return False
+        self.persist_tokens -= 1
+        return True
+
+
+class ProcessOutputPump:
+    """프로세스 stdout/stderr 수집기"""
+
+    def __init__(
+        self,
+        buffer_lines: Optional[int] = None,
+        persist_per_minute: Optional[int] = None,
+        flush_interval_seconds: Optional[float] = None,
+        max_line_bytes: Optional[int] = None,
+        rate_window_seconds: Optional[int] = None
+    ):
+        self.buffer_lines = max(1, buffer_lines if buffer_lines is not None else int(
+            os.getenv('MCP_PROCESS_OUTPUT_BUFFER_LINES', '500')
+        ))
+        self.persist_per_minute = persist_per_minute if persist_per_minute is not None else int(
+            os.getenv('MCP_PROCESS_OUTPUT_PERSIST_PER_MINUTE', '300')
+        )
+        self.flush_interval_seconds = flush_interval_seconds if flush_interval_seconds is not None else float(
+            os.getenv('MCP_PROCESS_OUTPUT_FLUSH_INTERVAL_SECONDS', '2.0')
+        )
+        self.max_line_bytes = max(256, max_line_bytes if max_line_bytes is not None else int(
+            os.getenv('MCP_PROCESS_OUTPUT_MAX_LINE_BYTES', '8192')
+        ))
+        self.rate_window_seconds = max(1, rate_window_seconds if rate_window_seconds is not None else int(
+            os.getenv('MCP_PROCESS_OUTPUT_RATE_WINDOW_SECONDS', '10')
+        ))
+
+        self._servers: Dict[str, ServerOutputState] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._persisted = 0
+        self._persist_failures = 0
+        self._batches = 0
+
+    def attach(self, server_id: str, process: Any) -> ServerOutputState:
+        """
+        프로세스의 stdout/stderr 수집 시작
+
+        같은 서버가 재시작되면 버퍼와 카운터는 유지하고 읽기 태스크만 교체합니다.
+        """
+        server_key = str(server_id)
+        state = self._servers.get(server_key)
+        if state is None:
+            state = ServerOutputState(server_key, self.buffer_lines, self.persist_per_minute)
+            self._servers[server_key] = state
+
+        for task in state.readers:
+            task.cancel()
+        state.process = process
+        state.pid = process.pid
+        state.readers = [
+            asyncio.create_task(self._pump(state, stream, getattr(process, stream)))
+            for stream in STREAMS
+            if getattr(process, stream, None) is not None
+        ]
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+        logger.debug(f"📥 Output pump attached for server {server_key} (PID: {process.pid})")
+        return state
+
+    async def detach(self, server_id: str, timeout: float = 2.0):
+        """프로세스 종료 후 남은 출력을 읽고 저장 (버퍼는 UI 조회용으로 유지)"""
+        state = self._servers.get(str(server_id))
+        if state is None:
+            return
+
+        if state.readers:
+            # 종료된 프로세스는 곧 EOF를 돌려줌 - 오래 걸리면 취소
+            _, pending = await asyncio.wait(state.readers, timeout=timeout)
+            for task in pending:
+                task.cancel()
+        state.readers = []
+        state.process = None
+
+        await self.flush()
+
+    async def stop(self):
+        """모든 수집 태스크 정리 후 남은 로그 저장"""
+        for state in self._servers.values():
+            for task in state.readers:
+                task.cancel()
+            state.readers = []
+
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+
+        await self.flush()
+
+    def get_output(self, server_id: str, limit: int = 100, stream: Optional[str] = None) -> List[Dict[str, Any]]:
+        """링 버퍼의 최근 출력 줄 (오래된 순)"""
+        state = self._servers.get(str(server_id))
+        if state is None:
+            return []
+        lines = [line for line in state.lines if stream is None or line['stream'] == stream]
+        return lines[-limit:] if limit > 0 else []
+
+    def get_server_stats(self, server_id: str) -> Optional[Dict[str, Any]]:
+        """서버 한 대의 출력 통계"""
+        state = self._servers.get(str(server_id))
+        if state is None:
+            return None
+        return {
+            "pid": state.pid,
+            "attached": any(not task.done() for task in state.readers),
+            "buffered_lines": len(state.lines),
+            "total_bytes": dict(state.total_bytes),
+            "total_lines": dict(state.total_lines),
+            "bytes_per_second": state.bytes_per_second(self.rate_window_seconds),
+            "pending_persist": len(state.pending),
+            "suppressed_lines": state.suppressed_total,
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """전체 출력 수집 통계"""
+        return {
+            "servers": {server_id: self.get_server_stats(server_id) for server_id in self._servers},
+            "persisted": self._persisted,
+            "persist_failures": self._persist_failures,
+            "batches": self._batches,
+            "buffer_lines": self.buffer_lines,
+            "persist_per_minute": self.persist_per_minute,
+            "flush_interval_seconds": self.flush_interval_seconds,
+            "rate_window_seconds": self.rate_window_seconds,
+        }
+
+    async def _pump(self, state: ServerOutputState, stream: str, reader: asyncio.StreamReader):
+        """파이프를 EOF까지 청크 단위로 읽어 줄로 분리"""
+        partial = bytearray()
+        try:
+            while True:
+                chunk = await reader.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                state.record_bytes(stream, len(chunk), self.rate_window_seconds)
+
+                partial.extend(chunk)
+                start = 0
+                while True:
+                    newline = partial.find(b'\n', start)
+                    if newline < 0:
+                        break
+                    self._record_line(state, stream, bytes(partial[start:newline]))
+                    start = newline + 1
+                del partial[:start]
+
+                # 줄바꿈 없이 계속 들어오는 출력은 최대 길이에서 끊음
+                while len(partial) > self.max_line_bytes:
+                    self._record_line(state, stream, bytes(partial[:self.max_line_bytes]))
+                    del partial[:self.max_line_bytes]
+
+            if partial:
+                self._record_line(state, stream, bytes(partial))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"⚠️ Output pump for server {state.server_id} ({stream}) stopped: {e}")
+
+    def _record_line(self, state: ServerOutputState, stream: str, raw: bytes):
+        """한 줄을 링 버퍼에 넣고 저장 예산이 있으면 저장 대기열에 추가"""
+        text = raw[:self.max_line_bytes].decode('utf-8', errors='replace').rstrip('\r')
+        if not text.strip():
+            return
+
+        timestamp = datetime.utcnow()
+        level = _infer_level(stream, text)
+        state.total_lines[stream] += 1
+        state.lines.append({
+            "timestamp": timestamp.isoformat(),
+            "stream": stream,
+            "level": level.value,
+            "message": text,
+        })
+
+        if state.take_persist_token():
+            state.pending.append(self._log_row(state, stream, level, text, timestamp))
+        else:
+            state.suppressed += 1
+            state.suppressed_total += 1
+
+    @staticmethod
+    def _log_row(state: ServerOutputState, stream: str, level: LogLevel, message: str, timestamp: datetime) -> Dict[str, Any]:
+        return {
+            "server_id": UUID(state.server_id),
+            "level": level,
+            "category": LogCategory.SYSTEM,
+            "message": message,
+            "details": {"stream": stream, "pid": state.pid},
+            "timestamp": timestamp,
+        }
+
+    async def _flush_loop(self):
+        """주기적으로 저장 대기열을 한 번에 저장"""
+        while True:
+            await asyncio.sleep(self.flush_interval_seconds)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"❌ Process output flush failed: {e}")
+
+    async def flush(self):
+        """모든 서버의 저장 대기열을 하나의 배치로 저장"""
+        rows: List[Dict[str, Any]] = []
+        for state in self._servers.values():
+            if state.suppressed:
+                rows.append(self._log_row(
+                    state, 'stderr', LogLevel.WARNING,
+                    f"{state.suppressed} output lines not persisted (rate limit {self.persist_per_minute}/min)",
+                    datetime.utcnow()
+                ))
+                state.suppressed = 0
+            rows.extend(state.pending)
+            state.pending = []
+
+        if not rows:
+            return
+
+        try:
+            await asyncio.to_thread(self._write_rows, rows)
+            self._persisted += len(rows)
+            self._batches += 1
+        except Exception as e:
+            self._persist_failures += len(rows)
+            logger.error(f"❌ Failed to persist {len(rows)} process output lines: {e}")
+
+    @staticmethod
+    def _write_rows(rows: List[Dict[str, Any]]):
+        """ServerLogService로 일괄 저장 (스레드에서 실행)"""
+        from ..database import get_db
+        from .server_log_service import ServerLogService
+
+        db = next(get_db())
+        try:
+            ServerLogService(db).add_logs_bulk(rows)
+        finally:
+            db.close()
+
+
+# 글로벌 프로세스 출력 수집기 인스턴스
+process_output_pump = ProcessOutputPump()
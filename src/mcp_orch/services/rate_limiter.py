@@ -0,0 +1,299 @@
+"""
+API 키 속도 제한 서비스
+
+ApiKey.rate_limit_per_minute / rate_limit_per_day 를 토큰 버킷으로 적용합니다.
+키마다 분 단위, 일 단위 버킷 두 개를 두고 요청 한 건은 두 버킷에서
+동시에(원자적으로) 토큰을 하나씩 소비합니다.
+
+버킷 상태 저장소는 교체 가능합니다:
+- 기본값은 프로세스 메모리 (InMemoryRateLimitBackend)
+- MCP_RATE_LIMIT_BACKEND="패키지.모듈:클래스" 로 공유 저장소(Redis 등) 구현 지정 가능
+- MCP_RATE_LIMIT_ENABLED=false 로 전체 비활성화
+"""
+
+import asyncio
+import importlib
+import logging
+import math
+import os
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_MINUTE = 60
+SECONDS_PER_DAY = 86400
+
+
+@dataclass(frozen=True)
+class BucketSpec:
+    """토큰 버킷 정의"""
+    key: str
+    capacity: float
+    refill_per_second: float
+
+
+@dataclass
+class RateLimitDecision:
+    """속도 제한 판정 결과"""
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: float = 0.0
+    scope: str = "minute"
+
+    @property
+    def retry_after_seconds(self) -> int:
+        """Retry-After 헤더 값 (정수 초, 최소 1)"""
+        return max(1, math.ceil(self.retry_after))
+
+    def headers(self) -> Dict[str, str]:
+        """X-RateLimit-* 응답 헤더"""
+        headers = {
+            "X-RateLimit-Limit": str(self.limit),
+            "X-RateLimit-Remaining": str(max(0, self.remaining)),
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(self.retry_after_seconds)
+        return headers
+
+    def to_response(self, request_id: Any = None, jsonrpc: bool = False) -> JSONResponse:
+        """429 응답 생성 - MCP 메시지 경로는 JSON-RPC 오류 본문 사용"""
+        if jsonrpc:
+            content = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {
+                    "code": -32000,
+                    "message": "Rate limit exceeded",
+                    "data": {"scope": self.scope, "retry_after": self.retry_after_seconds}
+                }
+            }
+        else:
+            content = {
+                "error": "Rate limit exceeded",
+                "scope": self.scope,
+                "retry_after": self.retry_after_seconds
+            }
+        return JSONResponse(status_code=429, content=content, headers=self.headers())
+
+
+class RateLimitBackend(ABC):
+    """
+    버킷 상태 저장소 인터페이스
+
+    공유 저장소 구현은 acquire()를 원자적으로 처리해야 합니다.
+    (모든 버킷에 토큰이 있을 때만 모두 차감)
+    """
+
+    @abstractmethod
+    async def acquire(self, buckets: Sequence[BucketSpec], cost: float = 1.0) -> Tuple[bool, float, List[float]]:
+        """
+        Returns:
+            (허용 여부, 재시도까지 남은 초, 버킷별 남은 토큰)
+        """
+
+    @abstractmethod
+    async def reset(self, key_prefix: str):
+        """키 접두사에 해당하는 버킷 제거"""
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """프로세스 메모리 토큰 버킷 저장소 (워커별 독립)"""
+
+    def __init__(self, max_buckets: Optional[int] = None):
+        self.max_buckets = max_buckets if max_buckets is not None else int(
+            os.getenv('MCP_RATE_LIMIT_MAX_BUCKETS', '100000')
+        )
+        # key -> [tokens, updated_at]
+        self._buckets: Dict[str, List[float]] = {}
+        self._lock = asyncio.Lock()
+
+    def _refill(self, spec: BucketSpec, now: float) -> List[float]:
+        state = self._buckets.get(spec.key)
+        if state is None:
+            state = [spec.capacity, now]
+            self._buckets[spec.key] = state
+            return state
+        elapsed = max(0.0, now - state[1])
+        state[0] = min(spec.capacity, state[0] + elapsed * spec.refill_per_second)
+        state[1] = now
+        return state
+
+    async def acquire(self, buckets: Sequence[BucketSpec], cost: float = 1.0) -> Tuple[bool, float, List[float]]:
+        async with self._lock:
+            now = time.monotonic()
+            states = [self._refill(spec, now) for spec in buckets]
+
+            retry_after = 0.0
+            for spec, state in zip(buckets, states):
+                if state[0] < cost:
+                    deficit = cost - state[0]
+                    wait = deficit / spec.refill_per_second if spec.refill_per_second > 0 else float(SECONDS_PER_DAY)
+                    retry_after = max(retry_after, wait)
+
+            allowed = retry_after == 0.0
+            if allowed:
+                for state in states:
+                    state[0] -= cost
+
+            if len(self._buckets) > self.max_buckets:
+                self._evict_full_buckets(now)
+
+            return allowed, retry_after, [state[0] for state in states]
+
+    def _evict_full_buckets(self, now: float):
+        """오래 사용되지 않은 버킷 정리 (가득 찬 버킷과 동일하므로 손실 없음)"""
+        idle = [key for key, state in self._buckets.items() if now - state[1] > SECONDS_PER_DAY]
+        for key in idle:
+            del self._buckets[key]
+
+    async def reset(self, key_prefix: str):
+        async with self._lock:
+            for key in [key for key in self._buckets if key.startswith(key_prefix)]:
+                del self._buckets[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"backend": "memory", "buckets": len(self._buckets), "max_buckets": self.max_buckets}
+
+
+def _load_backend() -> RateLimitBackend:
+    """MCP_RATE_LIMIT_BACKEND 설정에 따라 저장소 생성 (실패 시 메모리 저장소)"""
+    backend_path = os.getenv('MCP_RATE_LIMIT_BACKEND', '').strip()
+    if not backend_path or backend_path == 'memory':
+        return InMemoryRateLimitBackend()
+
+    try:
+        module_name, _, class_name = backend_path.partition(':')
+        backend_class = getattr(importlib.import_module(module_name), class_name)
+        if not (isinstance(backend_class, type) and issubclass(backend_class, RateLimitBackend)):
+            raise TypeError(f"{backend_path} is not a RateLimitBackend subclass")
+        logger.info(f"🔧 Using rate limit backend: {backend_path}")
+        return backend_class()
+    except Exception as e:
+        logger.error(f"❌ Failed to load rate limit backend '{backend_path}', using memory backend: {e}")
+        return InMemoryRateLimitBackend()
+
+
+class ApiKeyRateLimiter:
+    """API 키 ID 기준 분/일 속도 제한기"""
+
+    def __init__(self, backend: Optional[RateLimitBackend] = None, enabled: Optional[bool] = None):
+        self.enabled = enabled if enabled is not None else (
+            os.getenv('MCP_RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+        )
+        self.backend = backend or _load_backend()
+        self._allowed = 0
+        self._limited = 0
+        self._errors = 0
+
+    def set_backend(self, backend: RateLimitBackend):
+        """저장소 교체 (공유 저장소 연결 또는 로컬 대체 구현)"""
+        self.backend = backend
+
+    async def check(
+        self,
+        api_key_id: Any,
+        per_minute: Optional[int],
+        per_day: Optional[int]
+    ) -> Optional[RateLimitDecision]:
+        """
+        요청 한 건에 대한 토큰 소비
+
+        Returns:
+            RateLimitDecision 또는 None (제한 없음/비활성화)
+        """
+        if not self.enabled:
+            return None
+
+        specs: List[Tuple[str, int, BucketSpec]] = []
+        if per_minute and per_minute > 0:
+            specs.append(("minute", per_minute, BucketSpec(
+                key=f"{api_key_id}:minute",
+                capacity=float(per_minute),
+                refill_per_second=per_minute / SECONDS_PER_MINUTE
+            )))
+        if per_day and per_day > 0:
+            specs.append(("day", per_day, BucketSpec(
+                key=f"{api_key_id}:day",
+                capacity=float(per_day),
+                refill_per_second=per_day / SECONDS_PER_DAY
+            )))
+        if not specs:
+            return None
+
+        try:
+            allowed, retry_after, remaining = await self.backend.acquire([spec for _, _, spec in specs])
+        except Exception as e:
+            # 저장소 장애 시 요청을 막지 않음 (fail-open)
+            self._errors += 1
+            logger.error(f"❌ Rate limit backend error for API key {api_key_id}: {e}")
+            return None
+
+        # 가장 여유가 적은 버킷을 대표로 보고
+        index = min(range(len(specs)), key=lambda i: remaining[i] / specs[i][1])
+        scope, limit, _ = specs[index]
+        decision = RateLimitDecision(
+            allowed=allowed,
+            limit=limit,
+            remaining=int(remaining[index]),
+            retry_after=retry_after,
+            scope=scope
+        )
+
+        if allowed:
+            self._allowed += 1
+        else:
+            self._limited += 1
+            logger.warning(f"🚦 Rate limit exceeded for API key {api_key_id} ({scope}, retry after {decision.retry_after_seconds}s)")
+        return decision
+
+    async def check_principal(self, principal: Any) -> Optional[RateLimitDecision]:
+        """캐시된 API 키 인증 결과(CachedApiKeyPrincipal) 기준 확인"""
+        if principal is None:
+            return None
+        return await self.check(
+            principal.api_key_id,
+            principal.rate_limit_per_minute,
+            principal.rate_limit_per_day
+        )
+
+    async def check_request(self, request: Any, principal: Any = None) -> Optional[RateLimitDecision]:
+        """
+        요청 단위 확인 - 미들웨어에서 이미 확인한 요청은 다시 소비하지 않음
+
+        Args:
+            request: FastAPI Request
+            principal: 요청 헤더에 API 키가 없을 때 사용할 세션의 API 키 인증 결과
+        """
+        if getattr(request.state, 'rate_limit_checked', False):
+            return None
+        principal = getattr(request.state, 'api_key', None) or principal
+        decision = await self.check_principal(principal)
+        request.state.rate_limit_checked = True
+        return decision
+
+    async def reset(self, api_key_id: Any):
+        """API 키의 버킷 초기화 - 한도 변경 시 호출"""
+        await self.backend.reset(f"{api_key_id}:")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """속도 제한 통계"""
+        return {
+            "enabled": self.enabled,
+            "allowed": self._allowed,
+            "limited": self._limited,
+            "backend_errors": self._errors,
+            **self.backend.get_stats(),
+        }
+
+
+# 글로벌 API 키 속도 제한기 인스턴스
+api_key_rate_limiter = ApiKeyRateLimiter()
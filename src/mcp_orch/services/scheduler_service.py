@@ -6,14 +6,22 @@ APScheduler 기반 백그라운드 워커 서비스
 
 import logging
 import asyncio
+import hashlib
+import json
+import os
+import random
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Any
+from uuid import UUID, uuid4
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.jobstores.memory import MemoryJobStore
 from apscheduler import events
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
 
 from ..database import get_db
@@ -24,6 +32,24 @@ from ..services.server_status_service import ServerStatusService
 
 logger = logging.getLogger(__name__)
 
+# 작업 이력 소요 시간 히스토그램 버킷 (초)
+TIMING_BUCKETS = (0.1, 0.5, 1, 2, 5, 10, 30, 60)
+
+
+@dataclass
+class ServerCheckResult:
+    """서버 한 대의 점검 결과 (DB 반영 전)"""
+    server_id: UUID
+    server_name: str
+    project_id: UUID
+    status: Optional[McpServerStatus] = None
+    tools: Optional[List[Dict]] = None
+    error: Optional[str] = None
+    timed_out: bool = False
+    check_seconds: float = 0.0
+    tools_seconds: float = 0.0
+    total_seconds: float = 0.0
+
 
 class SchedulerService:
     """APScheduler 기반 백그라운드 워커 관리 서비스"""
@@ -36,6 +62,12 @@ class SchedulerService:
         self.max_history_size = 100
         self._config_loaded = False
         
+        # 점검 주기 동시성/마감/분산/커밋 배치 설정
+        self.max_concurrency = max(1, int(os.getenv('MCP_SCHEDULER_MAX_CONCURRENCY', '10')))
+        self.server_deadline_seconds = float(os.getenv('MCP_SCHEDULER_SERVER_DEADLINE_SECONDS', '45'))
+        self.jitter_ratio = min(1.0, max(0.0, float(os.getenv('MCP_SCHEDULER_JITTER_RATIO', '0.5'))))
+        self.commit_batch_size = max(1, int(os.getenv('MCP_SCHEDULER_COMMIT_BATCH_SIZE', '25')))
+        
     async def load_config_from_db(self):
         """데이터베이스에서 워커 설정 로드"""
         try:
@@ -196,146 +228,85 @@ class SchedulerService:
         """작업 실행 이력 조회"""
         return self.job_history[-limit:] if limit else self.job_history
         
-    async def _check_all_servers_status(self):
-        """모든 활성 서버의 상태를 확인하고 업데이트"""
+    async def _check_all_servers_status(self, spread: bool = True):
+        """
+        모든 활성 서버의 상태를 확인하고 업데이트
+        
+        - 서버 목록만 짧은 DB 세션으로 읽고, 점검은 DB 세션 없이 동시 실행 (최대 max_concurrency)
+        - spread=True면 시작 시점을 점검 간격의 jitter_ratio 구간에 고르게 분산
+        - 서버별 마감 시간(server_deadline_seconds)을 넘기면 ERROR로 기록
+        - 결과는 commit_batch_size 단위로 모아서 한 세션/한 커밋으로 반영
+        """
         start_time = datetime.now()
+        sweep_started = time.monotonic()
         logger.info("Starting scheduled server status check")
         
         try:
-            # 데이터베이스 세션 획득
-            db = next(get_db())
+            targets = self._load_sweep_targets()
             
-            try:
-                # 모든 활성화된 서버 조회
-                servers = db.query(McpServer).filter(
-                    McpServer.is_enabled == True
-                ).all()
-                
-                checked_count = 0
-                updated_count = 0
-                error_count = 0
-                tools_synced_count = 0
-                
-                for server in servers:
-                    try:
-                        # 서버 상태 확인
-                        server_config = {
-                            'command': server.command,
-                            'args': server.args or [],
-                            'env': server.env or {},
-                            'timeout': 30
-                        }
-                        
-                        unique_server_id = f"{server.project_id}_{server.name}"
-                        status = await mcp_connection_service.check_server_status(
-                            unique_server_id, server_config
-                        )
-                        
-                        # 🔄 개선된 상태 업데이트: ServerStatusService 사용
-                        if status == "online":
-                            new_status = McpServerStatus.ACTIVE
-                        elif status == "offline":
-                            new_status = McpServerStatus.INACTIVE
-                        else:
-                            new_status = McpServerStatus.ERROR
-                            
-                        # 상태가 변경된 경우만 업데이트
-                        if server.status != new_status:
-                            # ServerStatusService를 통한 통합 상태 업데이트
-                            success = await ServerStatusService.update_server_status_by_name(
-                                server_name=server.name,
-                                project_id=server.project_id,
-                                status=new_status,
-                                db=db,
-                                connection_type="SCHEDULER_CHECK",
-                                error_message=str(e) if new_status == McpServerStatus.ERROR else None
-                            )
-                            
-                            if success:
-                                updated_count += 1
-                                logger.info(f"📊 [SCHEDULER] Updated server {server.name} status: {server.status} → {new_status.value}")
-                            else:
-                                logger.warning(f"⚠️ [SCHEDULER] Failed to update server {server.name} status via ServerStatusService")
-                                # 폴백: 직접 업데이트
-                                server.status = new_status
-                                server.last_used_at = datetime.utcnow()
-                                updated_count += 1
-                        
-                        # 온라인 서버의 도구 목록 동기화
-                        if new_status == McpServerStatus.ACTIVE:
-                            try:
-                                tools_updated = await self._sync_server_tools(server, db)
-                                if tools_updated > 0:
-                                    tools_synced_count += tools_updated
-                                    logger.info(f"Synced {tools_updated} tools for server {server.name}")
-                                    
-                                    # 🆕 도구 목록이 변경된 경우 Tool Preference 캐시 무효화
-                                    try:
-                                        from .cache_invalidation_service import CacheInvalidationService
-                                        await CacheInvalidationService.on_tool_list_changed(
-                                            project_id=server.project_id,
-                                            server_id=server.id
-                                        )
-                                        logger.info(f"🔄 [SCHEDULER] Invalidated tool filtering cache for {server.name}")
-                                    except Exception as cache_error:
-                                        logger.error(f"❌ [SCHEDULER] Failed to invalidate tool cache: {cache_error}")
-                                        # 캐시 무효화 실패는 도구 동기화에 영향을 주지 않음
-                                        
-                            except Exception as tool_sync_error:
-                                logger.error(f"Failed to sync tools for server {server.name}: {tool_sync_error}")
-                                # 도구 동기화 실패는 서버 상태에 영향을 주지 않음
-                            
-                        checked_count += 1
-                        
-                    except Exception as e:
-                        error_count += 1
-                        logger.error(f"Error checking server {server.name}: {e}")
-                        
-                        # 🔄 에러 상태 업데이트: ServerStatusService 사용
-                        try:
-                            await ServerStatusService.update_server_status_by_name(
-                                server_name=server.name,
-                                project_id=server.project_id,
-                                status=McpServerStatus.ERROR,
-                                db=db,
-                                connection_type="SCHEDULER_ERROR",
-                                error_message=str(e)
-                            )
-                        except Exception as update_error:
-                            logger.error(f"❌ Failed to update error status via ServerStatusService: {update_error}")
-                            # 폴백: 직접 업데이트
-                            server.status = McpServerStatus.ERROR
-                            server.last_error = str(e)
-                            server.last_used_at = datetime.utcnow()
-                        
-                # 변경사항 커밋
-                db.commit()
-                
-                execution_time = (datetime.now() - start_time).total_seconds()
-                
-                # 실행 이력 저장
-                self._add_job_history({
-                    'timestamp': start_time.isoformat(),
-                    'duration': execution_time,
-                    'checked_count': checked_count,
-                    'updated_count': updated_count,
-                    'error_count': error_count,
-                    'tools_synced_count': tools_synced_count,
-                    'status': 'success'
-                })
-                
-                logger.info(
-                    f"Scheduled server check completed: "
-                    f"checked={checked_count}, updated={updated_count}, "
-                    f"tools_synced={tools_synced_count}, errors={error_count}, "
-                    f"duration={execution_time:.2f}s"
+            spread_seconds = self.config['server_check_interval'] * self.jitter_ratio if spread else 0.0
+            offsets = self._jittered_offsets(len(targets), spread_seconds)
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            
+            tasks = [
+                asyncio.create_task(self._probe_server(target, offset, semaphore))
+                for target, offset in zip(targets, offsets)
+            ]
+            
+            counters = {'updated': 0, 'tools_synced': 0, 'errors': 0}
+            results: List[ServerCheckResult] = []
+            commit_durations: List[float] = []
+            batch: List[ServerCheckResult] = []
+            
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                results.append(result)
+                batch.append(result)
+                if len(batch) >= self.commit_batch_size:
+                    commit_durations.append(await self._apply_results(batch, counters))
+                    batch = []
+            if batch:
+                commit_durations.append(await self._apply_results(batch, counters))
+            
+            execution_time = time.monotonic() - sweep_started
+            error_count = counters['errors'] + sum(1 for result in results if result.error)
+            timeout_count = sum(1 for result in results if result.timed_out)
+            
+            # 실행 이력 저장
+            self._add_job_history({
+                'timestamp': start_time.isoformat(),
+                'duration': execution_time,
+                'checked_count': len(results),
+                'updated_count': counters['updated'],
+                'error_count': error_count,
+                'timeout_count': timeout_count,
+                'tools_synced_count': counters['tools_synced'],
+                'concurrency': self.max_concurrency,
+                'spread_seconds': spread_seconds,
+                'commit_batches': len(commit_durations),
+                'timings': {
+                    'check': self._timing_histogram([r.check_seconds for r in results]),
+                    'tools': self._timing_histogram([r.tools_seconds for r in results if r.tools is not None]),
+                    'server': self._timing_histogram([r.total_seconds for r in results]),
+                    'commit': self._timing_histogram(commit_durations),
+                },
+                'status': 'success'
+            })
+            
+            logger.info(
+                f"Scheduled server check completed: "
+                f"checked={len(results)}, updated={counters['updated']}, "
+                f"tools_synced={counters['tools_synced']}, errors={error_count}, "
+                f"timeouts={timeout_count}, duration={execution_time:.2f}s"
+            )
+            if execution_time > self.config['server_check_interval']:
+                logger.warning(
+                    f"⚠️ [SCHEDULER] Sweep took {execution_time:.1f}s, longer than the "
+                    f"{self.config['server_check_interval']}s interval - consider raising MCP_SCHEDULER_MAX_CONCURRENCY"
                 )
                 
-            finally:
-                db.close()
-                
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = time.monotonic() - sweep_started
             logger.error(f"Scheduled server check failed: {e}")
             
             # 실행 이력 저장 (실패)
@@ -345,6 +316,191 @@ class SchedulerService:
                 'error': str(e),
                 'status': 'error'
             })
+    
+    def _load_sweep_targets(self) -> List[Dict[str, Any]]:
+        """활성 서버 목록을 점검용 스냅샷으로 읽고 DB 세션은 바로 반환"""
+        db = next(get_db())
+        try:
+            servers = db.query(McpServer).filter(
+                McpServer.is_enabled == True
+            ).all()
+            return [
+                {
+                    'id': server.id,
+                    'name': server.name,
+                    'project_id': server.project_id,
+                    'unique_server_id': f"{server.project_id}_{server.name}",
+                    'config': {
+                        'command': server.command,
+                        'args': server.args or [],
+                        'env': server.env or {},
+                        'timeout': 30
+                    }
+                }
+                for server in servers
+            ]
+        finally:
+            db.close()
+    
+    @staticmethod
+    def _jittered_offsets(count: int, spread_seconds: float) -> List[float]:
+        """점검 시작 지연 - 구간을 서버 수만큼 나눈 슬롯 안에서 무작위 (몰림 방지)"""
+        if count == 0 or spread_seconds <= 0:
+            return [0.0] * count
+        slot = spread_seconds / count
+        offsets = [(index + random.random()) * slot for index in range(count)]
+        random.shuffle(offsets)
+        return offsets
+    
+    async def _probe_server(
+        self,
+        target: Dict[str, Any],
+        offset: float,
+        semaphore: asyncio.Semaphore
+    ) -> 'ServerCheckResult':
+        """서버 하나의 상태 확인 및 도구 목록 조회 (DB 접근 없음, 예외를 결과로 반환)"""
+        result = ServerCheckResult(
+            server_id=target['id'],
+            server_name=target['name'],
+            project_id=target['project_id']
+        )
+        if offset > 0:
+            await asyncio.sleep(offset)
+        
+        async with semaphore:
+            started = time.monotonic()
+            deadline = started + self.server_deadline_seconds
+            try:
+                status = await asyncio.wait_for(
+                    mcp_connection_service.check_server_status(target['unique_server_id'], target['config']),
+                    timeout=self.server_deadline_seconds
+                )
+                result.check_seconds = time.monotonic() - started
+                
+                if status == "online":
+                    result.status = McpServerStatus.ACTIVE
+                elif status == "offline":
+                    result.status = McpServerStatus.INACTIVE
+                else:
+                    result.status = McpServerStatus.ERROR
+                    result.error = f"Status check returned '{status}'"
+                
+                # 온라인 서버의 도구 목록 조회 (남은 마감 시간 안에서)
+                if result.status == McpServerStatus.ACTIVE:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError()
+                    tools_started = time.monotonic()
+                    result.tools = await asyncio.wait_for(
+                        mcp_connection_service.get_server_tools(target['unique_server_id'], target['config']),
+                        timeout=remaining
+                    )
+                    result.tools_seconds = time.monotonic() - tools_started
+                    
+            except asyncio.TimeoutError:
+                result.timed_out = True
+                if result.status is None:
+                    result.check_seconds = time.monotonic() - started
+                    result.status = McpServerStatus.ERROR
+                    result.error = f"Status check exceeded {self.server_deadline_seconds:.0f}s deadline"
+                else:
+                    # 상태 확인은 성공, 도구 동기화만 이번 주기에서 건너뜀
+                    logger.warning(f"⏱️ [SCHEDULER] Tool listing for {target['name']} exceeded deadline, skipping sync")
+            except Exception as e:
+                logger.error(f"Error checking server {target['name']}: {e}")
+                result.status = McpServerStatus.ERROR
+                result.error = str(e)
+            
+            result.total_seconds = time.monotonic() - started
+        return result
+    
+    async def _apply_results(self, batch: List['ServerCheckResult'], counters: Dict[str, int]) -> float:
+        """점검 결과 묶음을 한 세션에서 반영하고 한 번 커밋 - 소요 시간 반환"""
+        started = time.monotonic()
+        tool_changes = []
+        
+        db = next(get_db())
+        try:
+            # 묶음의 서버들을 한 번의 SELECT로 로드
+            server_ids = [result.server_id for result in batch]
+            servers = {
+                server.id: server
+                for server in db.execute(
+                    select(McpServer).where(McpServer.id.in_(server_ids))
+                ).scalars()
+            }
+            
+            for result in batch:
+                server = servers.get(result.server_id)
+                if server is None:
+                    continue
+                
+                # 상태가 변경된 경우만 업데이트
+                if result.status is not None and server.status != result.status:
+                    old_status = ServerStatusService.apply_status(
+                        server,
+                        result.status,
+                        connection_type="SCHEDULER_ERROR" if result.error else "SCHEDULER_CHECK",
+                        error_message=result.error
+                    )
+                    counters['updated'] += 1
+                    logger.info(f"📊 [SCHEDULER] Updated server {server.name} status: {old_status} → {result.status.value}")
+                
+                # 온라인 서버의 도구 목록 동기화
+                if result.tools is not None:
+                    tools_updated = await self._sync_server_tools(server, db, result.tools)
+                    if tools_updated > 0:
+                        counters['tools_synced'] += tools_updated
+                        tool_changes.append((server.project_id, server.id))
+                        logger.info(f"Synced {tools_updated} tools for server {server.name}")
+            
+            # 변경사항 커밋 (배치 단위)
+            db.commit()
+            
+        except Exception as e:
+            db.rollback()
+            # 점검 단계에서 이미 오류로 집계된 서버는 중복 집계하지 않음
+            counters['errors'] += sum(1 for result in batch if not result.error)
+            tool_changes = []
+            logger.error(f"❌ [SCHEDULER] Failed to commit batch of {len(batch)} server results: {e}")
+        finally:
+            db.close()
+        
+        # 🆕 도구 목록이 변경된 경우 커밋 후 Tool Preference/카탈로그 캐시 무효화
+        for project_id, server_id in tool_changes:
+            try:
+                from .cache_invalidation_service import CacheInvalidationService
+                await CacheInvalidationService.on_tool_list_changed(
+                    project_id=project_id,
+                    server_id=server_id
+                )
+            except Exception as cache_error:
+                logger.error(f"❌ [SCHEDULER] Failed to invalidate tool cache: {cache_error}")
+                # 캐시 무효화 실패는 도구 동기화에 영향을 주지 않음
+        
+        return time.monotonic() - started
+    
+    @staticmethod
+    def _timing_histogram(samples: List[float]) -> Dict[str, Any]:
+        """소요 시간 분포 (누적 버킷 + 요약값, 초 단위)"""
+        if not samples:
+            return {'count': 0}
+        ordered = sorted(samples)
+        
+        def percentile(ratio: float) -> float:
+            return round(ordered[min(len(ordered) - 1, int(ratio * len(ordered)))], 3)
+        
+        buckets = {f"le_{bound}": sum(1 for sample in ordered if sample <= bound) for bound in TIMING_BUCKETS}
+        buckets['le_inf'] = len(ordered)
+        return {
+            'count': len(ordered),
+            'min': round(ordered[0], 3),
+            'max': round(ordered[-1], 3),
+            'mean': round(sum(ordered) / len(ordered), 3),
+            'p50': percentile(0.5),
+            'p95': percentile(0.95),
+            'buckets': buckets
+        }
             
     def _job_executed(self, event):
         """작업 실행 완료 이벤트 핸들러"""
@@ -354,68 +510,135 @@ class SchedulerService:
         """작업 실행 오류 이벤트 핸들러"""
         logger.error(f"Job {event.job_id} failed: {event.exception}")
         
-    async def _sync_server_tools(self, server: McpServer, db: Session) -> int:
-        """서버의 도구 목록을 동기화하고 업데이트된 도구 개수 반환"""
+    async def _sync_server_tools(
+        self,
+        server: McpServer,
+        db: Session,
+        current_tools: Optional[List[Dict]] = None
+    ) -> int:
+        """서버의 도구 목록을 동기화하고 변경된 도구 개수 반환 - 목록 해시가 같으면 건너뜀 (current_tools가 없으면 서버에서 조회)"""
+        savepoint = None
         try:
-            # 서버 설정 준비
-            server_config = {
-                'command': server.command,
-                'args': server.args or [],
-                'env': server.env or {},
-                'timeout': 30
-            }
+            if current_tools is None:
+                # 서버 설정 준비
+                server_config = {
+                    'command': server.command,
+                    'args': server.args or [],
+                    'env': server.env or {},
+                    'timeout': 30
+                }
+                
+                unique_server_id = f"{server.project_id}_{server.name}"
+                
+                # 실제 서버에서 도구 목록 가져오기
+                current_tools = await mcp_connection_service.get_server_tools(
+                    unique_server_id, server_config
+                )
             
-            unique_server_id = f"{server.project_id}_{server.name}"
+            # 도구별/서버별 내용 해시 계산 - 도구 목록이 그대로면 DB를 건드리지 않음
+            current_by_name = {}
+            for tool_data in current_tools:
+                tool_name = tool_data.get('name')
+                if tool_name:
+                    current_by_name[tool_name] = (tool_data, self._tool_content_hash(tool_data))
             
-            # 실제 서버에서 도구 목록 가져오기
-            current_tools = await mcp_connection_service.get_server_tools(
-                unique_server_id, server_config
+            tools_hash = self._tool_set_hash(
+                {name: content_hash for name, (_, content_hash) in current_by_name.items()}
             )
+            if server.tools_hash == tools_hash:
+                logger.debug(f"Tool list unchanged for server {server.name}, skipping sync")
+                return 0
             
-            # 현재 DB에 저장된 도구 목록
-            existing_tools = {tool.name: tool for tool in server.tools}
-            current_tool_names = {tool.get('name') for tool in current_tools if tool.get('name')}
+            # 배치 세션을 공유하므로 SAVEPOINT 안에서 반영
+            # (실패하면 이 서버의 동기화만 롤백되고 같은 배치의 다른 서버 결과는 유지)
+            savepoint = db.begin_nested()
             
-            tools_updated = 0
+            # 현재 DB에 저장된 도구 목록 (스키마 본문은 읽지 않고 해시만 비교)
+            existing_rows = db.execute(
+                select(McpTool.id, McpTool.name, McpTool.content_hash)
+                .where(McpTool.server_id == server.id)
+            ).all()
+            existing_by_name = {row.name: row for row in existing_rows}
             
-            # 새로운 도구 추가 또는 기존 도구 업데이트
-            for tool_data in current_tools:
-                tool_name = tool_data.get('name')
-                if not tool_name:
-                    continue
-                    
-                if tool_name in existing_tools:
-                    # 기존 도구 업데이트
-                    existing_tool = existing_tools[tool_name]
-                    existing_tool.description = tool_data.get('description', '')
-                    existing_tool.input_schema = tool_data.get('inputSchema', {})
-                    existing_tool.last_seen_at = datetime.utcnow()
-                else:
+            now = datetime.utcnow()
+            inserts = []
+            updates = []
+            for tool_name, (tool_data, content_hash) in current_by_name.items():
+                existing = existing_by_name.get(tool_name)
+                if existing is None:
                     # 새로운 도구 추가
-                    new_tool = McpTool(
-                        server_id=server.id,
-                        name=tool_name,
-                        display_name=tool_data.get('displayName') or tool_name,
-                        description=tool_data.get('description', ''),
-                        input_schema=tool_data.get('inputSchema', {}),
-                        discovered_at=datetime.utcnow(),
-                        last_seen_at=datetime.utcnow()
-                    )
-                    db.add(new_tool)
-                    tools_updated += 1
-                    
+                    inserts.append({
+                        'id': uuid4(),
+                        'server_id': server.id,
+                        'name': tool_name,
+                        'display_name': tool_data.get('displayName') or tool_name,
+                        'description': tool_data.get('description', ''),
+                        'input_schema': self._tool_input_schema(tool_data),
+                        'content_hash': content_hash,
+                        'discovered_at': now,
+                        'last_seen_at': now
+                    })
+                elif existing.content_hash != content_hash:
+                    # 내용이 바뀐 도구만 업데이트
+                    updates.append({
+                        'id': existing.id,
+                        'display_name': tool_data.get('displayName') or tool_name,
+                        'description': tool_data.get('description', ''),
+                        'input_schema': self._tool_input_schema(tool_data),
+                        'content_hash': content_hash,
+                        'last_seen_at': now,
+                        'updated_at': now
+                    })
+            
             # 더 이상 존재하지 않는 도구 제거
-            for tool_name, tool in existing_tools.items():
-                if tool_name not in current_tool_names:
-                    db.delete(tool)
-                    tools_updated += 1
-                    
+            stale_ids = [row.id for name, row in existing_by_name.items() if name not in current_by_name]
+            
+            # 변경 종류별로 한 번씩 일괄 실행
+            if inserts:
+                db.execute(insert(McpTool), inserts)
+            if updates:
+                db.execute(update(McpTool), updates)
+            if stale_ids:
+                db.execute(
+                    delete(McpTool).where(McpTool.id.in_(stale_ids)),
+                    execution_options={'synchronize_session': False}
+                )
+            server.tools_hash = tools_hash
+            savepoint.commit()
+            
+            tools_updated = len(inserts) + len(updates) + len(stale_ids)
             return tools_updated
             
         except Exception as e:
+            if savepoint is not None and savepoint.is_active:
+                savepoint.rollback()
             logger.error(f"Error syncing tools for server {server.name}: {e}")
             return 0
 
+    @staticmethod
+    def _tool_input_schema(tool_data: Dict) -> Dict:
+        """도구 입력 스키마 - 세션 매니저는 inputSchema를 schema로 바꿔서 반환"""
+        return tool_data.get('schema', tool_data.get('inputSchema', {}))
+    
+    @staticmethod
+    def _tool_content_hash(tool_data: Dict) -> str:
+        """도구 한 개의 내용 해시 (표시 이름, 설명, 입력 스키마)"""
+        payload = {
+            'displayName': tool_data.get('displayName') or tool_data.get('name'),
+            'description': tool_data.get('description', ''),
+            'inputSchema': SchedulerService._tool_input_schema(tool_data)
+        }
+        encoded = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+    
+    @staticmethod
+    def _tool_set_hash(content_hashes: Dict[str, str]) -> str:
+        """서버 도구 목록 전체의 해시 (도구 순서와 무관)"""
+        digest = hashlib.sha256()
+        for name in sorted(content_hashes):
+            digest.update(f"{name}\0{content_hashes[name]}\n".encode())
+        return digest.hexdigest()
+    
     def _add_job_history(self, entry: Dict):
         """작업 실행 이력 추가"""
         self.job_history.append(entry)
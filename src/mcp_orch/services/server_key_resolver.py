@@ -0,0 +1,323 @@
+"""
+서버 키 해석 서비스
+
+동일한 MCP 서버를 가리키는 여러 식별자 표기를 하나의 정규 키(서버 UUID)로 해석
+- "{project_id}.{server_name}" (unified/SDK bridge/SSE 라우트)
+- "{project_id}_{server_name}" (스케줄러)
+- "{project_id}:{server_id}" (McpConfigManager.generate_unique_server_id)
+- "{server_id}" (UUID 문자열)
+
+해석 결과는 TTL 동안 메모리에 캐시되며, 서버 생성/이름 변경/삭제 시
+CacheInvalidationService를 통해 즉시 무효화됩니다.
+무효화 이전에 시작된 조회 결과는 세대(generation) 비교로 저장하지 않습니다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import select
+
+logger = logging.getLogger(__name__)
+
+_UUID_LENGTH = 36
+_ALIAS_SEPARATORS = ('.', '_', ':')
+_NOT_LOADED = object()
+
+
+@dataclass(frozen=True)
+class ResolvedServer:
+    """해석된 서버 식별 정보"""
+    server_id: UUID
+    project_id: UUID
+    name: str
+
+    @property
+    def canonical_key(self) -> str:
+        """세션 매니저에서 사용하는 정규 키"""
+        return str(self.server_id)
+
+    @property
+    def status_key(self) -> str:
+        """ServerStatusService가 기대하는 "project_id.server_name" 형식"""
+        return f"{self.project_id}.{self.name}"
+
+
+@dataclass
+class _CacheEntry:
+    """캐시 항목 - resolved가 None이면 "존재하지 않음" 캐시"""
+    resolved: Optional[ResolvedServer]
+    project_id: Optional[UUID]
+    expires_at: float
+
+
+class ServerKeyResolver:
+    """서버 별칭 → 서버 UUID 해석기 (TTL 캐시)"""
+
+    def __init__(self, ttl_seconds: Optional[float] = None, negative_ttl_seconds: Optional[float] = None):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv('MCP_SERVER_KEY_CACHE_TTL_SECONDS', '300')
+        )
+        self.negative_ttl_seconds = negative_ttl_seconds if negative_ttl_seconds is not None else float(
+            os.getenv('MCP_SERVER_KEY_CACHE_NEGATIVE_TTL_SECONDS', '30')
+        )
+        self._by_alias: Dict[str, _CacheEntry] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def parse_key(server_key: str) -> Tuple[Optional[UUID], Optional[UUID], Optional[str]]:
+        """
+        서버 키를 (project_id, server_id, server_name)으로 분해 (DB 조회 없음)
+
+        Returns:
+            tuple: 알 수 없는 부분은 None
+        """
+        try:
+            return None, UUID(server_key), None
+        except (ValueError, TypeError, AttributeError):
+            pass
+
+        if (
+            isinstance(server_key, str)
+            and len(server_key) > _UUID_LENGTH + 1
+            and server_key[_UUID_LENGTH] in _ALIAS_SEPARATORS
+        ):
+            try:
+                project_id = UUID(server_key[:_UUID_LENGTH])
+            except ValueError:
+                return None, None, None
+
+            separator = server_key[_UUID_LENGTH]
+            rest = server_key[_UUID_LENGTH + 1:]
+            if separator == ':':
+                try:
+                    return project_id, UUID(rest), None
+                except ValueError:
+                    pass
+            return project_id, None, rest
+
+        return None, None, None
+
+    def resolve(self, server_key: str) -> Optional[ResolvedServer]:
+        """서버 키를 해석 (캐시 우선, 미스 시 동기 DB 조회) - 동기 호출자용"""
+        cached = self._lookup_cache(server_key)
+        if cached is not _NOT_LOADED:
+            return cached
+
+        project_id, server_id, server_name = self.parse_key(server_key)
+        if server_id is None and server_name is None:
+            return None
+
+        generation = self._generation
+        return self._store(server_key, project_id, self._load(project_id, server_id, server_name), generation)
+
+    async def resolve_async(self, server_key: str) -> Optional[ResolvedServer]:
+        """서버 키를 해석 - 캐시 미스 시 async 엔진으로 조회해 이벤트 루프를 막지 않음"""
+        cached = self._lookup_cache(server_key)
+        if cached is not _NOT_LOADED:
+            return cached
+
+        project_id, server_id, server_name = self.parse_key(server_key)
+        if server_id is None and server_name is None:
+            return None
+
+        # 같은 키에 대한 동시 조회는 하나로 합침
+        pending = self._inflight.get(server_key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[server_key] = future
+        try:
+            generation = self._generation
+            loaded = await self._load_async(project_id, server_id, server_name)
+            resolved = self._store(server_key, project_id, loaded, generation)
+            future.set_result(resolved)
+            return resolved
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없을 때 경고 방지
+            raise
+        finally:
+            if self._inflight.get(server_key) is future:
+                del self._inflight[server_key]
+
+    def canonical_key(self, server_key: str) -> str:
+        """정규 키 반환 - 해석할 수 없는 키는 그대로 사용"""
+        uuid_key = self._uuid_key(server_key)
+        if uuid_key:
+            return uuid_key
+        resolved = self.resolve(server_key)
+        return resolved.canonical_key if resolved else server_key
+
+    async def canonical_key_async(self, server_key: str) -> str:
+        """정규 키 반환 (비동기) - 해석할 수 없는 키는 그대로 사용"""
+        uuid_key = self._uuid_key(server_key)
+        if uuid_key:
+            return uuid_key
+        resolved = await self.resolve_async(server_key)
+        return resolved.canonical_key if resolved else server_key
+
+    @staticmethod
+    def _uuid_key(server_key: str) -> Optional[str]:
+        """UUID 형태의 키는 DB 조회 없이 그대로 정규 키"""
+        if isinstance(server_key, str) and len(server_key) == _UUID_LENGTH:
+            try:
+                return str(UUID(server_key))
+            except ValueError:
+                return None
+        return None
+
+    def invalidate(self, server_id: Optional[UUID] = None, project_id: Optional[UUID] = None) -> int:
+        """서버(또는 프로젝트) 관련 캐시 항목 제거 - 생성/이름 변경/삭제 시 호출"""
+        # 진행 중인 조회는 결과를 캐시하지 않고, 이후 요청은 새로 조회
+        self._generation += 1
+        self._inflight.clear()
+        if server_id is None and project_id is None:
+            removed = len(self._by_alias)
+            self._by_alias.clear()
+        else:
+            stale = [
+                alias for alias, entry in self._by_alias.items()
+                if (server_id is not None and entry.resolved is not None and entry.resolved.server_id == server_id)
+                or (project_id is not None and entry.project_id == project_id)
+            ]
+            for alias in stale:
+                del self._by_alias[alias]
+            removed = len(stale)
+
+        self._invalidations += removed
+        if removed:
+            logger.debug(f"🔄 [CACHE] Invalidated {removed} server key entries (server={server_id}, project={project_id})")
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 히트/미스 통계"""
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._by_alias),
+            "hits": self._hits,
+            "misses": self._misses,
+            "invalidations": self._invalidations,
+            "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            "ttl_seconds": self.ttl_seconds,
+            "negative_ttl_seconds": self.negative_ttl_seconds,
+        }
+
+    def _lookup_cache(self, server_key: str) -> Any:
+        """캐시 조회 - 없거나 만료되면 _NOT_LOADED"""
+        entry = self._by_alias.get(server_key)
+        if entry is not None:
+            if entry.expires_at > time.monotonic():
+                self._hits += 1
+                return entry.resolved
+            del self._by_alias[server_key]
+        self._misses += 1
+        return _NOT_LOADED
+
+    def _store(
+        self,
+        server_key: str,
+        project_id: Optional[UUID],
+        loaded: Any,
+        generation: int
+    ) -> Optional[ResolvedServer]:
+        """DB 조회 결과를 캐시 (DB 오류 또는 조회 도중 무효화된 결과는 캐시하지 않음)"""
+        if loaded is _NOT_LOADED:
+            return None
+        if generation != self._generation:
+            logger.debug(f"🔄 [CACHE] Discarding stale server key lookup: {server_key}")
+            return loaded
+
+        now = time.monotonic()
+        if loaded is None:
+            logger.debug(f"🔍 Server key not resolvable: {server_key}")
+            self._by_alias[server_key] = _CacheEntry(None, project_id, now + self.negative_ttl_seconds)
+            return None
+
+        entry = _CacheEntry(loaded, loaded.project_id, now + self.ttl_seconds)
+        for alias in (
+            server_key,
+            loaded.canonical_key,
+            loaded.status_key,
+            f"{loaded.project_id}_{loaded.name}",
+            f"{loaded.project_id}:{loaded.server_id}",
+        ):
+            self._by_alias[alias] = entry
+        logger.debug(f"🔑 Resolved server key {server_key} → {loaded.canonical_key}")
+        return loaded
+
+    @staticmethod
+    def _server_query(
+        project_id: Optional[UUID],
+        server_id: Optional[UUID],
+        server_name: Optional[str]
+    ):
+        """서버 키 조회 쿼리 (sync/async 공용)"""
+        from ..models import McpServer
+
+        query = select(McpServer.id, McpServer.project_id, McpServer.name)
+        if server_id is not None:
+            query = query.where(McpServer.id == server_id)
+            if project_id is not None:
+                query = query.where(McpServer.project_id == project_id)
+        else:
+            query = query.where(
+                McpServer.project_id == project_id,
+                McpServer.name == server_name
+            )
+        return query.limit(1)
+
+    @staticmethod
+    def _to_resolved(row: Any) -> Optional[ResolvedServer]:
+        if row is None:
+            return None
+        return ResolvedServer(server_id=row.id, project_id=row.project_id, name=row.name)
+
+    def _load(
+        self,
+        project_id: Optional[UUID],
+        server_id: Optional[UUID],
+        server_name: Optional[str]
+    ) -> Any:
+        """DB에서 서버 조회 (sync 세션) - 없으면 None, DB 오류 시 _NOT_LOADED"""
+        from ..database import SessionLocal
+
+        db = SessionLocal()
+        try:
+            row = db.execute(self._server_query(project_id, server_id, server_name)).first()
+            return self._to_resolved(row)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to resolve server key: {e}")
+            return _NOT_LOADED
+        finally:
+            db.close()
+
+    async def _load_async(
+        self,
+        project_id: Optional[UUID],
+        server_id: Optional[UUID],
+        server_name: Optional[str]
+    ) -> Any:
+        """DB에서 서버 조회 (async 세션) - 없으면 None, DB 오류 시 _NOT_LOADED"""
+        from ..database import async_session
+
+        try:
+            async with async_session() as db:
+                row = (await db.execute(self._server_query(project_id, server_id, server_name))).first()
+            return self._to_resolved(row)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to resolve server key: {e}")
+            return _NOT_LOADED
+
+
+# 글로벌 서버 키 해석기 인스턴스
+server_key_resolver = ServerKeyResolver()
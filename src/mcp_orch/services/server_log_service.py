@@ -10,7 +10,7 @@ from typing import List, Optional, Dict, Any
 from uuid import UUID
 
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, or_
+from sqlalchemy import desc, and_, or_, insert
 
 from ..database import get_db
 from ..models import ServerLog, LogLevel, LogCategory, McpServer, Project
@@ -71,6 +71,30 @@ class ServerLogService:
             self.db.rollback()
             raise
     
+    def add_logs_bulk(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        서버 로그 일괄 추가 (단일 bulk insert, 단일 커밋)
+        
+        Args:
+            rows: server_logs 컬럼명을 키로 하는 딕셔너리 목록
+            
+        Returns:
+            저장된 로그 수
+        """
+        if not rows:
+            return 0
+        
+        try:
+            self.db.execute(insert(ServerLog), rows)
+            self.db.commit()
+            logger.debug(f"Added {len(rows)} server logs in bulk")
+            return len(rows)
+            
+        except Exception as e:
+            logger.error(f"Error adding server logs in bulk: {e}")
+            self.db.rollback()
+            raise
+    
     def get_server_logs(
         self,
         server_id: UUID,
@@ -0,0 +1,94 @@
+"""
+MCP 서버 비동기 조회 저장소
+
+MCP 요청 경로(unified 라우트, 인증 의존성 등)에서 사용하는 읽기 전용 조회를
+async 엔진(asyncpg)으로 수행해 이벤트 루프를 막지 않습니다.
+
+서버 조회 결과는 ORM 인스턴스 대신 ServerSnapshot으로 반환합니다.
+SSE 스트림처럼 오래 사는 응답이 세션/커넥션을 붙잡지 않고 서버 설정을 들고 있을 수 있습니다.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+
+from ..database import async_session
+from ..models import McpServer, Project
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ServerSnapshot:
+    """세션과 분리된 MCP 서버 설정 스냅샷 (스트림/트랜스포트 보관용)"""
+    id: Optional[UUID]
+    project_id: Optional[UUID]
+    name: str
+    command: Optional[str] = None
+    args: List[str] = field(default_factory=list)
+    env: Dict[str, Any] = field(default_factory=dict)
+    timeout: Optional[int] = None
+    transport_type: Optional[str] = None
+    is_enabled: bool = True
+    pool_min_size: Optional[int] = None
+    pool_max_size: Optional[int] = None
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_model(cls, server: McpServer) -> "ServerSnapshot":
+        """ORM 인스턴스의 컬럼 값을 복사"""
+        return cls(
+            id=server.id,
+            project_id=server.project_id,
+            name=server.name,
+            command=server.command,
+            args=list(server.args or []),
+            env=dict(server.env or {}),
+            timeout=server.timeout,
+            transport_type=server.transport_type,
+            is_enabled=server.is_enabled,
+            pool_min_size=server.pool_min_size,
+            pool_max_size=server.pool_max_size,
+            updated_at=server.updated_at,
+        )
+
+
+class ServerRepository:
+    """MCP 서버/프로젝트 비동기 조회"""
+
+    @staticmethod
+    async def list_enabled_servers(project_id: UUID) -> List[ServerSnapshot]:
+        """프로젝트의 활성 서버 목록"""
+        async with async_session() as db:
+            result = await db.execute(
+                select(McpServer).where(
+                    McpServer.project_id == project_id,
+                    McpServer.is_enabled == True
+                )
+            )
+            return [ServerSnapshot.from_model(server) for server in result.scalars()]
+
+    @staticmethod
+    async def get_enabled_server(project_id: UUID, server_name: str) -> Optional[ServerSnapshot]:
+        """프로젝트의 활성 서버를 이름으로 조회"""
+        async with async_session() as db:
+            result = await db.execute(
+                select(McpServer).where(
+                    McpServer.project_id == project_id,
+                    McpServer.name == server_name,
+                    McpServer.is_enabled == True
+                ).limit(1)
+            )
+            server = result.scalars().first()
+            return ServerSnapshot.from_model(server) if server else None
+
+    @staticmethod
+    async def get_project(project_id: UUID) -> Optional[Project]:
+        """프로젝트 조회"""
+        async with async_session() as db:
+            result = await db.execute(select(Project).where(Project.id == project_id))
+            return result.scalars().first()
@@ -8,16 +8,61 @@ import logging
 from datetime import datetime
 from typing import Optional, Dict, Any
 from uuid import UUID
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from ..models.mcp_server import McpServer, McpServerStatus
-from ..database import get_db
+from ..database import async_session
 
 logger = logging.getLogger(__name__)
 
 class ServerStatusService:
     """서버 상태 자동 업데이트 서비스"""
     
+    @staticmethod
+    def apply_status(
+        server: McpServer,
+        status: McpServerStatus,
+        connection_type: str = "unknown",
+        error_message: Optional[str] = None
+    ) -> Optional[McpServerStatus]:
+        """
+        서버 객체에 상태 변경만 반영 (커밋은 호출자가 담당 - 일괄 커밋용)
+        
+        Returns:
+            변경 전 상태
+        """
+        old_status = server.status
+        server.status = status
+        
+        # 연결 성공 시 타임스탬프 업데이트
+        if status == McpServerStatus.ACTIVE:
+            server.last_used_at = datetime.utcnow()
+            server.last_error = None
+            logger.info(f"✅ [{connection_type}] Server {server.name} connected (status: {old_status} → {status})")
+            
+            # 📊 상태 변경 통계 로깅
+            if old_status != status:
+                logger.info(f"📈 [METRICS] Server status change: {server.name} ({old_status.value if old_status else 'None'} → {status.value}) via {connection_type}")
+        
+        # 에러 상태 시 에러 메시지 저장
+        elif status == McpServerStatus.ERROR and error_message:
+            server.last_error = error_message
+            logger.warning(f"❌ [{connection_type}] Server {server.name} error (status: {old_status} → {status}): {error_message}")
+            
+            # 📊 에러 통계 로깅
+            logger.error(f"📈 [METRICS] Server error: {server.name} ({old_status.value if old_status else 'None'} → ERROR) via {connection_type}: {error_message}")
+        
+        # 연결 해제 시
+        elif status == McpServerStatus.INACTIVE:
+            logger.info(f"🔌 [{connection_type}] Server {server.name} disconnected (status: {old_status} → {status})")
+            
+            # 📊 연결 해제 통계 로깅
+            if old_status == McpServerStatus.ACTIVE:
+                logger.info(f"📈 [METRICS] Server disconnection: {server.name} (ACTIVE → INACTIVE) via {connection_type}")
+        
+        return old_status
+    
     @staticmethod
     async def update_server_status_on_connection(
         server_id: str,
@@ -42,19 +87,19 @@ class ServerStatusService:
             bool: 업데이트 성공 여부
         """
         
-        # DB 세션이 없으면 새로 생성
-        should_close_db = False
+        # 서버명에서 프로젝트 ID 제거 (server_id가 "project_id.server_name" 형태인 경우)
+        if '.' in server_id:
+            server_name = server_id.split('.', 1)[1]
+        else:
+            server_name = server_id
+        
+        # DB 세션이 없으면 async 엔진으로 처리 (세션 매니저 등 핫패스)
         if db is None:
-            db = next(get_db())
-            should_close_db = True
+            return await ServerStatusService._update_status_async(
+                server_name, project_id, status, connection_type, error_message
+            )
             
         try:
-            # 서버명에서 프로젝트 ID 제거 (server_id가 "project_id.server_name" 형태인 경우)
-            if '.' in server_id:
-                server_name = server_id.split('.', 1)[1]
-            else:
-                server_name = server_id
-            
             # 프로젝트별 서버 조회
             server = db.query(McpServer).filter(
                 McpServer.project_id == project_id,
@@ -66,34 +111,7 @@ class ServerStatusService:
                 return False
             
             # 상태 업데이트
-            old_status = server.status
-            server.status = status
-            
-            # 연결 성공 시 타임스탬프 업데이트
-            if status == McpServerStatus.ACTIVE:
-                server.last_used_at = datetime.utcnow()
-                server.last_error = None
-                logger.info(f"✅ [{connection_type}] Server {server_name} connected (status: {old_status} → {status})")
-                
-                # 📊 상태 변경 통계 로깅
-                if old_status != status:
-                    logger.info(f"📈 [METRICS] Server status change: {server_name} ({old_status.value if old_status else 'None'} → {status.value}) via {connection_type}")
-            
-            # 에러 상태 시 에러 메시지 저장
-            elif status == McpServerStatus.ERROR and error_message:
-                server.last_error = error_message
-                logger.warning(f"❌ [{connection_type}] Server {server_name} error (status: {old_status} → {status}): {error_message}")
-                
-                # 📊 에러 통계 로깅
-                logger.error(f"📈 [METRICS] Server error: {server_name} ({old_status.value if old_status else 'None'} → ERROR) via {connection_type}: {error_message}")
-            
-            # 연결 해제 시
-            elif status == McpServerStatus.INACTIVE:
-                logger.info(f"🔌 [{connection_type}] Server {server_name} disconnected (status: {old_status} → {status})")
-                
-                # 📊 연결 해제 통계 로깅
-                if old_status == McpServerStatus.ACTIVE:
-                    logger.info(f"📈 [METRICS] Server disconnection: {server_name} (ACTIVE → INACTIVE) via {connection_type}")
+            old_status = ServerStatusService.apply_status(server, status, connection_type, error_message)
             
             # DB 커밋
             db.commit()
@@ -103,13 +121,41 @@ class ServerStatusService:
             
         except Exception as e:
             logger.error(f"❌ Failed to update server status for {server_id}: {e}")
-            if db:
-                db.rollback()
+            db.rollback()
+            return False
+    
+    @staticmethod
+    async def _update_status_async(
+        server_name: str,
+        project_id: UUID,
+        status: McpServerStatus,
+        connection_type: str,
+        error_message: Optional[str]
+    ) -> bool:
+        """async 세션으로 서버 상태 업데이트 (이벤트 루프 블로킹 없음)"""
+        try:
+            async with async_session() as db:
+                result = await db.execute(
+                    select(McpServer).where(
+                        McpServer.project_id == project_id,
+                        McpServer.name == server_name
+                    ).limit(1)
+                )
+                server = result.scalars().first()
+                
+                if not server:
+                    logger.warning(f"Server not found for update: {server_name} in project {project_id}")
+                    return False
+                
+                old_status = ServerStatusService.apply_status(server, status, connection_type, error_message)
+                await db.commit()
+            
+            logger.info(f"📊 Server status updated: {server_name} ({old_status} → {status}) via {connection_type}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to update server status for {server_name}: {e}")
             return False
-        
-        finally:
-            if should_close_db and db:
-                db.close()
     
     @staticmethod
     async def update_server_status_by_name(
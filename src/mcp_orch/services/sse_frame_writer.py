@@ -0,0 +1,93 @@
+"""
+SSE 프레임 writer
+
+SSE 트랜스포트(개별 SSE, 표준 SSE, Unified)가 공통으로 사용하는 송신 루프입니다.
+OutboundQueue에 이미 직렬화되어 쌓인 프레임을 한 번의 flush에 하나의 bytes 청크로
+묶어서 내보내므로, 병렬 도구 결과가 몰릴 때 ASGI send 호출과 소켓 쓰기 횟수가 줄어듭니다.
+
+- MCP_SSE_BATCH_MAX_FRAMES / MCP_SSE_BATCH_MAX_BYTES: flush당 최대 프레임 수/바이트
+- MCP_SSE_BATCH_LATENCY_MS: 첫 프레임 이후 추가 프레임을 기다리는 시간 (0이면 대기 없이 즉시)
+- keepalive 등 고정 프레임은 미리 인코딩한 상수를 재사용하고,
+  keepalive 시점은 연결별 타이머 대신 공용 스케줄러(sse_keepalive)가 결정
+"""
+
+import logging
+import os
+from typing import Any, AsyncGenerator, Dict
+
+from .sse_keepalive import sse_keepalive_scheduler
+from .sse_outbound_queue import OutboundQueue
+
+logger = logging.getLogger(__name__)
+
+# 미리 인코딩된 고정 프레임
+KEEPALIVE_FRAME = b": keepalive\n\n"  # SSE 주석 - 클라이언트는 무시하고 연결만 유지
+DATA_KEEPALIVE_FRAME = b'data: {"type":"keepalive"}\n\n'  # keepalive 이벤트를 기대하는 Streamable HTTP 스트림용
+
+
+class SSEWriterConfig:
+    """SSE writer 설정 및 전체 통계"""
+
+    def __init__(self):
+        self.max_batch_frames = max(1, int(os.getenv('MCP_SSE_BATCH_MAX_FRAMES', '64')))
+        self.max_batch_bytes = max(1, int(os.getenv('MCP_SSE_BATCH_MAX_BYTES', str(256 * 1024))))
+        self.max_latency = max(0.0, float(os.getenv('MCP_SSE_BATCH_LATENCY_MS', '0')) / 1000)
+
+        self.flushes = 0
+        self.frames_written = 0
+        self.bytes_written = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """flush 통계"""
+        return {
+            "flushes": self.flushes,
+            "frames_written": self.frames_written,
+            "bytes_written": self.bytes_written,
+            "frames_per_flush": round(self.frames_written / self.flushes, 2) if self.flushes else 0.0,
+            "max_batch_frames": self.max_batch_frames,
+            "max_batch_bytes": self.max_batch_bytes,
+            "max_latency_ms": self.max_latency * 1000,
+        }
+
+
+class SSEFrameWriter:
+    """세션 하나의 송신 루프 (keepalive는 공용 스케줄러가 큐에 넣음)"""
+
+    def __init__(
+        self,
+        queue: OutboundQueue,
+        session_id: str,
+        keepalive_frame: bytes = KEEPALIVE_FRAME
+    ):
+        self.queue = queue
+        self.session_id = session_id
+        self.keepalive_frame = keepalive_frame
+
+    async def frames(self) -> AsyncGenerator[bytes, None]:
+        """큐가 닫힐 때까지 묶인 프레임 청크를 생성"""
+        sse_keepalive_scheduler.register(self.queue, self.keepalive_frame)
+        try:
+            while True:
+                sent_before = self.queue.sent
+                chunk = await self.queue.get_batch(
+                    sse_writer_config.max_batch_frames,
+                    sse_writer_config.max_batch_bytes,
+                    sse_writer_config.max_latency
+                )
+
+                if chunk is None:  # 큐 종료 (정상 종료 또는 slow consumer 차단)
+                    logger.info(f"📤 Outbound queue closed for session {self.session_id}")
+                    return
+                if not chunk:
+                    continue
+
+                sse_writer_config.flushes += 1
+                sse_writer_config.frames_written += self.queue.sent - sent_before
+                sse_writer_config.bytes_written += len(chunk)
+                yield chunk
+        finally:
+            sse_keepalive_scheduler.unregister(self.queue)
+
+
+# 글로벌 SSE writer 설정 인스턴스
+sse_writer_config = SSEWriterConfig()
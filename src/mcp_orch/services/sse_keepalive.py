@@ -0,0 +1,152 @@
+"""
+SSE keepalive 스케줄러
+
+SSE 연결마다 keepalive 타이머(asyncio.sleep / wait_for timeout)를 두는 대신,
+하나의 백그라운드 태스크가 timer wheel로 모든 연결의 마지막 쓰기 시각을 확인하고
+keepalive 간격 동안 아무것도 보내지 않은 연결에만 미리 인코딩된 keepalive 프레임을 넣습니다.
+
+- 연결은 (마지막 쓰기 + 간격) 시각에 해당하는 슬롯에 한 번만 놓이고, 틱마다 현재 슬롯만 처리
+- 최근에 쓴 연결은 다음 마감 슬롯으로 옮기기만 하므로 연결 수와 무관하게 틱당 작업량이 작음
+- 송신 대기 중인 프레임이 있는 연결(읽지 않는 클라이언트)에는 keepalive를 쌓지 않음
+- 추적 중인 연결이 없으면 태스크가 종료되어 유휴 wakeup이 없음
+
+MCP_SSE_KEEPALIVE_SECONDS: keepalive 간격 (기본 30초)
+MCP_SSE_KEEPALIVE_TICK_SECONDS: wheel 틱 간격 = keepalive 시각 정밀도 (기본 1초)
+"""
+
+import asyncio
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+from .sse_outbound_queue import OutboundQueue
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class _KeepaliveEntry:
+    """wheel에 놓인 연결"""
+    queue: OutboundQueue
+    frame: bytes
+    slot: int = 0
+
+
+class KeepaliveScheduler:
+    """전체 SSE 연결 공용 keepalive timer wheel"""
+
+    def __init__(self, interval: Optional[float] = None, tick: Optional[float] = None):
+        self.interval = interval if interval is not None else float(os.getenv('MCP_SSE_KEEPALIVE_SECONDS', '30'))
+        self.tick = tick if tick is not None else float(os.getenv('MCP_SSE_KEEPALIVE_TICK_SECONDS', '1'))
+        self.tick = max(0.01, min(self.tick, self.interval))
+        # 마감이 최대 interval 뒤이므로 한 바퀴 + 1 슬롯이면 충돌 없이 담김
+        self._slot_count = int(math.ceil(self.interval / self.tick)) + 1
+        self._slots: List[Set[_KeepaliveEntry]] = [set() for _ in range(self._slot_count)]
+        self._entries: Dict[int, _KeepaliveEntry] = {}
+        self._cursor = 0
+        self._task: Optional[asyncio.Task] = None
+
+        self._pings = 0
+        self._skipped_busy = 0
+        self._ticks = 0
+        self._rescheduled = 0
+
+    def register(self, queue: OutboundQueue, frame: bytes) -> None:
+        """연결 추적 시작 - 마지막 쓰기 시각부터 interval 뒤에 확인"""
+        key = id(queue)
+        if key in self._entries:
+            return
+        entry = _KeepaliveEntry(queue=queue, frame=frame)
+        self._entries[key] = entry
+        self._schedule(entry, queue.last_write + self.interval, time.monotonic())
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def unregister(self, queue: OutboundQueue) -> None:
+        """연결 추적 종료 (없으면 무시)"""
+        entry = self._entries.pop(id(queue), None)
+        if entry is not None:
+            self._slots[entry.slot].discard(entry)
+
+    def _schedule(self, entry: _KeepaliveEntry, due: float, now: float) -> None:
+        """마감 시각에 해당하는 슬롯에 배치"""
+        ticks = max(1, int(math.ceil((due - now) / self.tick)))
+        entry.slot = (self._cursor + min(ticks, self._slot_count - 1)) % self._slot_count
+        self._slots[entry.slot].add(entry)
+
+    async def _run(self):
+        """틱마다 현재 슬롯의 연결만 확인"""
+        logger.debug(f"💓 SSE keepalive scheduler started (interval={self.interval}s, tick={self.tick}s)")
+        next_tick = time.monotonic()
+        try:
+            while self._entries:
+                next_tick += self.tick
+                await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+                self._cursor = (self._cursor + 1) % self._slot_count
+                self._ticks += 1
+                self._process_slot(time.monotonic())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ SSE keepalive scheduler error: {e}")
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+        logger.debug("💓 SSE keepalive scheduler idle")
+
+    def _process_slot(self, now: float) -> None:
+        due_entries = self._slots[self._cursor]
+        if not due_entries:
+            return
+        self._slots[self._cursor] = set()
+
+        for entry in due_entries:
+            queue = entry.queue
+            if queue.closed:
+                self._entries.pop(id(queue), None)
+                continue
+
+            idle = now - queue.last_write
+            if idle + self.tick / 2 >= self.interval:
+                if queue.qsize():
+                    # 아직 못 보낸 프레임이 있으면 keepalive는 의미 없음
+                    self._skipped_busy += 1
+                elif queue.put_frame(entry.frame):
+                    self._pings += 1
+                self._schedule(entry, now + self.interval, now)
+            else:
+                # 간격 안에 쓴 연결은 다음 마감으로 이동만
+                self._rescheduled += 1
+                self._schedule(entry, queue.last_write + self.interval, now)
+
+    async def stop(self):
+        """스케줄러 중지 (애플리케이션 종료 시)"""
+        task, self._task = self._task, None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """keepalive 통계"""
+        return {
+            "tracked_connections": len(self._entries),
+            "interval_seconds": self.interval,
+            "tick_seconds": self.tick,
+            "wheel_slots": self._slot_count,
+            "running": self._task is not None and not self._task.done(),
+            "ticks": self._ticks,
+            "pings": self._pings,
+            "skipped_busy": self._skipped_busy,
+            "rescheduled": self._rescheduled,
+        }
+
+
+# 글로벌 SSE keepalive 스케줄러 인스턴스
+sse_keepalive_scheduler = KeepaliveScheduler()
@@ -0,0 +1,284 @@
+"""
+SSE 세션별 송신 큐
+
+SSE 트랜스포트가 클라이언트로 보낼 메시지를 담는 제한 크기 큐입니다.
+메시지는 넣는 시점에 SSE 프레임(bytes)으로 한 번만 직렬화되고, 큐는 메시지 수와
+바이트 수를 함께 추적합니다.
+
+읽지 않는 클라이언트(slow consumer) 때문에 대기 중인 데이터가 high-water mark를
+넘으면 정책에 따라 처리합니다:
+- disconnect (기본): 대기 중인 프레임을 모두 버리고 큐를 닫아 스트림을 종료
+- drop_oldest: 한도 아래로 내려올 때까지 가장 오래된 프레임부터 버림
+
+혼자 한도를 넘는 단일 프레임(큰 도구 결과 등)은 대기열이 비어 있으면 그대로 받습니다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+import weakref
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from ..utils.json_codec import json_codec
+
+logger = logging.getLogger(__name__)
+
+POLICY_DISCONNECT = "disconnect"
+POLICY_DROP_OLDEST = "drop_oldest"
+POLICIES = (POLICY_DISCONNECT, POLICY_DROP_OLDEST)
+
+
+class OutboundQueue:
+    """
+    SSE 세션 송신 큐 (asyncio.Queue 대체)
+
+    Usage:
+        await queue.put(message)          # dict 또는 미리 직렬화된 JSON bytes
+        frame = await queue.get()         # SSE 프레임 bytes, 닫히면 None
+        chunk = await queue.get_batch(64, 262144)  # 대기 중인 프레임을 묶어서
+        queue.close()                     # 남은 프레임 전송 후 None 반환
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        max_messages: Optional[int] = None,
+        high_water_bytes: Optional[int] = None,
+        policy: Optional[str] = None,
+        on_overflow: Optional[Callable[["OutboundQueue"], None]] = None
+    ):
+        self.session_id = session_id
+        self.max_messages = max_messages or sse_queue_monitor.max_messages
+        self.high_water_bytes = high_water_bytes or sse_queue_monitor.high_water_bytes
+        self.policy = policy or sse_queue_monitor.policy
+        self.on_overflow = on_overflow
+
+        self._frames: Deque[Tuple[bytes, float]] = deque()
+        self._bytes = 0
+        self._ready = asyncio.Event()
+        self._closed = False
+        self.overflowed = False
+        self.last_write = time.monotonic()  # 마지막으로 프레임을 내보낸 시각 (keepalive 기준)
+
+        self.enqueued = 0
+        self.sent = 0
+        self.batches = 0
+        self.dropped = 0
+        self.discarded_after_close = 0
+        self.peak_messages = 0
+        self.peak_bytes = 0
+
+        sse_queue_monitor.track(self)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def qsize(self) -> int:
+        return len(self._frames)
+
+    @property
+    def bytes_pending(self) -> int:
+        return self._bytes
+
+    def oldest_age(self) -> float:
+        """가장 오래된 대기 프레임의 나이 (초)"""
+        if not self._frames:
+            return 0.0
+        return time.monotonic() - self._frames[0][1]
+
+    async def put(self, message: Any) -> bool:
+        """메시지 추가 (블로킹 없음) - None은 종료 신호로 처리"""
+        return self.put_nowait(message)
+
+    def put_nowait(self, message: Any) -> bool:
+        """
+        메시지를 SSE 프레임으로 직렬화해 추가
+
+        Returns:
+            bool: 큐에 들어갔는지 여부 (닫힌 큐면 False)
+        """
+        if message is None:
+            self.close()
+            return False
+        if self._closed:
+            self.discarded_after_close += 1
+            return False
+
+        if isinstance(message, (bytes, bytearray)):
+            # 미리 직렬화된 JSON 본문 (도구 카탈로그 캐시 등)
+            frame = b"data: " + bytes(message) + b"\n\n"
+        else:
+            frame = json_codec.sse_event(message)
+        return self.put_frame(frame)
+
+    def put_frame(self, frame: bytes) -> bool:
+        """이미 인코딩된 SSE 프레임 추가 (keepalive 등 고정 프레임 재사용)"""
+        if self._closed:
+            self.discarded_after_close += 1
+            return False
+
+        self._frames.append((frame, time.monotonic()))
+        self._bytes += len(frame)
+        self.enqueued += 1
+
+        if len(self._frames) > 1 and (
+            len(self._frames) > self.max_messages or self._bytes > self.high_water_bytes
+        ):
+            self._handle_overflow()
+            if self._closed:
+                return False
+
+        self.peak_messages = max(self.peak_messages, len(self._frames))
+        self.peak_bytes = max(self.peak_bytes, self._bytes)
+        self._ready.set()
+        return True
+
+    async def get(self) -> Optional[bytes]:
+        """다음 SSE 프레임 - 큐가 닫히고 비었으면 None"""
+        while not self._frames:
+            if self._closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+
+        frame, _ = self._frames.popleft()
+        self._bytes -= len(frame)
+        self.sent += 1
+        self.last_write = time.monotonic()
+        return frame
+
+    async def get_batch(self, max_frames: int, max_bytes: int, max_latency: float = 0.0) -> Optional[bytes]:
+        """
+        대기 중인 프레임을 하나의 bytes 청크로 묶어서 꺼냄
+
+        첫 프레임이 준비되면 max_latency 동안 더 모은 뒤, 프레임 수/바이트 한도까지 합칩니다.
+        (최소 한 프레임은 항상 포함) 큐가 닫히고 비었으면 None.
+        """
+        while not self._frames:
+            if self._closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+
+        if max_latency > 0 and len(self._frames) < max_frames and not self._closed:
+            await asyncio.sleep(max_latency)
+            if not self._frames:  # 대기 중에 slow consumer로 비워짐
+                return None if self._closed else b""
+
+        chunks = []
+        size = 0
+        while self._frames and len(chunks) < max_frames:
+            frame = self._frames[0][0]
+            if chunks and size + len(frame) > max_bytes:
+                break
+            self._frames.popleft()
+            chunks.append(frame)
+            size += len(frame)
+
+        self._bytes -= size
+        self.sent += len(chunks)
+        self.batches += 1
+        self.last_write = time.monotonic()
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+    def close(self):
+        """큐 종료 - 이미 들어온 프레임은 계속 꺼낼 수 있음"""
+        self._closed = True
+        self._ready.set()
+
+    def _handle_overflow(self):
+        """high-water mark 초과 시 slow consumer 정책 적용"""
+        if self.policy == POLICY_DROP_OLDEST:
+            dropped = 0
+            while len(self._frames) > 1 and (
+                len(self._frames) > self.max_messages or self._bytes > self.high_water_bytes
+            ):
+                frame, _ = self._frames.popleft()
+                self._bytes -= len(frame)
+                dropped += 1
+            if not self.dropped:
+                logger.warning(f"⚠️ [SSE_QUEUE] Slow consumer {self.session_id}: dropping oldest messages")
+            self.dropped += dropped
+            sse_queue_monitor.dropped_messages += dropped
+            return
+
+        pending_messages, pending_bytes, oldest_age = len(self._frames), self._bytes, self.oldest_age()
+        self.dropped += pending_messages
+        self._frames.clear()
+        self._bytes = 0
+        self.overflowed = True
+        self.close()
+        sse_queue_monitor.dropped_messages += pending_messages
+        sse_queue_monitor.overflow_disconnects += 1
+        logger.warning(
+            f"🚫 [SSE_QUEUE] Disconnecting slow consumer {self.session_id}: "
+            f"{pending_messages} messages / {pending_bytes} bytes pending, oldest {oldest_age:.1f}s"
+        )
+
+        if self.on_overflow:
+            try:
+                self.on_overflow(self)
+            except Exception as e:
+                logger.error(f"❌ [SSE_QUEUE] Overflow callback failed for {self.session_id}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """세션 큐 상태"""
+        return {
+            "session_id": self.session_id,
+            "depth": len(self._frames),
+            "bytes_pending": self._bytes,
+            "oldest_age_seconds": round(self.oldest_age(), 3),
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "discarded_after_close": self.discarded_after_close,
+            "peak_depth": self.peak_messages,
+            "peak_bytes": self.peak_bytes,
+            "overflowed": self.overflowed,
+            "closed": self._closed,
+        }
+
+
+class OutboundQueueMonitor:
+    """송신 큐 설정 및 전체 통계 (살아있는 큐를 약한 참조로 추적)"""
+
+    def __init__(self):
+        self.max_messages = int(os.getenv('MCP_SSE_QUEUE_MAX_MESSAGES', '1000'))
+        self.high_water_bytes = int(os.getenv('MCP_SSE_QUEUE_HIGH_WATER_BYTES', str(16 * 1024 * 1024)))
+        policy = os.getenv('MCP_SSE_SLOW_CONSUMER_POLICY', POLICY_DISCONNECT).strip().lower()
+        if policy not in POLICIES:
+            logger.warning(f"⚠️ Unknown MCP_SSE_SLOW_CONSUMER_POLICY '{policy}', using {POLICY_DISCONNECT}")
+            policy = POLICY_DISCONNECT
+        self.policy = policy
+
+        self._queues: "weakref.WeakSet[OutboundQueue]" = weakref.WeakSet()
+        self.overflow_disconnects = 0
+        self.dropped_messages = 0
+
+    def track(self, queue: OutboundQueue):
+        self._queues.add(queue)
+
+    def get_stats(self, top: int = 20) -> Dict[str, Any]:
+        """전체 대기량과 대기 바이트가 큰 세션 목록"""
+        queues: List[OutboundQueue] = [queue for queue in list(self._queues) if not queue.closed]
+        busiest = sorted(queues, key=lambda queue: queue.bytes_pending, reverse=True)[:top]
+        return {
+            "active_queues": len(queues),
+            "pending_messages": sum(queue.qsize() for queue in queues),
+            "pending_bytes": sum(queue.bytes_pending for queue in queues),
+            "oldest_age_seconds": round(max((queue.oldest_age() for queue in queues), default=0.0), 3),
+            "overflow_disconnects": self.overflow_disconnects,
+            "dropped_messages": self.dropped_messages,
+            "max_messages": self.max_messages,
+            "high_water_bytes": self.high_water_bytes,
+            "policy": self.policy,
+            "sessions": [queue.get_stats() for queue in busiest if queue.qsize()],
+        }
+
+
+# 글로벌 SSE 송신 큐 모니터 인스턴스
+sse_queue_monitor = OutboundQueueMonitor()
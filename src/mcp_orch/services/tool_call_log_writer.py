@@ -0,0 +1,223 @@
+"""
+도구 호출 로그 비동기 배치 저장 서비스
+
+도구 호출 경로에서 ToolCallLog를 동기 커밋하지 않고 큐에 넣은 뒤,
+백그라운드 태스크가 배치 크기 또는 플러시 주기 기준으로 모아서
+tool_call_logs 테이블에 한 번의 bulk insert로 저장합니다.
+일부 행 때문에 배치가 실패하면(삭제된 서버의 외래 키 위반 등) 배치를 나눠서
+다시 저장하므로 문제 행만 버려집니다.
+
+큐가 가득 찬 경우의 정책 (MCP_TOOL_LOG_OVERFLOW_POLICY):
+- drop_oldest: 가장 오래된 로그를 버리고 새 로그를 넣음 (기본값)
+- drop_newest: 새 로그를 버림
+- block: 큐에 자리가 날 때까지 호출자를 대기시킴 (백프레셔)
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import DataError, IntegrityError
+
+from ..models import ToolCallLog
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ('drop_oldest', 'drop_newest', 'block')
+
+
+class ToolCallLogWriter:
+    """ToolCallLog 비동기 배치 저장기"""
+
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        flush_interval_seconds: Optional[float] = None,
+        max_queue_size: Optional[int] = None,
+        overflow_policy: Optional[str] = None
+    ):
+        self.batch_size = max(1, batch_size if batch_size is not None else int(
+            os.getenv('MCP_TOOL_LOG_BATCH_SIZE', '100')
+        ))
+        self.flush_interval_seconds = flush_interval_seconds if flush_interval_seconds is not None else float(
+            os.getenv('MCP_TOOL_LOG_FLUSH_INTERVAL_SECONDS', '1.0')
+        )
+        self.max_queue_size = max(self.batch_size, max_queue_size if max_queue_size is not None else int(
+            os.getenv('MCP_TOOL_LOG_QUEUE_MAX_SIZE', '10000')
+        ))
+        policy = overflow_policy or os.getenv('MCP_TOOL_LOG_OVERFLOW_POLICY', 'drop_oldest')
+        if policy not in OVERFLOW_POLICIES:
+            logger.warning(f"⚠️ Unknown tool log overflow policy '{policy}', using drop_oldest")
+            policy = 'drop_oldest'
+        self.overflow_policy = policy
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker_task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+
+    def start(self):
+        """백그라운드 저장 태스크 시작 (이미 실행 중이면 무시)"""
+        if self._worker_task is None or self._worker_task.done():
+            self._stopping = False
+            self._worker_task = asyncio.create_task(self._run())
+            logger.info(
+                f"🟢 ToolCallLog writer started (batch={self.batch_size}, "
+                f"interval={self.flush_interval_seconds}s, queue={self.max_queue_size}, "
+                f"policy={self.overflow_policy})"
+            )
+
+    async def stop(self):
+        """남은 로그를 모두 저장하고 백그라운드 태스크 종료"""
+        self._stopping = True
+        if self._worker_task is not None:
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.error(f"❌ ToolCallLog writer task failed: {e}")
+            self._worker_task = None
+
+        await self.flush()
+        logger.info(f"🔴 ToolCallLog writer stopped (written={self._written}, dropped={self._dropped}, failed={self._failed})")
+
+    async def submit(self, row: Dict[str, Any]):
+        """
+        로그 한 건을 큐에 추가 - 정책에 따라 버리거나 대기
+
+        Args:
+            row: tool_call_logs 컬럼명을 키로 하는 딕셔너리
+        """
+        self.start()
+
+        if self.overflow_policy == 'block':
+            await self._queue.put(row)
+            self._enqueued += 1
+            return
+
+        if self._queue.full():
+            if self.overflow_policy == 'drop_newest':
+                self._record_drop()
+                return
+            try:
+                self._queue.get_nowait()
+                self._record_drop()
+            except asyncio.QueueEmpty:
+                pass
+
+        self._queue.put_nowait(row)
+        self._enqueued += 1
+
+    async def flush(self):
+        """큐에 남은 로그를 즉시 저장"""
+        while not self._queue.empty():
+            batch = self._drain(self.batch_size)
+            await self._write_batch(batch)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """저장 파이프라인 통계"""
+        return {
+            "queued": self._queue.qsize(),
+            "enqueued": self._enqueued,
+            "written": self._written,
+            "dropped": self._dropped,
+            "failed": self._failed,
+            "batches": self._batches,
+            "batch_size": self.batch_size,
+            "flush_interval_seconds": self.flush_interval_seconds,
+            "max_queue_size": self.max_queue_size,
+            "overflow_policy": self.overflow_policy,
+        }
+
+    async def _run(self):
+        """배치 크기 또는 플러시 주기 중 먼저 도달하는 시점에 저장"""
+        loop = asyncio.get_running_loop()
+        while not (self._stopping and self._queue.empty()):
+            try:
+                first = await asyncio.wait_for(self._queue.get(), timeout=self.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                continue
+
+            batch = [first]
+            deadline = loop.time() + self.flush_interval_seconds
+            while len(batch) < self.batch_size:
+                batch.extend(self._drain(self.batch_size - len(batch)))
+                remaining = deadline - loop.time()
+                if len(batch) >= self.batch_size or remaining <= 0 or self._stopping:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._write_batch(batch)
+
+    def _drain(self, limit: int) -> List[Dict[str, Any]]:
+        """대기 없이 큐에서 최대 limit개 꺼내기"""
+        items = []
+        while len(items) < limit:
+            try:
+                items.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return items
+
+    async def _write_batch(self, batch: List[Dict[str, Any]]):
+        """
+        배치를 단일 bulk insert로 저장
+
+        행 데이터 오류(무결성/데이터 오류)면 배치를 반으로 나눠 다시 저장해서 문제 행만 버리고,
+        연결 오류 등 그 밖의 실패는 배치 전체를 버리고 기록합니다.
+        """
+        if not batch:
+            return
+
+        try:
+            await self._insert(batch)
+        except (IntegrityError, DataError) as e:
+            if len(batch) == 1:
+                self._failed += 1
+                logger.warning(f"⚠️ Dropping ToolCallLog row for tool {batch[0].get('tool_name')}: {e.orig}")
+                return
+            middle = len(batch) // 2
+            await self._write_batch(batch[:middle])
+            await self._write_batch(batch[middle:])
+            return
+        except Exception as e:
+            self._failed += len(batch)
+            logger.error(f"❌ Failed to flush {len(batch)} ToolCallLog rows: {e}")
+            return
+
+        self._written += len(batch)
+        self._batches += 1
+        logger.debug(f"💾 Flushed {len(batch)} ToolCallLog rows")
+
+    @staticmethod
+    async def _insert(batch: List[Dict[str, Any]]):
+        """배치 한 번의 bulk insert와 커밋"""
+        from ..database import async_session
+
+        async with async_session() as db:
+            await db.execute(insert(ToolCallLog), batch)
+            await db.commit()
+
+    def _record_drop(self):
+        """드롭 카운트 증가 - 경고 로그는 드물게"""
+        self._dropped += 1
+        if self._dropped == 1 or self._dropped % 1000 == 0:
+            logger.warning(
+                f"⚠️ ToolCallLog queue full ({self.max_queue_size}), "
+                f"policy={self.overflow_policy}, dropped={self._dropped}"
+            )
+
+
+# 글로벌 도구 호출 로그 저장기 인스턴스
+tool_call_log_writer = ToolCallLogWriter()
@@ -0,0 +1,170 @@
+"""
+프로젝트 통합 도구 카탈로그 캐시
+
+Unified MCP tools/list 응답(네임스페이스 + 필터링 적용된 전체 도구 목록)을
+프로젝트 단위로 한 번만 만들고, 직렬화된 바이트를 재사용합니다.
+
+- 카탈로그 버전(도구 목록 바이트의 해시)을 ETag와 result._meta로 노출
+- If-None-Match가 현재 버전이면 같은 카탈로그에 result._meta.unchanged 힌트만 추가
+- 서버 구성(id/name/updated_at)이 바뀌면 서명 불일치로 자동 재생성
+- 툴 설정/툴 목록 변경 시 CacheInvalidationService가 프로젝트 단위로 무효화
+- 무효화 이전에 시작된 빌드 결과는 세대(generation) 비교로 저장하지 않음
+"""
+
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from ..utils.json_codec import json_codec
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ToolCatalog:
+    """직렬화가 끝난 프로젝트 도구 카탈로그"""
+    project_id: UUID
+    variant: str
+    servers_signature: str
+    tools_json: bytes
+    tool_count: int
+    version: str
+    expires_at: float
+    built_at: float = field(default_factory=time.time)
+
+    @property
+    def etag(self) -> str:
+        """HTTP ETag 헤더 값"""
+        return f'"{self.version}"'
+
+    def render(self, request_id: Any, unchanged: bool = False) -> bytes:
+        """
+        JSON-RPC tools/list 응답 바이트 (도구 목록은 재직렬화하지 않음)
+
+        unchanged=True면 클라이언트가 이미 같은 버전을 갖고 있다는 힌트를 _meta에만 추가
+        (tools는 MCP 규격상 항상 배열이어야 하므로 목록은 그대로 포함)
+        """
+        return b"".join((
+            b'{"jsonrpc":"2.0","id":',
+            json_codec.dumps(request_id),
+            b',"result":{"tools":',
+            self.tools_json,
+            b',"_meta":{"catalogVersion":"',
+            self.version.encode("ascii"),
+            b'","unchanged":true}}}' if unchanged else b'"}}}',
+        ))
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        """If-None-Match 헤더가 현재 버전을 가리키는지 확인"""
+        if not if_none_match:
+            return False
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return self.etag in candidates
+
+
+class ToolCatalogCache:
+    """프로젝트별 도구 카탈로그 캐시"""
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv('MCP_TOOL_CATALOG_TTL_SECONDS', '300')
+        )
+        self._catalogs: Dict[Tuple[UUID, str], ToolCatalog] = {}
+        self._generations: Dict[UUID, int] = {}
+        self._epoch = 0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @staticmethod
+    def servers_signature(servers: Iterable[Any]) -> str:
+        """활성 서버 구성 서명 - 서버 추가/삭제/수정 시 달라짐"""
+        parts = sorted(
+            f"{server.id}:{server.name}:{getattr(server, 'updated_at', None)}"
+            for server in servers
+        )
+        return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+    def generation(self, project_id: UUID) -> int:
+        """프로젝트 무효화 세대 - 빌드 시작 전에 읽어서 store()에 전달"""
+        return self._epoch + self._generations.get(project_id, 0)
+
+    def get(self, project_id: UUID, variant: str, servers_signature: str) -> Optional[ToolCatalog]:
+        """유효한 카탈로그 조회 - 만료/서명 불일치 시 None"""
+        catalog = self._catalogs.get((project_id, variant))
+        if (
+            catalog is not None
+            and catalog.servers_signature == servers_signature
+            and catalog.expires_at > time.monotonic()
+        ):
+            self._hits += 1
+            return catalog
+        self._misses += 1
+        return None
+
+    def store(
+        self,
+        project_id: UUID,
+        variant: str,
+        servers_signature: str,
+        tools: List[Dict[str, Any]],
+        generation: int
+    ) -> ToolCatalog:
+        """도구 목록을 한 번 직렬화해서 카탈로그로 저장"""
+        tools_json = json_codec.dumps(tools)
+        catalog = ToolCatalog(
+            project_id=project_id,
+            variant=variant,
+            servers_signature=servers_signature,
+            tools_json=tools_json,
+            tool_count=len(tools),
+            version=hashlib.sha256(tools_json).hexdigest()[:16],
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+
+        if generation != self.generation(project_id):
+            # 빌드 도중 무효화됨 - 이번 응답에만 사용하고 캐시하지 않음
+            logger.debug(f"🔄 [CACHE] Discarding stale tool catalog build for project {project_id}")
+            return catalog
+
+        self._catalogs[(project_id, variant)] = catalog
+        logger.debug(f"📦 [CACHE] Tool catalog stored: project={project_id}, variant={variant}, tools={len(tools)}, version={catalog.version}")
+        return catalog
+
+    def invalidate(self, project_id: Optional[UUID] = None) -> int:
+        """프로젝트(또는 전체) 카탈로그 무효화"""
+        if project_id is None:
+            removed = len(self._catalogs)
+            self._catalogs.clear()
+            self._epoch += 1
+        else:
+            stale = [key for key in self._catalogs if key[0] == project_id]
+            for key in stale:
+                del self._catalogs[key]
+            removed = len(stale)
+            self._generations[project_id] = self._generations.get(project_id, 0) + 1
+
+        self._invalidations += removed
+        if removed:
+            logger.info(f"🔄 [CACHE] Invalidated {removed} tool catalogs (project={project_id})")
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """카탈로그 캐시 통계"""
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._catalogs),
+            "hits": self._hits,
+            "misses": self._misses,
+            "invalidations": self._invalidations,
+            "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+# 글로벌 도구 카탈로그 캐시 인스턴스
+tool_catalog_cache = ToolCatalogCache()
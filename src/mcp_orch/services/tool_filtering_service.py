@@ -2,6 +2,9 @@
 Tool Filtering Service - 프로젝트별 툴 사용 설정 관리
 
 ServerStatusService 패턴을 적용한 일관된 DB 세션 관리 및 로깅 시스템
+
+툴 설정은 프로젝트 단위로 한 번에 로드해 tool_preference_cache에 캐시하며,
+CacheInvalidationService 훅(설정 변경/툴 목록 변경)으로 무효화됩니다.
 """
 
 import logging
@@ -10,10 +13,11 @@ from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, select
 
 from ..models.tool_preference import ToolPreference
-from ..database import get_db
+from ..database import async_session, run_sync_db
+from .tool_preference_cache import tool_preference_cache
 
 logger = logging.getLogger(__name__)
 
@@ -42,26 +46,10 @@ class ToolFilteringService:
         """
         start_time = time.time()
         
-        # 🔄 ServerStatusService와 동일한 DB 세션 관리 패턴
-        should_close_db = False
-        if db is None:
-            db = next(get_db())
-            should_close_db = True
-        
         try:
-            # 툴 설정 조회 (배치 쿼리 최적화)
-            tool_preferences = db.query(ToolPreference).filter(
-                and_(
-                    ToolPreference.project_id == project_id,
-                    ToolPreference.server_id == server_id
-                )
-            ).all()
-            
-            # 빠른 조회를 위한 설정 맵 생성
-            preference_map = {
-                pref.tool_name: pref.is_enabled
-                for pref in tool_preferences
-            }
+            # 프로젝트 설정 맵 조회 (캐시 히트 시 I/O 없음)
+            project_preferences = await ToolFilteringService._get_cached_project_preferences(project_id, db)
+            preference_map = project_preferences.get(str(server_id), {})
             
             # 필터링 적용
             filtered_tools = []
@@ -92,10 +80,88 @@ class ToolFilteringService:
             logger.error(f"❌ [TOOL_FILTERING] Error filtering tools for server {server_id}: {e} (took {filtering_time:.2f}ms)")
             # 🛡️ ServerStatusService 스타일 안전장치: 에러 시 원본 툴 목록 반환
             return tools
-            
-        finally:
-            if should_close_db:
-                db.close()
+    
+    @staticmethod
+    async def _get_cached_project_preferences(
+        project_id: UUID,
+        db: Session = None
+    ) -> Dict[str, Dict[str, bool]]:
+        """
+        프로젝트 툴 설정 맵 조회 (캐시 우선)
+        
+        캐시 미스 시 프로젝트의 모든 서버 설정을 한 번의 쿼리로 로드합니다.
+        db가 없으면 async 엔진으로 조회하고, 같은 프로젝트의 동시 로드는 하나로 합칩니다.
+        """
+        cached = tool_preference_cache.get(project_id)
+        if cached is not None:
+            return cached
+        
+        if db is not None:
+            generation = tool_preference_cache.generation(project_id)
+            preferences = await run_sync_db(ToolFilteringService._query_project_preferences, project_id, db=db)
+            tool_preference_cache.store(project_id, preferences, generation)
+            return preferences
+        
+        return await tool_preference_cache.load(
+            project_id,
+            lambda: ToolFilteringService._load_project_preferences(project_id)
+        )
+    
+    @staticmethod
+    def _query_project_preferences(db: Session, project_id: UUID) -> Dict[str, Dict[str, bool]]:
+        """프로젝트 전체 툴 설정을 {server_id: {tool_name: is_enabled}}로 조회"""
+        rows = db.execute(ToolFilteringService._project_preferences_query(project_id)).all()
+        return ToolFilteringService._group_preferences(rows)
+    
+    @staticmethod
+    async def _load_project_preferences(project_id: UUID) -> Dict[str, Dict[str, bool]]:
+        """async 세션으로 프로젝트 툴 설정 조회"""
+        async with async_session() as db:
+            rows = (await db.execute(ToolFilteringService._project_preferences_query(project_id))).all()
+        return ToolFilteringService._group_preferences(rows)
+    
+    @staticmethod
+    def _project_preferences_query(project_id: UUID):
+        """프로젝트 전체 툴 설정 조회 쿼리 (sync/async 공용)"""
+        return select(
+            ToolPreference.server_id,
+            ToolPreference.tool_name,
+            ToolPreference.is_enabled
+        ).where(ToolPreference.project_id == project_id)
+    
+    @staticmethod
+    def _group_preferences(rows) -> Dict[str, Dict[str, bool]]:
+        """조회 결과를 {server_id: {tool_name: is_enabled}}로 변환"""
+        result: Dict[str, Dict[str, bool]] = {}
+        for row in rows:
+            result.setdefault(str(row.server_id), {})[row.tool_name] = row.is_enabled
+        return result
+    
+    @staticmethod
+    async def warm_cache() -> int:
+        """
+        전체 프로젝트 툴 설정을 한 번의 쿼리로 캐시에 적재 (시작 시 선택적 호출)
+        
+        Returns:
+            int: 적재된 프로젝트 수
+        """
+        generations = tool_preference_cache.generations()
+        async with async_session() as db:
+            rows = (await db.execute(select(
+                ToolPreference.project_id,
+                ToolPreference.server_id,
+                ToolPreference.tool_name,
+                ToolPreference.is_enabled
+            ))).all()
+        
+        all_preferences: Dict[UUID, Dict[str, Dict[str, bool]]] = {}
+        for row in rows:
+            all_preferences.setdefault(row.project_id, {}).setdefault(str(row.server_id), {})[row.tool_name] = row.is_enabled
+        for project_id, preferences in all_preferences.items():
+            tool_preference_cache.store(project_id, preferences, generations.get(project_id, 0))
+        
+        logger.info(f"🔥 [TOOL_FILTERING] Warmed tool preference cache for {len(all_preferences)} projects")
+        return len(all_preferences)
     
     @staticmethod
     async def get_project_tool_preferences(
@@ -112,34 +178,19 @@ class ToolFilteringService:
         Returns:
             {server_id: {tool_name: is_enabled}} 형태의 설정 맵
         """
-        # 🔄 ServerStatusService와 동일한 DB 세션 관리 패턴
-        should_close_db = False
-        if db is None:
-            db = next(get_db())
-            should_close_db = True
-            
         try:
-            preferences = db.query(ToolPreference).filter(
-                ToolPreference.project_id == project_id
-            ).all()
-            
-            result = {}
-            for pref in preferences:
-                server_key = str(pref.server_id)
-                if server_key not in result:
-                    result[server_key] = {}
-                result[server_key][pref.tool_name] = pref.is_enabled
+            if db is None:
+                result = await ToolFilteringService._load_project_preferences(project_id)
+            else:
+                result = await run_sync_db(ToolFilteringService._query_project_preferences, project_id, db=db)
             
-            logger.info(f"📋 [TOOL_FILTERING] Loaded {len(preferences)} tool preferences for project {project_id}")
+            count = sum(len(tools) for tools in result.values())
+            logger.info(f"📋 [TOOL_FILTERING] Loaded {count} tool preferences for project {project_id}")
             return result
             
         except Exception as e:
             logger.error(f"❌ [TOOL_FILTERING] Error loading project tool preferences: {e}")
             return {}
-            
-        finally:
-            if should_close_db:
-                db.close()
     
     @staticmethod
     async def update_tool_preference(
@@ -162,12 +213,29 @@ class ToolFilteringService:
         Returns:
             bool: 업데이트 성공 여부
         """
-        # 🔄 ServerStatusService와 동일한 DB 세션 관리 패턴
-        should_close_db = False
-        if db is None:
-            db = next(get_db())
-            should_close_db = True
+        # DB 작업은 워커 스레드에서 수행 (db가 없으면 새 세션 사용)
+        success = await run_sync_db(
+            ToolFilteringService._save_tool_preference,
+            project_id, server_id, tool_name, is_enabled,
+            db=db
+        )
+        if success:
+            tool_preference_cache.invalidate(project_id)
             
+            # 📊 ServerStatusService 스타일 메트릭 로깅
+            logger.info(f"📈 [METRICS] Tool preference updated: {project_id}/{server_id}/{tool_name} = {is_enabled}")
+        
+        return success
+    
+    @staticmethod
+    def _save_tool_preference(
+        db: Session,
+        project_id: UUID,
+        server_id: UUID,
+        tool_name: str,
+        is_enabled: bool
+    ) -> bool:
+        """개별 툴 설정 저장 및 커밋 (sync 세션, 워커 스레드 실행용)"""
         try:
             # 기존 설정 조회 또는 생성
             preference = db.query(ToolPreference).filter(
@@ -198,20 +266,12 @@ class ToolFilteringService:
                 logger.info(f"📝 [TOOL_FILTERING] Created new tool preference: {tool_name} (enabled={is_enabled}) for server {server_id}")
             
             db.commit()
-            
-            # 📊 ServerStatusService 스타일 메트릭 로깅
-            logger.info(f"📈 [METRICS] Tool preference updated: {project_id}/{server_id}/{tool_name} = {is_enabled}")
-            
             return True
             
         except Exception as e:
             logger.error(f"❌ [TOOL_FILTERING] Error updating tool preference: {e}")
             db.rollback()
             return False
-            
-        finally:
-            if should_close_db:
-                db.close()
     
     @staticmethod
     async def bulk_update_tool_preferences(
@@ -230,30 +290,23 @@ class ToolFilteringService:
         Returns:
             int: 업데이트된 설정 개수
         """
-        # 🔄 ServerStatusService와 동일한 DB 세션 관리 패턴
-        should_close_db = False
-        if db is None:
-            db = next(get_db())
-            should_close_db = True
-            
-        try:
-            updated_count = 0
-            
-            for pref_data in preferences:
-                server_id = pref_data['server_id']
-                tool_name = pref_data['tool_name']
-                is_enabled = pref_data['is_enabled']
-                
-                success = await ToolFilteringService.update_tool_preference(
-                    project_id=project_id,
-                    server_id=server_id,
-                    tool_name=tool_name,
-                    is_enabled=is_enabled,
-                    db=db  # 동일한 세션 재사용
+        def save_all(session: Session) -> int:
+            # 한 번의 스레드 전환으로 동일한 세션을 재사용해 저장
+            return sum(
+                ToolFilteringService._save_tool_preference(
+                    session,
+                    project_id,
+                    pref_data['server_id'],
+                    pref_data['tool_name'],
+                    pref_data['is_enabled']
                 )
-                
-                if success:
-                    updated_count += 1
+                for pref_data in preferences
+            )
+        
+        try:
+            updated_count = await run_sync_db(save_all, db=db)
+            if updated_count:
+                tool_preference_cache.invalidate(project_id)
             
             # 📊 ServerStatusService 스타일 메트릭 로깅
             logger.info(f"📈 [METRICS] Bulk tool preferences update: {updated_count}/{len(preferences)} successful for project {project_id}")
@@ -263,10 +316,6 @@ class ToolFilteringService:
         except Exception as e:
             logger.error(f"❌ [TOOL_FILTERING] Error in bulk update: {e}")
             return 0
-            
-        finally:
-            if should_close_db:
-                db.close()
     
     @staticmethod
     async def invalidate_cache(
@@ -274,26 +323,19 @@ class ToolFilteringService:
         server_id: Optional[UUID] = None
     ):
         """
-        툴 필터링 캐시 무효화 (향후 캐싱 시스템 연동용)
+        툴 필터링 캐시 무효화
         
         Args:
             project_id: 프로젝트 ID
-            server_id: 서버 ID (None이면 프로젝트 전체)
+            server_id: 서버 ID (설정 맵은 프로젝트 단위이므로 프로젝트 전체를 무효화)
         """
         try:
-            # 현재는 로깅만, 향후 Redis나 Materialized View 연동 시 확장
+            tool_preference_cache.invalidate(project_id)
+            
             if server_id:
                 logger.info(f"🔄 [CACHE] Tool filtering cache invalidated for server {server_id} in project {project_id}")
             else:
                 logger.info(f"🔄 [CACHE] Tool filtering cache invalidated for all servers in project {project_id}")
-                
-            # 📊 ServerStatusService 스타일 메트릭 로깅
-            logger.info(f"📈 [METRICS] Cache invalidation completed for project {project_id}")
-            
-            # TODO: 향후 구현 예정
-            # - MCP 세션 매니저 캐시 무효화
-            # - Materialized View 새로고침
-            # - 활성 SSE 연결에 업데이트 알림
             
         except Exception as e:
-            logger.error(f"❌ [CACHE] Cache invalidation failed: {e}")
\ No newline at end of file
+            logger.error(f"❌ [CACHE] Cache invalidation failed: {e}")
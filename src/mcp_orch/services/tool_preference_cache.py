@@ -0,0 +1,110 @@
+"""
+프로젝트 툴 설정 캐시
+
+프로젝트의 모든 서버 툴 설정을 {server_id: {tool_name: is_enabled}} 맵으로 한 번에 캐시합니다.
+
+- 설정 변경/툴 목록 변경 시 CacheInvalidationService 훅이 프로젝트 단위로 무효화
+- TTL은 무효화 훅을 놓친 경우의 안전장치 (MCP_TOOL_PREFERENCE_CACHE_TTL_SECONDS)
+- 무효화 이전에 시작된 조회 결과는 세대(generation) 비교로 저장하지 않음
+- 같은 프로젝트의 동시 조회는 하나로 합침
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+ProjectPreferences = Dict[str, Dict[str, bool]]
+
+
+class ToolPreferenceCache:
+    """프로젝트별 툴 설정 맵 캐시"""
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv('MCP_TOOL_PREFERENCE_CACHE_TTL_SECONDS', '600')
+        )
+        # {project_id: (expires_at, preferences)}
+        self._preferences: Dict[UUID, Tuple[float, ProjectPreferences]] = {}
+        self._generations: Dict[UUID, int] = {}
+        self._inflight: Dict[UUID, asyncio.Future] = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def generation(self, project_id: UUID) -> int:
+        """프로젝트 무효화 세대 - 조회 시작 전에 읽어서 store()에 전달"""
+        return self._generations.get(project_id, 0)
+
+    def generations(self) -> Dict[UUID, int]:
+        """전체 프로젝트 무효화 세대 스냅샷 (전체 적재용)"""
+        return dict(self._generations)
+
+    def get(self, project_id: UUID) -> Optional[ProjectPreferences]:
+        """유효한 설정 맵 조회 - 없거나 만료되면 None"""
+        cached = self._preferences.get(project_id)
+        if cached is not None and cached[0] > time.monotonic():
+            self._hits += 1
+            return cached[1]
+        self._misses += 1
+        return None
+
+    def store(self, project_id: UUID, preferences: ProjectPreferences, generation: int):
+        """조회 결과 캐시 - 조회 도중 무효화되었으면 저장하지 않음"""
+        if generation != self.generation(project_id):
+            logger.debug(f"🔄 [CACHE] Discarding stale tool preferences for project {project_id}")
+            return
+        self._preferences[project_id] = (time.monotonic() + self.ttl_seconds, preferences)
+
+    async def load(
+        self,
+        project_id: UUID,
+        loader: Callable[[], Awaitable[ProjectPreferences]]
+    ) -> ProjectPreferences:
+        """loader로 조회해서 캐시 - 같은 프로젝트의 동시 조회는 하나로 합침"""
+        pending = self._inflight.get(project_id)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[project_id] = future
+        try:
+            generation = self.generation(project_id)
+            preferences = await loader()
+            self.store(project_id, preferences, generation)
+            future.set_result(preferences)
+            return preferences
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # 대기자가 없을 때 경고 방지
+            raise
+        finally:
+            self._inflight.pop(project_id, None)
+
+    def invalidate(self, project_id: UUID) -> bool:
+        """프로젝트 설정 맵 제거 - 진행 중인 조회 결과도 저장되지 않음"""
+        self._generations[project_id] = self._generations.get(project_id, 0) + 1
+        removed = self._preferences.pop(project_id, None) is not None
+        if removed:
+            self._invalidations += 1
+        return removed
+
+    def get_stats(self) -> Dict[str, Any]:
+        """툴 설정 캐시 통계"""
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._preferences),
+            "hits": self._hits,
+            "misses": self._misses,
+            "invalidations": self._invalidations,
+            "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+# 글로벌 툴 설정 캐시 인스턴스
+tool_preference_cache = ToolPreferenceCache()
@@ -0,0 +1,112 @@
+"""Benchmark JSON codec backends on captured MCP payloads.
+
+Usage:
+    python -m mcp_orch.tools.json_benchmark captured.jsonl [more.jsonl ...]
+    python -m mcp_orch.tools.json_benchmark --synthetic
+
+Capture files are newline-delimited JSON-RPC messages, e.g. the stdout of an
+MCP server recorded with `tee`. Each line is one payload; every installed
+backend (orjson, msgspec, stdlib) encodes and decodes all payloads.
+"""
+
+import argparse
+import sys
+import time
+from typing import List, Tuple
+
+from ..utils.json_codec import BACKENDS, JsonCodec
+
+
+def load_payloads(paths: List[str]) -> List[bytes]:
+    """Read non-empty lines from capture files"""
+    payloads = []
+    for path in paths:
+        with open(path, 'rb') as capture:
+            payloads.extend(line.strip() for line in capture if line.strip())
+    return payloads
+
+
+def synthetic_payloads() -> List[bytes]:
+    """Representative tools/list and tools/call payloads when no capture is available"""
+    codec = JsonCodec('stdlib')
+    tools = [
+        {
+            "name": f"server__tool_{i}",
+            "description": "Reads a file from the workspace and returns its content " * 3,
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "path": {"type": "string", "description": "File path"},
+                    "encoding": {"type": "string", "enum": ["utf-8", "latin-1"]},
+                    "limit": {"type": "integer", "minimum": 1},
+                },
+                "required": ["path"],
+            },
+        }
+        for i in range(200)
+    ]
+    file_text = "def handler(event):\n    return {'status': 'ok', 'items': [1, 2, 3]}  # 한글 주석\n" * 20000
+    return [
+        codec.dumps({"jsonrpc": "2.0", "id": 1, "result": {"tools": tools}}),
+        codec.dumps({"jsonrpc": "2.0", "id": 2, "result": {"content": [{"type": "text", "text": file_text}]}}),
+        codec.dumps({"jsonrpc": "2.0", "id": 3, "method": "tools/call",
+                     "params": {"name": "server__tool_1", "arguments": {"path": "/tmp/a.py"}}}),
+    ]
+
+
+def benchmark(codec: JsonCodec, payloads: List[bytes], rounds: int) -> Tuple[float, float]:
+    """Return (decode seconds, encode seconds) for all payloads over all rounds"""
+    decoded = [codec.loads(payload) for payload in payloads]
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for payload in payloads:
+            codec.loads(payload)
+    decode_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for message in decoded:
+            codec.dumps(message)
+    encode_seconds = time.perf_counter() - started
+
+    return decode_seconds, encode_seconds
+
+
+def main():
+    """Main entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark JSON codec backends on MCP payloads")
+    parser.add_argument('captures', nargs='*', help="Newline-delimited JSON capture files")
+    parser.add_argument('--synthetic', action='store_true', help="Use built-in representative payloads")
+    parser.add_argument('--rounds', type=int, default=20, help="Passes over the payload set (default: 20)")
+    args = parser.parse_args()
+
+    if not args.captures and not args.synthetic:
+        parser.error("provide capture files or --synthetic")
+
+    payloads = load_payloads(args.captures) if args.captures else synthetic_payloads()
+    total_bytes = sum(len(payload) for payload in payloads) * args.rounds
+    print(f"Payloads: {len(payloads)}  Size: {total_bytes / args.rounds / 1024:.1f} KiB  Rounds: {args.rounds}")
+    print(f"{'backend':<10} {'decode MB/s':>12} {'encode MB/s':>12} {'decode ms':>10} {'encode ms':>10}")
+
+    baseline = None
+    for name in reversed(BACKENDS):  # stdlib first as the baseline
+        codec = JsonCodec(name)
+        if codec.backend != name:
+            print(f"{name:<10} (not installed)")
+            continue
+        decode_seconds, encode_seconds = benchmark(codec, payloads, args.rounds)
+        total = decode_seconds + encode_seconds
+        speedup = f"  x{baseline / total:.1f}" if baseline else ""
+        print(
+            f"{name:<10} {total_bytes / decode_seconds / 1e6:>12.1f} {total_bytes / encode_seconds / 1e6:>12.1f} "
+            f"{decode_seconds * 1000:>10.1f} {encode_seconds * 1000:>10.1f}{speedup}"
+        )
+        if name == 'stdlib':
+            baseline = total
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
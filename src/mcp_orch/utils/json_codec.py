@@ -0,0 +1,136 @@
+"""JSON Codec
+
+JSON-RPC 경로(stdio 세션, SSE 프레임, HTTP 응답)에서 공통으로 사용하는 JSON 인코더/디코더
+
+- 설치되어 있으면 orjson → msgspec 순으로 사용하고, 없으면 표준 json으로 동작
+- MCP_JSON_BACKEND=auto|orjson|msgspec|stdlib 로 강제 지정 가능
+- 인코딩 결과는 항상 UTF-8 bytes (소켓/파이프에 그대로 쓰기 위함)
+- 빠른 백엔드가 처리하지 못하는 값(64비트 초과 정수 등)은 표준 json으로 재시도
+"""
+
+import json
+import logging
+import os
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Optional, Tuple, Union
+from uuid import UUID
+
+from starlette.responses import JSONResponse
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ('orjson', 'msgspec', 'stdlib')
+
+
+def _default(value: Any) -> Any:
+    """표준 json이 직렬화하지 못하는 공통 타입 처리"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=_default).encode('utf-8')
+
+
+def _stdlib_loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    return json.loads(data)
+
+
+def _load_backend(requested: str) -> Tuple[str, Callable[[Any], bytes], Callable[[Any], Any]]:
+    """요청된 백엔드 로드 (auto는 설치된 가장 빠른 백엔드)"""
+    candidates = BACKENDS if requested == 'auto' else (requested,)
+
+    for name in candidates:
+        if name == 'orjson':
+            try:
+                import orjson
+            except ImportError:
+                continue
+            options = orjson.OPT_NON_STR_KEYS
+
+            def orjson_dumps(value: Any) -> bytes:
+                return orjson.dumps(value, default=_default, option=options)
+
+            return name, orjson_dumps, orjson.loads
+
+        if name == 'msgspec':
+            try:
+                import msgspec
+            except ImportError:
+                continue
+            encoder = msgspec.json.Encoder(enc_hook=_default)
+            decoder = msgspec.json.Decoder()
+            return name, encoder.encode, decoder.decode
+
+        if name == 'stdlib':
+            return name, _stdlib_dumps, _stdlib_loads
+
+    if requested != 'auto':
+        logger.warning(f"⚠️ JSON backend '{requested}' is not available, using stdlib json")
+    return 'stdlib', _stdlib_dumps, _stdlib_loads
+
+
+class JsonCodec:
+    """교체 가능한 JSON 인코더/디코더"""
+
+    def __init__(self, backend: Optional[str] = None):
+        requested = (backend or os.getenv('MCP_JSON_BACKEND', 'auto')).strip().lower()
+        if requested not in BACKENDS and requested != 'auto':
+            logger.warning(f"⚠️ Unknown JSON backend '{requested}', using auto")
+            requested = 'auto'
+        self.backend, self._dumps, self._loads = _load_backend(requested)
+        self._fallbacks = 0
+
+    def dumps(self, value: Any) -> bytes:
+        """UTF-8 JSON bytes로 인코딩 (공백 없는 compact 형식)"""
+        try:
+            return self._dumps(value)
+        except Exception:
+            if self.backend == 'stdlib':
+                raise
+            # 빠른 백엔드의 제약(큰 정수 등)에 걸린 값은 표준 json으로 처리
+            self._fallbacks += 1
+            return _stdlib_dumps(value)
+
+    def dumps_str(self, value: Any) -> str:
+        """JSON 문자열로 인코딩"""
+        return self.dumps(value).decode('utf-8')
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """JSON bytes/문자열 디코딩 - 잘못된 입력은 ValueError"""
+        try:
+            return self._loads(data)
+        except ValueError:
+            raise
+        except Exception as e:
+            # msgspec.DecodeError 등 백엔드별 예외를 ValueError로 통일
+            raise ValueError(str(e)) from e
+
+    def sse_event(self, value: Any) -> bytes:
+        """SSE data 프레임 (data: <json>\\n\\n)"""
+        return b"data: " + self.dumps(value) + b"\n\n"
+
+    def get_stats(self) -> dict:
+        """코덱 상태"""
+        return {"backend": self.backend, "stdlib_fallbacks": self._fallbacks}
+
+
+# 글로벌 JSON 코덱 인스턴스
+json_codec = JsonCodec()
+
+
+class FastJSONResponse(JSONResponse):
+    """json_codec으로 본문을 렌더링하는 JSONResponse"""
+
+    def render(self, content: Any) -> bytes:
+        return json_codec.dumps(content)
@@ -0,0 +1,160 @@
+"""
+스케줄러 도구 동기화 회귀 테스트
+
+세션 매니저가 돌려주는 도구 목록은 inputSchema가 schema로 바뀌어 있으므로,
+입력 스키마만 바뀐 경우에도 도구 행이 갱신되고 캐시 무효화가 일어나는지 확인합니다.
+"""
+
+import os
+import sys
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from mcp_orch.models.mcp_server import McpServer, McpServerStatus, McpTool  # noqa: E402
+from mcp_orch.services import scheduler_service as scheduler_module  # noqa: E402
+from mcp_orch.services.cache_invalidation_service import CacheInvalidationService  # noqa: E402
+from mcp_orch.services.scheduler_service import SchedulerService, ServerCheckResult  # noqa: E402
+
+
+@pytest.fixture
+def session_factory(tmp_path, monkeypatch):
+    """스케줄러의 get_db()를 SQLite 세션으로 교체 (SAVEPOINT 사용 가능하도록 트랜잭션 직접 시작)"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'scheduler.db'}")
+
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def begin_transaction(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    McpServer.__table__.create(engine)
+    McpTool.__table__.create(engine)
+    factory = sessionmaker(bind=engine)
+
+    def get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(scheduler_module, "get_db", get_db)
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def invalidations(monkeypatch):
+    """도구 목록 변경 캐시 무효화 호출 기록"""
+    calls = []
+
+    async def on_tool_list_changed(project_id, server_id):
+        calls.append((project_id, server_id))
+
+    monkeypatch.setattr(CacheInvalidationService, "on_tool_list_changed", staticmethod(on_tool_list_changed))
+    return calls
+
+
+def _session_manager_tool(schema):
+    """McpSessionManager.get_server_tools 형식의 도구"""
+    return {"name": "search", "description": "Search documents", "schema": schema}
+
+
+async def test_schema_only_change_updates_tool_and_invalidates(session_factory, invalidations):
+    project_id = uuid.uuid4()
+    with session_factory() as db:
+        server = McpServer(
+            project_id=project_id,
+            name="docs",
+            command="docs-server",
+            created_by_id=uuid.uuid4(),
+            status=McpServerStatus.ACTIVE
+        )
+        db.add(server)
+        db.commit()
+        server_id = server.id
+
+    scheduler = SchedulerService()
+    first_schema = {"type": "object", "properties": {"query": {"type": "string"}}}
+    changed_schema = {
+        "type": "object",
+        "properties": {"query": {"type": "string"}, "limit": {"type": "integer"}}
+    }
+
+    for schema in (first_schema, changed_schema):
+        result = ServerCheckResult(
+            server_id=server_id,
+            server_name="docs",
+            project_id=project_id,
+            status=McpServerStatus.ACTIVE,
+            tools=[_session_manager_tool(schema)]
+        )
+        await scheduler._apply_results([result], {"updated": 0, "tools_synced": 0, "errors": 0})
+
+        with session_factory() as db:
+            tool = db.execute(select(McpTool).where(McpTool.server_id == server_id)).scalar_one()
+            assert tool.input_schema == schema
+
+    assert invalidations == [(project_id, server_id), (project_id, server_id)]
+
+    # 같은 목록이 다시 오면 해시가 같으므로 DB 쓰기/무효화 없음
+    result = ServerCheckResult(
+        server_id=server_id,
+        server_name="docs",
+        project_id=project_id,
+        status=McpServerStatus.ACTIVE,
+        tools=[_session_manager_tool(changed_schema)]
+    )
+    await scheduler._apply_results([result], {"updated": 0, "tools_synced": 0, "errors": 0})
+    assert len(invalidations) == 2
+
+
+async def test_batch_loads_servers_with_one_select(session_factory, invalidations):
+    project_id = uuid.uuid4()
+    with session_factory() as db:
+        servers = [
+            McpServer(
+                project_id=project_id,
+                name=f"server-{index}",
+                command="server",
+                created_by_id=uuid.uuid4(),
+                status=McpServerStatus.ACTIVE
+            )
+            for index in range(3)
+        ]
+        db.add_all(servers)
+        db.commit()
+        server_ids = [server.id for server in servers]
+
+    server_selects = []
+
+    @event.listens_for(session_factory.kw["bind"], "before_cursor_execute")
+    def record_select(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM mcp_servers" in statement:
+            server_selects.append(statement)
+
+    batch = [
+        ServerCheckResult(
+            server_id=server_id,
+            server_name=f"server-{index}",
+            project_id=project_id,
+            status=McpServerStatus.ERROR,
+            error="unreachable"
+        )
+        for index, server_id in enumerate(server_ids)
+    ]
+    counters = {"updated": 0, "tools_synced": 0, "errors": 0}
+    await SchedulerService()._apply_results(batch, counters)
+
+    assert len(server_selects) == 1
+    assert counters["updated"] == 3
+    with session_factory() as db:
+        statuses = db.execute(select(McpServer.status).where(McpServer.id.in_(server_ids))).scalars().all()
+        assert statuses == [McpServerStatus.ERROR] * 3
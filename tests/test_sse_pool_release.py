@@ -0,0 +1,156 @@
+"""
+SSE 스트림 DB 커넥션 반환 회귀 테스트
+
+유휴 SSE/Streamable HTTP 클라이언트가 스트림이 끝날 때까지 인증에 쓴 풀 커넥션을
+붙잡지 않는지, 작은 풀(QueuePool 5개, overflow 없음)로 스트림 500개를 열어 확인합니다.
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+from starlette.requests import Request
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from mcp_orch import database  # noqa: E402
+from mcp_orch.api import mcp_sse_transport, mcp_standard_sse  # noqa: E402
+from mcp_orch.api.mcp.unified import auth as unified_auth, fast_routes, routes as unified_routes  # noqa: E402
+from mcp_orch.services.server_repository import ServerRepository, ServerSnapshot  # noqa: E402
+from mcp_orch.services.server_status_service import ServerStatusService  # noqa: E402
+
+IDLE_STREAMS = 500
+POOL_SIZE = 5
+
+
+@pytest.fixture
+def small_pool(tmp_path, monkeypatch):
+    """get_db()가 작은 풀을 쓰도록 sync 엔진 교체"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=QueuePool,
+        pool_size=POOL_SIZE,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    monkeypatch.setattr(database, "sync_engine", engine)
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=engine))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def project_server(monkeypatch):
+    """인증은 커넥션을 실제로 사용하고, 서버 조회는 스냅샷 반환"""
+    project_id = uuid.uuid4()
+    server = ServerSnapshot(id=uuid.uuid4(), project_id=project_id, name="echo", command="echo")
+
+    async def authenticate(request, project_id, db):
+        db.execute(text("SELECT 1"))  # 프로젝트 조회처럼 풀 커넥션을 체크아웃
+        return None
+
+    async def get_user_from_jwt_token(request, db):
+        db.execute(text("SELECT 1"))
+        return SimpleNamespace(email="user@example.com")
+
+    async def get_enabled_server(project_id, server_name):
+        return server
+
+    async def list_enabled_servers(project_id):
+        return [server]
+
+    async def get_project(project_id):
+        return SimpleNamespace(id=project_id, unified_mcp_enabled=True)
+
+    async def update_server_status_by_name(**kwargs):
+        return True
+
+    for module in (mcp_sse_transport, mcp_standard_sse):
+        monkeypatch.setattr(module, "get_current_user_for_mcp_sse", authenticate)
+    monkeypatch.setattr(unified_auth, "get_user_from_jwt_token", get_user_from_jwt_token)
+    monkeypatch.setattr(ServerRepository, "get_enabled_server", staticmethod(get_enabled_server))
+    monkeypatch.setattr(ServerRepository, "list_enabled_servers", staticmethod(list_enabled_servers))
+    monkeypatch.setattr(ServerRepository, "get_project", staticmethod(get_project))
+    monkeypatch.setattr(
+        ServerStatusService, "update_server_status_by_name", staticmethod(update_server_status_by_name)
+    )
+    return project_id, server
+
+
+def _request(path: str) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "path": path,
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+    })
+
+
+def _server_route(endpoint, **params):
+    """개별 서버 라우트 - 엔드포인트가 get_db 세션으로 직접 인증"""
+    async def call(project_id, server_name, request, db):
+        return await endpoint(project_id, server_name, request, db=db, **params)
+    return call
+
+
+def _unified_route(endpoint, **params):
+    """통합 라우트 - FastAPI처럼 get_db 세션을 쓰는 인증 의존성을 먼저 실행"""
+    async def call(project_id, server_name, request, db):
+        current_user = await unified_auth.get_current_user_for_unified_mcp(request, project_id, db)
+        return await endpoint(request, project_id, current_user=current_user, **params)
+    return call
+
+
+async def _open_stream(call, project_id, server_name, path):
+    """FastAPI처럼 get_db 의존성을 응답이 끝날 때까지 유지하며 첫 이벤트까지 진행"""
+    db_dependency = database.get_db()
+    db = next(db_dependency)
+    response = await call(project_id, server_name, _request(path), db)
+    body = response.body_iterator
+    first_event = await body.__anext__()
+    return db_dependency, body, first_event
+
+
+@pytest.mark.parametrize("call, path, first_event_marker", [
+    (_server_route(mcp_sse_transport.mcp_sse_endpoint),
+     "/projects/{project_id}/servers/echo/transport/sse", "endpoint"),
+    (_server_route(mcp_standard_sse.mcp_standard_sse_endpoint),
+     "/projects/{project_id}/servers/echo/standard/sse", "endpoint"),
+    (_server_route(mcp_standard_sse.individual_streamable_http_endpoint, sessionId=None),
+     "/projects/{project_id}/servers/echo/mcp", "connection"),
+    (_unified_route(unified_routes.unified_mcp_endpoint, _legacy=False),
+     "/projects/{project_id}/unified/sse", "endpoint"),
+    (_unified_route(unified_routes.unified_streamable_http_endpoint, sessionId=None, _legacy=False),
+     "/projects/{project_id}/unified/mcp", "connection"),
+    (_unified_route(fast_routes.fast_streamable_http_endpoint, sessionId=None),
+     "/projects/{project_id}/unified/mcp/fast", "connection"),
+], ids=["sse", "standard_sse", "individual_streamable", "unified_sse", "unified_streamable", "fast_streamable"])
+async def test_idle_sse_streams_do_not_hold_pool_connections(
+    small_pool, project_server, call, path, first_event_marker
+):
+    project_id, server = project_server
+    before = database.get_pool_stats()["sync"]["checked_out"]
+
+    streams = await asyncio.gather(*(
+        _open_stream(call, project_id, server.name, path.format(project_id=project_id))
+        for _ in range(IDLE_STREAMS)
+    ))
+    try:
+        assert all(first_event_marker in str(first_event) for _, _, first_event in streams)
+        assert database.get_pool_stats()["sync"]["checked_out"] == before
+    finally:
+        for db_dependency, body, _ in streams:
+            await body.aclose()
+            db_dependency.close()
+
+    assert database.get_pool_stats()["sync"]["checked_out"] == before
@@ -0,0 +1,68 @@
+"""
+도구 카탈로그 캐시 회귀 테스트
+
+tools/list 중 한 서버가 실패하면 그 서버를 "도구 없는 서버"로 캐시하지 않고,
+다음 요청이 다시 조회하도록 카탈로그를 저장하지 않는지 확인합니다.
+"""
+
+import json
+import os
+import sys
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from mcp_orch.api.mcp.unified import routes as unified_routes  # noqa: E402
+from mcp_orch.services import mcp_session_manager as session_manager_module  # noqa: E402
+from mcp_orch.services.mcp_session_manager import McpSessionManager, ToolExecutionError  # noqa: E402
+from mcp_orch.services.server_repository import ServerRepository, ServerSnapshot  # noqa: E402
+from mcp_orch.services.tool_catalog_cache import ToolCatalogCache  # noqa: E402
+
+
+@pytest.fixture
+def project_servers(monkeypatch):
+    """healthy 서버는 도구 하나를 반환하고, broken 서버는 세션 생성에서 실패"""
+    project_id = uuid.uuid4()
+    servers = [
+        ServerSnapshot(id=uuid.uuid4(), project_id=project_id, name="healthy", command="echo"),
+        ServerSnapshot(id=uuid.uuid4(), project_id=project_id, name="broken", command="echo"),
+    ]
+
+    async def list_enabled_servers(project_id):
+        return servers
+
+    async def get_or_create_session(server_id, server_config):
+        if server_id.endswith(".broken"):
+            raise ToolExecutionError("Initialization timeout", "INIT_TIMEOUT")
+        return SimpleNamespace(tools_cache=[{"name": "echo", "description": "Echo", "schema": {}}])
+
+    async def initialize_session(session):
+        return None
+
+    async def resolve_server_id(server_id):
+        return None, None  # 필터링 없이 세션 캐시 그대로 반환
+
+    manager = McpSessionManager()
+    monkeypatch.setattr(manager, "get_or_create_session", get_or_create_session)
+    monkeypatch.setattr(manager, "initialize_session", initialize_session)
+    monkeypatch.setattr(manager, "_resolve_server_id", resolve_server_id)
+    monkeypatch.setattr(session_manager_module, "_session_manager", manager)
+    monkeypatch.setattr(ServerRepository, "list_enabled_servers", staticmethod(list_enabled_servers))
+    return project_id, servers
+
+
+async def test_failed_server_tools_list_is_not_cached(project_servers, monkeypatch):
+    project_id, servers = project_servers
+    cache = ToolCatalogCache(ttl_seconds=300)
+    monkeypatch.setattr(unified_routes, "tool_catalog_cache", cache)
+
+    response = await unified_routes.handle_tools_list_request(
+        {"jsonrpc": "2.0", "id": 1, "method": "tools/list"}, project_id
+    )
+
+    tools = json.loads(response.body)["result"]["tools"]
+    assert [tool["name"] for tool in tools] == ["healthy__echo"]
+    assert cache.get(project_id, "http", cache.servers_signature(servers)) is None